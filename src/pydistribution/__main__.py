@@ -0,0 +1,9 @@
+"""
+Run the command line interface with ``python -m pydistribution``
+"""
+
+import sys
+
+from pydistribution.cli import main
+
+sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+Generate the arrival times of Poisson processes
+"""
+
+import numbers
+from bisect import bisect_right
+from itertools import count
+
+from pydistribution.distributions import (
+    DEFAULT_PRNG,
+    np,
+    poisson,
+    prn_block_handler,
+    to_array,
+)
+
+
+def _sorted_prns(size, prng):
+    """
+    Draw prn's and sort them
+
+    :param size: number of prn's
+    :type size: int
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :return: sorted prn's
+    :rtype: numpy.ndarray or array.array
+    """
+    u = prn_block_handler(u=None, size=size, prng=prng)
+    if np is not None:
+        return np.sort(u)
+    return to_array(sorted(u))
+
+
+def _homogeneous(rate, start, end, prng):
+    """
+    Generate the arrivals of a homogeneous Poisson process in [start, end)
+
+    Given the number of arrivals, they are uniformly distributed, so the
+    arrivals are a poisson count of sorted uniforms.
+
+    :param rate: arrivals per unit of time
+    :type rate: int or float
+    :param start: start of the window
+    :type start: float
+    :param end: end of the window
+    :type end: float
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :return: arrival times, sorted
+    :rtype: numpy.ndarray or array.array
+    """
+    size = poisson(rate * (end - start), prng=prng) if rate else 0
+    u = _sorted_prns(size, prng)
+    if np is not None:
+        return start + u * (end - start)
+    return to_array(start + u_i * (end - start) for u_i in u)
+
+
+def _piecewise(rates, breakpoints, start, end, prng):
+    """
+    Generate the arrivals of a Poisson process with a piecewise-constant rate
+    in [start, end)
+
+    The arrivals of a unit rate process are mapped through the inverse of
+    the cumulative rate, which is piecewise linear.
+
+    :param rates: rate of each piece
+    :type rates: sequence of ints or floats
+    :param breakpoints: times at which the rate changes, one fewer than rates
+    :type breakpoints: sequence of ints or floats
+    :param start: start of the window
+    :type start: float
+    :param end: end of the window
+    :type end: float
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :return: arrival times, sorted
+    :rtype: numpy.ndarray or array.array
+    """
+    first = bisect_right(breakpoints, start)
+    last = bisect_right(breakpoints, end)
+    knots = [start] + list(breakpoints[first:last]) + [end]
+    cumulative = [0.0]
+    for i, piece_rate in enumerate(rates[first : last + 1]):
+        cumulative.append(
+            cumulative[-1] + piece_rate * (knots[i + 1] - knots[i])
+        )
+    total = cumulative[-1]
+    size = poisson(total, prng=prng) if total else 0
+    u = _sorted_prns(size, prng)
+    if np is not None:
+        return np.interp(u * total, cumulative, knots)
+    arrivals = []
+    for u_i in u:
+        s = u_i * total
+        i = min(bisect_right(cumulative, s), len(knots) - 1)
+        piece_rate = rates[first + i - 1]
+        arrivals.append(knots[i - 1] + (s - cumulative[i - 1]) / piece_rate)
+    return to_array(arrivals)
+
+
+def _thinned(rate, max_rate, start, end, prng):
+    """
+    Generate the arrivals of a Poisson process with a time-varying rate in
+    [start, end) by thinning
+
+    Arrivals of a homogeneous process at max_rate are kept with probability
+    rate(t) / max_rate.
+
+    :param rate: rate at time t
+    :type rate: function
+    :param max_rate: bound on the rate in [start, end)
+    :type max_rate: int or float
+    :param start: start of the window
+    :type start: float
+    :param end: end of the window
+    :type end: float
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when the rate is more than max_rate
+    :return: arrival times, sorted
+    :rtype: numpy.ndarray or array.array
+    """
+    candidates = _homogeneous(max_rate, start, end, prng)
+    rates = to_array(rate(t) for t in candidates)
+    u = prn_block_handler(u=None, size=len(candidates), prng=prng)
+    if np is not None:
+        if len(rates) and rates.max() > max_rate:
+            raise ValueError("rate must not be more than max_rate")
+        return candidates[u * max_rate < rates]
+    if any(rate_i > max_rate for rate_i in rates):
+        raise ValueError("rate must not be more than max_rate")
+    return to_array(
+        t
+        for t, rate_i, u_i in zip(candidates, rates, u)
+        if u_i * max_rate < rate_i
+    )
+
+
+def _window_sampler(rate, breakpoints, max_rate):
+    """
+    Check the rate and get the function that generates the arrivals of a
+    window
+
+    :param rate: constant rate, rates of the pieces or rate function
+    :type rate: int, float, sequence or function
+    :param breakpoints: times at which a piecewise-constant rate changes
+    :type breakpoints: sequence of ints or floats or None
+    :param max_rate: bound on a rate function
+    :type max_rate: int or float or None
+    :raises ValueError: occurs when the rate is negative, breakpoints don't
+    match the rates or aren't sorted, or a rate function has no max_rate
+    :return: function of start, end and prng that returns the arrivals
+    :rtype: function
+    """
+    if callable(rate):
+        if max_rate is None or max_rate <= 0:
+            raise ValueError("a rate function needs a max_rate greater than 0")
+        return lambda start, end, prng: _thinned(
+            rate, max_rate, start, end, prng
+        )
+    if isinstance(rate, numbers.Real):
+        if rate < 0:
+            raise ValueError("rate must be at least 0")
+        return lambda start, end, prng: _homogeneous(rate, start, end, prng)
+    rates = list(rate)
+    breakpoints = list(breakpoints or ())
+    if len(breakpoints) != len(rates) - 1:
+        raise ValueError("there must be one fewer breakpoint than rates")
+    if any(a > b for a, b in zip(breakpoints, breakpoints[1:])):
+        raise ValueError("breakpoints must be sorted")
+    if any(rate_i < 0 for rate_i in rates):
+        raise ValueError("rates must be at least 0")
+    return lambda start, end, prng: _piecewise(
+        rates, breakpoints, start, end, prng
+    )
+
+
+def poisson_arrivals(
+    rate,
+    horizon,
+    start=0,
+    breakpoints=None,
+    max_rate=None,
+    prng=DEFAULT_PRNG,
+):
+    """
+    Generate the arrival times of a Poisson process in [start, horizon)
+
+    The rate can be
+
+    - a number: a homogeneous process, generated as a poisson number of
+      sorted uniform arrival times
+    - a sequence of rates with the breakpoints between them: a process whose
+      rate is rates[i] from breakpoints[i - 1] to breakpoints[i], generated
+      by inverting its cumulative rate
+    - a function of time: a process generated by thinning a homogeneous
+      process at max_rate
+
+    :param rate: arrivals per unit of time
+    :type rate: int, float, sequence of ints or floats or function
+    :param horizon: end of the time interval
+    :type horizon: int or float
+    :param start: start of the time interval, defaults to 0
+    :type start: int or float, optional
+    :param breakpoints: times at which a piecewise-constant rate changes, one
+    fewer than the rates, defaults to None
+    :type breakpoints: sequence of ints or floats, optional
+    :param max_rate: bound on a rate function over the time interval,
+    defaults to None
+    :type max_rate: int or float, optional
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when horizon is before start, a rate is
+    negative, the breakpoints don't match the rates, a rate function has no
+    max_rate or is more than max_rate
+    :return: arrival times, sorted
+    :rtype: numpy.ndarray or array.array
+    """
+    if horizon < start:
+        raise ValueError("horizon must not be before start")
+    window = _window_sampler(rate, breakpoints, max_rate)
+    return window(start, horizon, prng)
+
+
+def stream_arrivals(
+    rate,
+    window,
+    horizon=None,
+    start=0,
+    breakpoints=None,
+    max_rate=None,
+    prng=DEFAULT_PRNG,
+):
+    """
+    Generate the arrival times of a Poisson process one time window at a time
+
+    Memory use depends on the arrivals in a window rather than over the whole
+    horizon, which can be unbounded. See poisson_arrivals for the kinds of
+    rate.
+
+    :param rate: arrivals per unit of time
+    :type rate: int, float, sequence of ints or floats or function
+    :param window: length of each time window
+    :type window: int or float
+    :param horizon: end of the time interval, defaults to None, i.e. no end
+    :type horizon: int or float, optional
+    :param start: start of the time interval, defaults to 0
+    :type start: int or float, optional
+    :param breakpoints: times at which a piecewise-constant rate changes, one
+    fewer than the rates, defaults to None
+    :type breakpoints: sequence of ints or floats, optional
+    :param max_rate: bound on a rate function, defaults to None
+    :type max_rate: int or float, optional
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when window is not greater than 0, or for the
+    reasons poisson_arrivals raises
+    :yield: sorted arrival times of each window
+    :rtype: iter
+    """
+    if window <= 0:
+        raise ValueError("window must be greater than 0")
+    if horizon is not None and horizon < start:
+        raise ValueError("horizon must not be before start")
+    window_sampler = _window_sampler(rate, breakpoints, max_rate)
+    for i in count():
+        window_start = start + i * window
+        if horizon is not None and window_start >= horizon:
+            return
+        window_end = start + (i + 1) * window
+        if horizon is not None:
+            window_end = min(window_end, horizon)
+        yield window_sampler(window_start, window_end, prng)
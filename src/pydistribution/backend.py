@@ -0,0 +1,208 @@
+"""
+Choose the backend that generates arrays of random variates
+
+Every function that generates arrays of random variates has two paths: one
+vectorized with numpy, and one in pure python that builds ``array.array``'s
+with the math module. The backend chooses between them:
+
+- "numpy": the vectorized path, the default when numpy is installed
+- "array": the pure python path, the default when it isn't
+
+The backend can be set with the PYDISTRIBUTION_BACKEND environment variable
+before pydistribution is imported, with set_backend, or for a with block with
+use_backend. numpy is only imported the first time it is used, so importing
+pydistribution stays cheap for short-lived jobs that never generate arrays.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+from contextlib import contextmanager
+
+# environment variable that chooses the backend when pydistribution is
+# imported
+BACKEND_VARIABLE = "PYDISTRIBUTION_BACKEND"
+# module that each backend computes with, by name, None for pure python
+BACKENDS = {"array": None, "numpy": "numpy"}
+# name of the backend in use, set on first use
+_current = [None]
+
+
+class _LazyModule:
+    """
+    Stand-in for a backend module that imports it the first time one of its
+    attributes is used, and then puts the module in its place
+
+    :param name: name of the module
+    :type name: str
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __getattr__(self, attribute):
+        module = importlib.import_module(self.name)
+        if _current[0] is not None and BACKENDS[_current[0]] == self.name:
+            _install(module)
+        return getattr(module, attribute)
+
+    def __repr__(self):
+        return f"<lazily imported module {self.name!r}>"
+
+
+def _install(module):
+    """
+    Point every loaded pydistribution module at a backend module
+
+    :param module: backend module, its stand-in, or None for pure python
+    :type module: module, _LazyModule or None
+    """
+    for name, loaded in list(sys.modules.items()):
+        in_package = name.startswith("pydistribution.")
+        if in_package and "np" in vars(loaded):
+            loaded.np = module
+
+
+def _module(name):
+    """
+    Get the module of a backend, without importing it if it isn't yet
+
+    :param name: name of the backend
+    :type name: str
+    :raises ValueError: occurs when the backend isn't registered or its
+    module isn't installed
+    :return: backend module, its stand-in, or None for pure python
+    :rtype: module, _LazyModule or None
+    """
+    if name not in BACKENDS:
+        raise ValueError(
+            f"unknown backend {name!r}, the backends are "
+            f"{', '.join(sorted(BACKENDS))}"
+        )
+    module_name = BACKENDS[name]
+    if module_name is None:
+        return None
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    if importlib.util.find_spec(module_name) is None:
+        raise ValueError(f"backend {name!r} needs {module_name} installed")
+    return _LazyModule(module_name)
+
+
+def _default():
+    """
+    Get the backend used when none has been set
+
+    :return: name of the backend
+    :rtype: str
+    """
+    name = os.environ.get(BACKEND_VARIABLE)
+    if name:
+        return name
+    return "numpy" if importlib.util.find_spec("numpy") else "array"
+
+
+def module():
+    """
+    Get the module of the backend in use, choosing the default backend if
+    none has been set
+
+    :raises ValueError: occurs when PYDISTRIBUTION_BACKEND names an unknown
+    backend or one whose module isn't installed
+    :return: backend module, a stand-in that imports it on first use, or
+    None for pure python
+    :rtype: module, _LazyModule or None
+    """
+    if _current[0] is None:
+        name = _default()
+        backend_module = _module(name)
+        _current[0] = name
+        return backend_module
+    return _module(_current[0])
+
+
+def register(name, module_name):
+    """
+    Register a backend
+
+    The module must provide the parts of numpy's API that pydistribution
+    uses.
+
+    :param name: name of the backend
+    :type name: str
+    :param module_name: name of the module it computes with, None for pure
+    python
+    :type module_name: str or None
+    """
+    BACKENDS[name] = module_name
+
+
+def available():
+    """
+    Get the backends whose modules are installed, without importing them
+
+    :return: names of the backends
+    :rtype: list of str
+    """
+    return [
+        name
+        for name, module_name in BACKENDS.items()
+        if module_name is None or importlib.util.find_spec(module_name)
+    ]
+
+
+def get_backend():
+    """
+    Get the name of the backend in use
+
+    :return: name of the backend
+    :rtype: str
+    """
+    if _current[0] is None:
+        module()
+    return _current[0]
+
+
+def set_backend(name):
+    """
+    Switch to a backend
+
+    The caches of frozen distributions, alias tables and covariance factors
+    are cleared, since they may hold arrays of the old backend. Frozen
+    distributions and tables created before the switch should be created
+    again. Switching is not thread-safe.
+
+    :param name: name of the backend, e.g. "numpy" or "array"
+    :type name: str
+    :raises ValueError: occurs when the backend isn't registered or its
+    module isn't installed
+    """
+    backend_module = _module(name)
+    _current[0] = name
+    _install(backend_module)
+    distributions = sys.modules.get("pydistribution.distributions")
+    if distributions is not None:
+        distributions._clear_caches()
+
+
+@contextmanager
+def use_backend(name):
+    """
+    Use a backend inside a with block
+
+    :param name: name of the backend, e.g. "numpy" or "array"
+    :type name: str
+    :raises ValueError: occurs when the backend isn't registered or its
+    module isn't installed
+    :yield: name of the backend
+    :rtype: str
+    """
+    previous = get_backend()
+    set_backend(name)
+    try:
+        yield name
+    finally:
+        set_backend(previous)
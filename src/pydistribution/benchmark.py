@@ -0,0 +1,376 @@
+"""
+Benchmark the distribution functions and compare benchmark results
+"""
+
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+import pydistribution
+from pydistribution import backend, distributions
+from pydistribution.distributions import np
+
+# parameters of every distribution function in its small, medium and large
+# regimes, chosen to cross the points where the methods change
+CASES = {
+    "weibull": {
+        "small": {"lam": 1, "b": 0.5},
+        "medium": {"lam": 1, "b": 2},
+        "large": {"lam": 1, "b": 50},
+    },
+    "exponential": {"medium": {"lam": 1}},
+    "laplace": {"medium": {"mu": 0, "b": 1}},
+    "triangular": {"medium": {"minimum": 0, "mode": 1, "maximum": 2}},
+    "bernoulli": {"medium": {"p": 0.5}},
+    "geometric": {
+        "small": {"p": 0.9},
+        "medium": {"p": 0.5},
+        "large": {"p": 0.001},
+    },
+    "poisson": {
+        "small": {"lam": 1},
+        "medium": {"lam": 15},
+        "large": {"lam": 1000},
+    },
+    "binomial": {
+        "small": {"n": 10, "p": 0.3},
+        "medium": {"n": 100, "p": 0.3},
+        "large": {"n": 100000, "p": 0.3},
+    },
+    "gamma": {
+        "small": {"shape": 0.5},
+        "medium": {"shape": 2},
+        "large": {"shape": 1000},
+    },
+    "erlang": {
+        "small": {"lam": 1, "n": 1},
+        "medium": {"lam": 1, "n": 20},
+        "large": {"lam": 1, "n": 1000},
+    },
+    "negative_binomial": {
+        "small": {"n": 1, "p": 0.5},
+        "medium": {"n": 20, "p": 0.5},
+        "large": {"n": 1000, "p": 0.5},
+    },
+    "chi_square": {
+        "small": {"n": 1},
+        "medium": {"n": 30},
+        "large": {"n": 1000},
+    },
+    "t": {"small": {"n": 1}, "medium": {"n": 30}, "large": {"n": 1000}},
+    "cauchy": {"medium": {}},
+    "F": {
+        "small": {"n": 2, "m": 3},
+        "medium": {"n": 10, "m": 20},
+        "large": {"n": 1000, "m": 1000},
+    },
+    "standard_normal_crude": {"medium": {}},
+    "standard_normal": {
+        "ziggurat": {"method": "ziggurat"},
+        "polar": {"method": "polar"},
+        "polar_cache": {"method": "polar", "cache": True},
+    },
+    "normal": {"medium": {"mu": 0, "sigma": 1}},
+    "discrete": {
+        "small": {"weights": [1] * 4},
+        "medium": {"weights": list(range(1, 65))},
+        "large": {"weights": list(range(1, 4097))},
+    },
+    "truncated_weibull": {
+        "wide": {"lam": 1, "b": 2, "lower": 0, "upper": 3},
+        "tail": {"lam": 1, "b": 2, "lower": 5, "upper": 6},
+    },
+    "truncated_exponential": {
+        "wide": {"lam": 1, "lower": 0, "upper": 3},
+        "tail": {"lam": 1, "lower": 50},
+    },
+    "truncated_triangular": {
+        "medium": {
+            "minimum": 0,
+            "mode": 1,
+            "maximum": 2,
+            "lower": 0.5,
+            "upper": 1.5,
+        },
+    },
+    "truncated_normal": {
+        "wide": {"mu": 0, "sigma": 1, "lower": -2, "upper": 2},
+        "tail": {"mu": 0, "sigma": 1, "lower": 8, "upper": 9},
+    },
+    # timed per vector, with covariances 0.5 ** |i - j|
+    "multivariate_normal": {
+        "small": {
+            "mean": [0.0] * 3,
+            "cov": [[0.5 ** abs(i - j) for j in range(3)] for i in range(3)],
+        },
+        "large": {
+            "mean": [0.0] * 100,
+            "cov": [
+                [0.5 ** abs(i - j) for j in range(100)] for i in range(100)
+            ],
+        },
+    },
+}
+# number of variates per timing in each mode
+SCALAR_SIZE = 10000
+BATCH_SIZE = 100000
+# ratio of new to old time above which compare reports a regression
+REGRESSION_THRESHOLD = 1.25
+# code run by a new interpreter to time importing pydistribution and
+# generating its first array of variates, which imports the backend
+_STARTUP_SCRIPT = """
+import time
+start = time.perf_counter()
+from pydistribution import distributions
+imported = time.perf_counter()
+distributions.exponential(1, size=1)
+print(imported - start, time.perf_counter() - imported)
+"""
+
+
+def _prngs(seed):
+    """
+    Get the prng's to benchmark
+
+    :param seed: seed of the prng's
+    :type seed: int
+    :return: prng's by name
+    :rtype: dict
+    """
+    prngs = {"random": random.Random(seed).random}
+    if np is not None:
+        prngs["numpy"] = np.random.default_rng(seed).random
+    return prngs
+
+
+def _time(function, repeat):
+    """
+    Get the fastest of several timings of a function
+
+    :param function: function to time
+    :type function: function
+    :param repeat: number of timings
+    :type repeat: int
+    :return: fastest time, in seconds
+    :rtype: float
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(
+    names=None,
+    scalar_size=SCALAR_SIZE,
+    batch_size=BATCH_SIZE,
+    repeat=3,
+    seed=0,
+):
+    """
+    Benchmark the distribution functions
+
+    Every regime of every distribution in CASES is timed one variate at a
+    time ("scalar" mode) and with size ("batch" mode), with random.random and,
+    if installed, numpy's default_rng as the prng.
+
+    :param names: names of the distribution functions to benchmark, defaults
+    to None, i.e. all of them
+    :type names: list of str, optional
+    :param scalar_size: variates per timing in scalar mode, defaults to
+    SCALAR_SIZE
+    :type scalar_size: int, optional
+    :param batch_size: variates per timing in batch mode, defaults to
+    BATCH_SIZE
+    :type batch_size: int, optional
+    :param repeat: number of timings, the fastest is kept, defaults to 3
+    :type repeat: int, optional
+    :param seed: seed of the prng's, defaults to 0
+    :type seed: int, optional
+    :raises ValueError: occurs when a name is not in CASES
+    :return: results, in the format written by save
+    :rtype: dict
+    """
+    names = list(CASES) if names is None else names
+    unknown = set(names) - set(CASES)
+    if unknown:
+        raise ValueError(f"no benchmark for {', '.join(sorted(unknown))}")
+    results = []
+    for name in names:
+        function = getattr(distributions, name)
+        for regime, params in CASES[name].items():
+            for prng_name, prng in _prngs(seed).items():
+                scalar = _time(
+                    lambda: [
+                        function(**params, prng=prng)
+                        for _ in range(scalar_size)
+                    ],
+                    repeat,
+                )
+                batch = _time(
+                    lambda: function(**params, prng=prng, size=batch_size),
+                    repeat,
+                )
+                for mode, seconds, size in (
+                    ("scalar", scalar, scalar_size),
+                    ("batch", batch, batch_size),
+                ):
+                    results.append(
+                        {
+                            "distribution": name,
+                            "regime": regime,
+                            "params": params,
+                            "mode": mode,
+                            "prng": prng_name,
+                            "size": size,
+                            "ns_per_variate": seconds / size * 1e9,
+                        }
+                    )
+    return {
+        "python": platform.python_version(),
+        "numpy": None if np is None else np.__version__,
+        "machine": platform.platform(),
+        "results": results,
+    }
+
+
+def startup(backends=None, repeat=5):
+    """
+    Time importing pydistribution in a new interpreter with each backend
+
+    The import and the first array of variates, which imports the backend's
+    module, are timed separately, so the results show what a short-lived job
+    pays for pydistribution and what it pays for the backend.
+
+    :param backends: names of the backends to time, defaults to None, i.e.
+    every installed backend
+    :type backends: list of str, optional
+    :param repeat: number of interpreters per backend, the fastest is kept,
+    defaults to 5
+    :type repeat: int, optional
+    :raises ValueError: occurs when a backend is not installed
+    :return: results, with the milliseconds to import and to generate the
+    first array with each backend
+    :rtype: dict
+    """
+    backends = backend.available() if backends is None else backends
+    unknown = set(backends) - set(backend.available())
+    if unknown:
+        raise ValueError(f"no installed backend {', '.join(sorted(unknown))}")
+    # the new interpreters import pydistribution from where this one did
+    path = os.path.dirname(os.path.dirname(pydistribution.__file__))
+    results = []
+    for name in backends:
+        env = dict(os.environ)
+        env[backend.BACKEND_VARIABLE] = name
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, (path, env.get("PYTHONPATH")))
+        )
+        timings = []
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, "-c", _STARTUP_SCRIPT],
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            timings.append([float(value) for value in output.split()])
+        results.append(
+            {
+                "backend": name,
+                "import_ms": min(t[0] for t in timings) * 1e3,
+                "first_array_ms": min(t[1] for t in timings) * 1e3,
+            }
+        )
+    return {
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "results": results,
+    }
+
+
+def benchmark_name(result):
+    """
+    Get the name that identifies a benchmark across results files
+
+    :param result: one benchmark result
+    :type result: dict
+    :return: distribution, regime, mode and prng, e.g.
+    "poisson/large/batch/numpy"
+    :rtype: str
+    """
+    return "/".join(
+        (
+            result["distribution"],
+            result["regime"],
+            result["mode"],
+            result["prng"],
+        )
+    )
+
+
+def compare(old, new, threshold=REGRESSION_THRESHOLD):
+    """
+    Compare two sets of benchmark results
+
+    :param old: results to compare against, e.g. of the last release
+    :type old: dict
+    :param new: results to check
+    :type new: dict
+    :param threshold: ratio of new to old time above which a benchmark
+    counts as a regression, defaults to REGRESSION_THRESHOLD
+    :type threshold: float, optional
+    :return: benchmarks in both sets, with the old and new time per variate,
+    their ratio and whether the ratio is above threshold
+    :rtype: list of dict
+    """
+    old_results = {benchmark_name(result): result for result in old["results"]}
+    comparison = []
+    for result in new["results"]:
+        old_result = old_results.get(benchmark_name(result))
+        if old_result is None:
+            continue
+        ratio = result["ns_per_variate"] / old_result["ns_per_variate"]
+        comparison.append(
+            {
+                "benchmark": benchmark_name(result),
+                "old_ns_per_variate": old_result["ns_per_variate"],
+                "new_ns_per_variate": result["ns_per_variate"],
+                "ratio": ratio,
+                "regression": ratio > threshold,
+            }
+        )
+    return comparison
+
+
+def save(results, path):
+    """
+    Write benchmark results to a JSON file
+
+    :param results: results returned by run
+    :type results: dict
+    :param path: path of the file
+    :type path: str or os.PathLike
+    """
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def load(path):
+    """
+    Read benchmark results from a JSON file
+
+    :param path: path of the file
+    :type path: str or os.PathLike
+    :return: results
+    :rtype: dict
+    """
+    with open(path) as file:
+        return json.load(file)
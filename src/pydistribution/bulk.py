@@ -0,0 +1,143 @@
+"""
+Write large numbers of random variates straight to disk
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+from pydistribution.distributions import DEFAULT_PRNG, np
+from pydistribution.parallel import DEFAULT_CHUNK
+from pydistribution.stream import stream
+
+# header of raw variate files: magic, numpy dtype string, number of variates,
+# padded to 32 bytes so the variates stay aligned
+RAW_MAGIC = b"PYDIST01"
+RAW_HEADER = struct.Struct("<8s4sQ12x")
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+# numpy dtype strings of the array typecodes the distributions return
+DTYPES = {"d": "f8", "q": "i8", "f8": "f8", "i8": "i8"}
+
+
+def _dtype(chunk):
+    """
+    Get the numpy dtype string of a chunk of variates
+
+    :param chunk: chunk of variates
+    :type chunk: numpy.ndarray or array.array
+    :return: numpy dtype string, e.g. "<f8"
+    :rtype: str
+    """
+    typecode = chunk.typecode if np is None else chunk.dtype.str[1:]
+    byteorder = "<" if sys.byteorder == "little" else ">"
+    return byteorder + DTYPES[typecode]
+
+
+def _npy_header(dtype, size):
+    """
+    Make the header of a version 1.0 .npy file holding a 1-d array
+
+    :param dtype: numpy dtype string
+    :type dtype: str
+    :param size: number of variates
+    :type size: int
+    :return: header
+    :rtype: bytes
+    """
+    header = (
+        f"{{'descr': '{dtype}', 'fortran_order': False, 'shape': ({size},), }}"
+    )
+    # the header ends in a newline and pads the data to 64 byte alignment
+    padding = -(len(NPY_MAGIC) + 2 + len(header) + 1) % 64
+    header = (header + " " * padding + "\n").encode("latin1")
+    return NPY_MAGIC + struct.pack("<H", len(header)) + header
+
+
+def sample_to_file(
+    dist,
+    path,
+    size,
+    params=None,
+    prng=DEFAULT_PRNG,
+    chunk=DEFAULT_CHUNK,
+    npy=False,
+):
+    """
+    Generate random variates into a memory-mapped file
+
+    The variates are generated in chunks and copied into the mapped file one
+    chunk at a time, so memory use does not grow with size. The file is raw
+    float64 or int64 variates after a 32 byte header (see RAW_HEADER), or a
+    .npy file that ``numpy.load`` can read.
+
+    :param dist: distribution class, e.g. Weibull, frozen distribution, e.g.
+    Weibull(1, 2), or distribution function, e.g. weibull
+    :type dist: type, Distribution or function
+    :param path: path of the file to write
+    :type path: str or os.PathLike
+    :param size: number of variates to generate
+    :type size: int
+    :param params: parameters of the distribution, e.g. {"lam": 1, "b": 2},
+    defaults to None, i.e. no parameters
+    :type params: dict, optional
+    :param prng: pseudo-random number generator function that generates
+    uniform(0,1) prn's, defaults to DEFAULT_PRNG
+    :type prng: builtin_function_or_method, optional
+    :param chunk: number of variates per chunk, defaults to DEFAULT_CHUNK
+    :type chunk: int, optional
+    :param npy: whether to write a .npy file instead of a raw file, defaults
+    to False
+    :type npy: bool, optional
+    :raises ValueError: occurs when size is negative
+    :return: numpy dtype string of the variates
+    :rtype: str
+    """
+    if size < 0:
+        raise ValueError("size must be at least 0")
+    chunks = stream(dist, params, chunk=chunk, prng=prng, size=size)
+    first = next(chunks, None)
+    dtype = "<f8" if first is None else _dtype(first)
+    if npy:
+        header = _npy_header(dtype, size)
+    else:
+        header = RAW_HEADER.pack(RAW_MAGIC, dtype.encode("ascii"), size)
+    with open(path, "wb+") as file:
+        file.write(header)
+        if first is None:
+            return dtype
+        file.truncate(len(header) + 8 * size)
+        with mmap.mmap(file.fileno(), 0) as mapped:
+            offset = len(header)
+            for variates in ([first], chunks):
+                for variates_chunk in variates:
+                    data = memoryview(variates_chunk).cast("B")
+                    mapped[offset : offset + len(data)] = data
+                    offset += len(data)
+    return dtype
+
+
+def read_raw(path):
+    """
+    Read a raw variate file written by sample_to_file
+
+    :param path: path of the file
+    :type path: str or os.PathLike
+    :raises ValueError: occurs when the file is not a raw variate file
+    :return: the variates, memory-mapped with numpy
+    :rtype: numpy.memmap or array.array
+    """
+    with open(path, "rb") as file:
+        magic, dtype, size = RAW_HEADER.unpack(file.read(RAW_HEADER.size))
+        if magic != RAW_MAGIC:
+            raise ValueError(f"{path} is not a raw variate file")
+        dtype = dtype.rstrip(b"\0").decode("ascii")
+        if np is not None:
+            return np.memmap(
+                file, dtype=dtype, mode="r", offset=RAW_HEADER.size, shape=size
+            )
+        variates = array("d" if dtype[1:] == "f8" else "q")
+        variates.fromfile(file, size)
+        if dtype[0] != ("<" if sys.byteorder == "little" else ">"):
+            variates.byteswap()
+        return variates
@@ -0,0 +1,280 @@
+"""
+Command line interface, e.g.
+
+    pydistribution sample weibull --lam 1 --b 2 -n 1e9 -o out.f64 --seed 42
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from pydistribution import benchmark, distributions
+from pydistribution.bulk import sample_to_file
+from pydistribution.parallel import DEFAULT_CHUNK
+from pydistribution.prng import SplitMix64
+
+# distribution functions that can be sampled from the command line
+DISTRIBUTIONS = (
+    "weibull",
+    "exponential",
+    "laplace",
+    "triangular",
+    "bernoulli",
+    "geometric",
+    "poisson",
+    "binomial",
+    "gamma",
+    "erlang",
+    "negative_binomial",
+    "chi_square",
+    "t",
+    "cauchy",
+    "F",
+    "standard_normal",
+    "normal",
+    "discrete",
+    "truncated_weibull",
+    "truncated_exponential",
+    "truncated_triangular",
+    "truncated_normal",
+)
+
+
+def _parse_value(value):
+    """
+    Convert a distribution parameter from the command line
+
+    :param value: parameter as typed, e.g. "2", "0.5" or "1,2,3"
+    :type value: str
+    :raises ValueError: occurs when the value is not a number or a comma
+    separated list of numbers
+    :return: the parameter
+    :rtype: int, float or list
+    """
+    if "," in value:
+        return [_parse_value(v) for v in value.split(",")]
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _parse_params(args):
+    """
+    Convert ``--name value`` pairs into distribution parameters
+
+    :param args: arguments left over after the known options are parsed
+    :type args: list of str
+    :raises ValueError: occurs when an argument is not part of a
+    ``--name value`` or ``--name=value`` pair
+    :return: parameters of the distribution
+    :rtype: dict
+    """
+    params = {}
+    args = iter(args)
+    for arg in args:
+        if not arg.startswith("--"):
+            raise ValueError(f"unexpected argument {arg}")
+        name, _, value = arg[2:].partition("=")
+        if not value:
+            value = next(args, None)
+            if value is None:
+                raise ValueError(f"missing value for --{name}")
+        params[name] = _parse_value(value)
+    return params
+
+
+def _parser():
+    """
+    Build the argument parser
+
+    :return: parser
+    :rtype: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="pydistribution", description=distributions.__doc__.strip()
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    sample = commands.add_parser(
+        "sample",
+        # parameters like --n and --m must not be read as abbreviations
+        allow_abbrev=False,
+        help="write random variates to a file",
+        description="Write random variates to a file. Parameters of the "
+        "distribution are given as --name value, e.g. --lam 1 --b 2",
+    )
+    sample.add_argument("distribution", choices=DISTRIBUTIONS)
+    sample.add_argument(
+        "-n",
+        "--size",
+        required=True,
+        type=lambda value: int(float(value)),
+        help="number of random variates, e.g. 1e9",
+    )
+    sample.add_argument("-o", "--output", required=True, help="output file")
+    sample.add_argument(
+        "--seed", type=int, help="seed of the SplitMix64 prng, random if unset"
+    )
+    sample.add_argument(
+        "--chunk",
+        type=int,
+        default=DEFAULT_CHUNK,
+        help="random variates generated per chunk",
+    )
+    sample.add_argument(
+        "--npy",
+        action="store_true",
+        help="write a .npy file, the default when output ends in .npy",
+    )
+    bench = commands.add_parser(
+        "benchmark",
+        help="benchmark the distribution functions",
+        description="Time every distribution function in each regime, one "
+        "variate at a time and in batches, with each prng",
+    )
+    bench.add_argument(
+        "distributions",
+        nargs="*",
+        help="distribution functions to benchmark, all if none are given",
+    )
+    bench.add_argument("-o", "--output", help="JSON file to write results to")
+    bench.add_argument(
+        "--repeat", type=int, default=3, help="timings per benchmark"
+    )
+    bench.add_argument(
+        "--quick",
+        action="store_true",
+        help="time 10 times fewer variates per benchmark",
+    )
+    bench.add_argument(
+        "--startup",
+        action="store_true",
+        help="time importing pydistribution with each backend instead",
+    )
+    compare = commands.add_parser(
+        "compare",
+        help="compare two benchmark results files",
+        description="Compare benchmark results and exit with status 1 if "
+        "any benchmark regressed",
+    )
+    compare.add_argument("old", help="JSON file of the results to compare to")
+    compare.add_argument("new", help="JSON file of the results to check")
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=benchmark.REGRESSION_THRESHOLD,
+        help="ratio of new to old time that counts as a regression",
+    )
+    return parser
+
+
+def _benchmark(args):
+    """
+    Run the benchmark command
+
+    :param args: parsed arguments
+    :type args: argparse.Namespace
+    :return: exit status
+    :rtype: int
+    """
+    if args.startup:
+        results = benchmark.startup(repeat=args.repeat)
+        for result in results["results"]:
+            print(
+                f"{result['backend']:<10} import {result['import_ms']:>8.1f} ms"
+                f"  first array {result['first_array_ms']:>8.1f} ms"
+            )
+        if args.output:
+            benchmark.save(results, args.output)
+        return 0
+    scale = 10 if args.quick else 1
+    results = benchmark.run(
+        args.distributions or None,
+        scalar_size=benchmark.SCALAR_SIZE // scale,
+        batch_size=benchmark.BATCH_SIZE // scale,
+        repeat=args.repeat,
+    )
+    for result in results["results"]:
+        name = benchmark.benchmark_name(result)
+        print(f"{name:<50} {result['ns_per_variate']:>12.1f} ns/variate")
+    if args.output:
+        benchmark.save(results, args.output)
+    return 0
+
+
+def _compare(args):
+    """
+    Run the compare command
+
+    :param args: parsed arguments
+    :type args: argparse.Namespace
+    :return: exit status, 1 if any benchmark regressed
+    :rtype: int
+    """
+    comparison = benchmark.compare(
+        benchmark.load(args.old), benchmark.load(args.new), args.threshold
+    )
+    for row in comparison:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['benchmark']:<50} {row['old_ns_per_variate']:>10.1f} -> "
+            f"{row['new_ns_per_variate']:>10.1f} ns/variate "
+            f"({row['ratio']:.2f}x){flag}"
+        )
+    return int(any(row["regression"] for row in comparison))
+
+
+def main(argv=None):
+    """
+    Run the command line interface
+
+    :param argv: command line arguments, defaults to None, i.e. sys.argv[1:]
+    :type argv: list of str, optional
+    :return: exit status
+    :rtype: int
+    """
+    parser = _parser()
+    args, extra = parser.parse_known_args(argv)
+    if args.command != "sample":
+        if extra:
+            parser.error(f"unrecognized arguments: {' '.join(extra)}")
+        if args.command == "compare":
+            return _compare(args)
+        try:
+            return _benchmark(args)
+        except ValueError as error:
+            parser.error(str(error))
+    try:
+        params = _parse_params(extra)
+    except ValueError as error:
+        parser.error(str(error))
+    seed = args.seed
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    start = time.perf_counter()
+    try:
+        dtype = sample_to_file(
+            getattr(distributions, args.distribution),
+            args.output,
+            args.size,
+            params,
+            prng=SplitMix64(seed),
+            chunk=args.chunk,
+            npy=args.npy or args.output.endswith(".npy"),
+        )
+    except (TypeError, ValueError) as error:
+        parser.error(str(error))
+    elapsed = time.perf_counter() - start
+    rate = args.size / elapsed if elapsed else float("inf")
+    print(
+        f"wrote {args.size} {dtype} random variates to {args.output} in "
+        f"{elapsed:.2f} s ({rate / 1e6:.1f} M variates/s, "
+        f"{rate * 8 / 1e6:.1f} MB/s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
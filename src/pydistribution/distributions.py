@@ -1,13 +1,119 @@
 """
 Generate random variates from different distributions
 """
+
 # pylint: disable=import-error disable the import error for random module
 import math
+import numbers
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
 from random import random  # noqa
 
-from more_itertools import repeatfunc
+from pydistribution import backend
+
+# numpy, or a stand-in that imports it on first use, with the numpy backend
+# and None with the pure python array backend, see pydistribution.backend
+np = backend.module()
 
 DEFAULT_PRNG = random
+# smallest lambda for which poisson uses transformed rejection over inversion
+POISSON_PTRS_MIN_LAM = 10
+# smallest n * min(p, 1 - p) for which binomial uses transformed rejection
+BINOMIAL_BTRS_MIN_MEAN = 10
+# number of layers, start of the tail and layer area of the normal ziggurat
+ZIGGURAT_LAYERS = 128
+ZIGGURAT_R = 3.442619855899
+ZIGGURAT_V = 9.91256303526217e-3
+# numerators and denominators of Wichura's AS241 approximation of the
+# standard normal quantile, highest power first: for |p - 0.5| <= 0.425, and
+# for the tails where sqrt(-log(min(p, 1 - p))) is up to 5 and beyond
+NORMAL_QUANTILE_CENTRAL = (
+    (
+        2.5090809287301226727e3,
+        3.3430575583588128105e4,
+        6.7265770927008700853e4,
+        4.5921953931549871457e4,
+        1.3731693765509461125e4,
+        1.9715909503065514427e3,
+        1.3314166789178437745e2,
+        3.3871328727963666080e0,
+    ),
+    (
+        5.2264952788528545610e3,
+        2.8729085735721942674e4,
+        3.9307895800092710610e4,
+        2.1213794301586595867e4,
+        5.3941960214247511077e3,
+        6.8718700749205790830e2,
+        4.2313330701600911252e1,
+        1.0,
+    ),
+)
+NORMAL_QUANTILE_TAIL = (
+    (
+        7.74545014278341407640e-4,
+        2.27238449892691845833e-2,
+        2.41780725177450611770e-1,
+        1.27045825245236838258e0,
+        3.64784832476320460504e0,
+        5.76949722146069140550e0,
+        4.63033784615654529590e0,
+        1.42343711074968357734e0,
+    ),
+    (
+        1.05075007164441684324e-9,
+        5.47593808499534494600e-4,
+        1.51986665636164571966e-2,
+        1.48103976427480074590e-1,
+        6.89767334985100004550e-1,
+        1.67638483018380384940e0,
+        2.05319162663775882187e0,
+        1.0,
+    ),
+)
+NORMAL_QUANTILE_FAR_TAIL = (
+    (
+        2.01033439929228813265e-7,
+        2.71155556874348757815e-5,
+        1.24266094738807843860e-3,
+        2.65321895265761230930e-2,
+        2.96560571828504891230e-1,
+        1.78482653991729133580e0,
+        5.46378491116411436990e0,
+        6.65790464350110377720e0,
+    ),
+    (
+        2.04426310338993978564e-15,
+        1.42151175831644588870e-7,
+        1.84631831751005468180e-5,
+        7.86869131145613259100e-4,
+        1.48753612908506148525e-2,
+        1.36929880922735805310e-1,
+        5.99832206555887937690e-1,
+        1.0,
+    ),
+)
+# numerator and denominator of the Abramowitz and Stegun 26.2.23
+# approximation of the standard normal quantile used by
+# standard_normal_crude, highest power first
+CRUDE_NORMAL_QUANTILE = (
+    (0.010328, 0.802853, 2.515517),
+    (0.001308, 0.189269, 1.432788, 1.0),
+)
+# smallest float above 0 and largest float below 1, which the truncated
+# samplers keep their mapped prn's between
+ABOVE_ZERO = 2.0**-1074
+BELOW_ONE = 1 - 2**-53
+# number of alias tables kept by discrete for reuse
+ALIAS_TABLE_CACHE_SIZE = 32
+# number of frozen distributions kept by the functions for reuse
+FROZEN_CACHE_SIZE = 128
+# number of covariance factors kept by multivariate_normal for reuse
+COVARIANCE_FACTOR_CACHE_SIZE = 32
+# called with the number of rejected attempts of the rejection methods while
+# sampling is instrumented, see pydistribution.instrument
+_rejection_hook = None
 
 
 def prn_handler(u, prng):
@@ -29,7 +135,245 @@ def prn_handler(u, prng):
     return u
 
 
-def weibull(lam, b, u=None, prng=DEFAULT_PRNG):
+def prn_block_handler(u, size, prng):
+    """
+    create a block of prn's if needed and check that they are between 0 and 1
+
+    Numpy generators (e.g. ``default_rng().random``) and objects with a
+    ``block(size)`` method are asked for the whole block at once, any other
+    prng is called once per value. Either way the values come out of the prng
+    in the same order as ``size`` scalar calls would draw them.
+
+    :param u: psuedo random numbers, expected to come from the uniform(0,1)
+    distribution. If None, ``size`` numbers are generated from the prng
+    :type u: sequence of floats
+    :param size: number of prn's in the block
+    :type size: int
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when any u is not between 0 and 1 or when the
+    number of supplied u's does not match size
+    :return: block of prn's
+    :rtype: numpy.ndarray or array.array
+    """
+    if u is None:
+        if np is not None and isinstance(
+            getattr(prng, "__self__", None),
+            (np.random.Generator, np.random.RandomState),
+        ):
+            u = prng(size)
+        elif hasattr(prng, "block"):
+            u = prng.block(size)
+        else:
+            u = [prng() for _ in range(size)]
+    if np is not None:
+        u = np.asarray(u, dtype=float)
+        in_range = u.size == 0 or (u.min() >= 0 and u.max() < 1)
+    else:
+        u = array("d", u)
+        in_range = all(0 <= ui < 1 for ui in u)
+    if len(u) != size:
+        raise ValueError("Number of U's must match size")
+    if not in_range:
+        raise ValueError("U must be between 0 and 1")
+    return u
+
+
+def to_array(values, typecode="d", out=None):
+    """
+    Collect variates into a contiguous array
+
+    :param values: variates to collect
+    :type values: iterable
+    :param typecode: array typecode, "d" for floats and "q" for ints, defaults
+    to "d"
+    :type typecode: str, optional
+    :param out: array to write the variates to, defaults to None, i.e. a new
+    array
+    :type out: numpy.ndarray or array.array, optional
+    :return: the variates as a numpy array if numpy is installed, otherwise as
+    an array.array
+    :rtype: numpy.ndarray or array.array
+    """
+    if np is not None:
+        values = np.fromiter(values, dtype=typecode)
+    else:
+        values = array(typecode, values)
+    if out is None:
+        return values
+    out[:] = values
+    return out
+
+
+class Distribution:
+    """
+    Base class for frozen distributions
+
+    A frozen distribution checks its parameters and computes everything that
+    only depends on them once, when it is created. Sampling from it then only
+    does the work that depends on the prn's. Use one when the same parameters
+    are sampled many times.
+
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    """
+
+    __slots__ = ("prng",)
+    # array typecode of the variates, "d" for floats and "q" for ints
+    typecode = "d"
+
+    def __init__(self, prng=DEFAULT_PRNG):
+        self.prng = prng
+
+    def sample(self):
+        """
+        Generate a random variate
+
+        :return: random variate
+        :rtype: float or int
+        """
+        raise NotImplementedError
+
+    def sample_n(self, size):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :return: random variates
+        :rtype: array of floats or ints
+        """
+        sample = self.sample
+        return to_array((sample() for _ in range(size)), self.typecode)
+
+    def __iter__(self):
+        """
+        Generate random variates for as long as they are asked for
+
+        :yield: random variates
+        :rtype: iter
+        """
+        sample = self.sample
+        while True:
+            yield sample()
+
+
+@lru_cache(maxsize=FROZEN_CACHE_SIZE, typed=True)
+def _cached_frozen(cls, *params):
+    """
+    Create a frozen distribution with the default prng, reusing recently
+    created ones
+
+    :param cls: frozen distribution class
+    :type cls: type
+    :return: frozen distribution
+    :rtype: Distribution
+    """
+    return cls(*params, prng=DEFAULT_PRNG)
+
+
+def _frozen(cls, prng, *params):
+    """
+    Get the frozen distribution behind a distribution function
+
+    Frozen distributions with the default prng are reused across calls with
+    the same parameters, so the functions only pay for checking the
+    parameters and computing their constants the first time. Parameters are
+    told apart by type as well, so 1, 1.0 and True get their own frozen
+    distributions. Other prngs, and parameters that can't be hashed, skip the
+    cache, so the cache never keeps a short-lived prng, or the prn's it holds,
+    alive.
+
+    :param cls: frozen distribution class
+    :type cls: type
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param params: parameters of the distribution
+    :type params: int or float
+    :return: frozen distribution
+    :rtype: Distribution
+    """
+    if prng is not DEFAULT_PRNG:
+        return cls(*params, prng=prng)
+    try:
+        return _cached_frozen(cls, *params)
+    except TypeError:
+        return cls(*params, prng=prng)
+
+
+def _clear_caches():
+    """
+    Forget the frozen distributions, tables and factors kept for reuse, which
+    may hold arrays of another backend
+    """
+    _cached_frozen.cache_clear()
+    _ziggurat_arrays.cache_clear()
+    _ALIAS_TABLES.clear()
+    _COVARIANCE_FACTORS.clear()
+
+
+class Weibull(Distribution):
+    """
+    Frozen Weibull Distribution, see weibull
+
+    :param lam: lambda parameter of the Weibull distribution
+    :type lam: int or float greater than 0
+    :param b: beta parameter of the Weibull distribution
+    :type b: int or float greater than 0
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when lam or b is not greater than 0
+    """
+
+    __slots__ = ("lam", "b", "_inv_lam", "_inv_b")
+
+    def __init__(self, lam, b, prng=DEFAULT_PRNG):
+        if lam <= 0 or b <= 0:
+            raise ValueError("lam and b must be greater than 0")
+        super().__init__(prng)
+        self.lam = lam
+        self.b = b
+        self._inv_lam = 1 / lam
+        self._inv_b = 1 / b
+
+    def sample(self, u=None):
+        """
+        Generate a random variate
+
+        :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+        :type u: float
+        :return: random variate
+        :rtype: float
+        """
+        u = prn_handler(u=u, prng=self.prng)
+        return (-math.log(u)) ** self._inv_b * self._inv_lam
+
+    def sample_n(self, size, u=None, out=None):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :param u: psuedo random numbers, expected to come from the uniform(0,1)
+        distribution
+        :type u: sequence of floats
+        :param out: array to write the variates to, defaults to None, i.e. a
+        new array
+        :type out: numpy.ndarray or array.array, optional
+        :return: random variates
+        :rtype: array of floats
+        """
+        u = prn_block_handler(u=u, size=size, prng=self.prng)
+        if np is None:
+            return to_array((self.sample(u_i) for u_i in u), out=out)
+        x = np.log(u, out=out)
+        np.negative(x, out=x)
+        np.power(x, self._inv_b, out=x)
+        x *= self._inv_lam
+        return x
+
+
+def weibull(lam, b, u=None, prng=DEFAULT_PRNG, size=None, out=None):
     """
     Generate a random variate from the Weibull Distribution
 
@@ -39,18 +383,55 @@ def weibull(lam, b, u=None, prng=DEFAULT_PRNG):
     :type lam: int
     :param b: beta parameter of the Weibull distribution
     :type b: int
-    :param u: psuedo random number, expected to come from the uniform(0,1) distribution
-    :type u: float
+    :param u: psuedo random number, expected to come from the uniform(0,1)
+    distribution. A sequence of size numbers when size is given
+    :type u: float or sequence of floats
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :param out: array to write the variates to when size is given, defaults
+    to None, i.e. a new array
+    :type out: numpy.ndarray or array.array, optional
     :return: Random Variate from the Weibull Distribution
-    :rtype: float
+    :rtype: float or array of floats
+    """
+    dist = _frozen(Weibull, prng, lam, b)
+    if size is not None:
+        return dist.sample_n(size, u=u, out=out)
+    return dist.sample(u=u)
+
+
+class Exponential(Weibull):
+    """
+    Frozen Exponential Distribution, see exponential
+
+    :param lam: lambda parameter of the exponential distribution
+    :type lam: int or float greater than 0
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when lam is not greater than 0
     """
-    u = prn_handler(u=u, prng=prng)
-    return (-1 / lam) * math.log(u) ** (1 / b)
+
+    __slots__ = ()
+
+    def __init__(self, lam, prng=DEFAULT_PRNG):
+        super().__init__(lam, 1, prng=prng)
+
+    def sample(self, u=None):
+        """
+        Generate a random variate
+
+        :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+        :type u: float
+        :return: random variate
+        :rtype: float
+        """
+        return -math.log(prn_handler(u=u, prng=self.prng)) * self._inv_lam
 
 
-def exponential(lam, u=None, prng=DEFAULT_PRNG):
+def exponential(lam, u=None, prng=DEFAULT_PRNG, size=None, out=None):
     """
     Generate a random variate from the Exponential Distribution
 
@@ -62,17 +443,80 @@ def exponential(lam, u=None, prng=DEFAULT_PRNG):
 
     :param lam: lambda parameter of the exponential distribution
     :type lam: int or float greater than 0
-    :param u: psuedo random number, expected to come from the uniform(0,1) distribution
-    :type u: float
+    :param u: psuedo random number, expected to come from the uniform(0,1)
+    distribution. A sequence of size numbers when size is given
+    :type u: float or sequence of floats
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :param out: array to write the variates to when size is given, defaults
+    to None, i.e. a new array
+    :type out: numpy.ndarray or array.array, optional
     :return: random variate from the Exponential Distribution
-    :rtype: float
+    :rtype: float or array of floats
+    """
+    dist = _frozen(Exponential, prng, lam)
+    if size is not None:
+        return dist.sample_n(size, u=u, out=out)
+    return dist.sample(u=u)
+
+
+class Laplace(Distribution):
+    """
+    Frozen Laplace Distribution, see laplace
+
+    :param mu: central location of the distribution
+    :type mu: int or float
+    :param b: denominator of the lambda parameter for the exponentials
+    :type b: int or float greater than 0
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when b is not greater than 0
     """
-    return weibull(u=u, lam=lam, b=1, prng=prng)
 
+    __slots__ = ("mu", "b")
 
-def laplace(mu, b, prng=DEFAULT_PRNG):
+    def __init__(self, mu, b, prng=DEFAULT_PRNG):
+        if b <= 0:
+            raise ValueError("b must be greater than 0")
+        super().__init__(prng)
+        self.mu = mu
+        self.b = b
+
+    def sample(self):
+        """
+        Generate a random variate
+
+        :return: random variate
+        :rtype: float
+        """
+        u1 = prn_handler(u=None, prng=self.prng)
+        u2 = prn_handler(u=None, prng=self.prng)
+        return self.mu + self.b * (math.log(u2) - math.log(u1))
+
+    def sample_n(self, size):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :return: random variates
+        :rtype: array of floats
+        """
+        # each variate consumes two prn's, in the same order as sample
+        u = prn_block_handler(u=None, size=2 * size, prng=self.prng)
+        if np is None:
+            return to_array(
+                self.mu + self.b * (math.log(u[i + 1]) - math.log(u[i]))
+                for i in range(0, len(u), 2)
+            )
+        log_u = np.log(u)
+        return self.mu + self.b * (log_u[1::2] - log_u[0::2])
+
+
+def laplace(mu, b, prng=DEFAULT_PRNG, size=None):
     """
     Generate a random variate from the Laplace Distribution
 
@@ -85,13 +529,100 @@ def laplace(mu, b, prng=DEFAULT_PRNG):
     :type b: int greater than 0
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
     :return: random variate from the Laplace Distribution
-    :rtype: float
+    :rtype: float or array of floats
+    """
+    dist = _frozen(Laplace, prng, mu, b)
+    if size is not None:
+        return dist.sample_n(size)
+    return dist.sample()
+
+
+class Triangular(Distribution):
+    """
+    Frozen Triangular Distribution, see triangular
+
+    :param minimum: minimum value, defaults to 0
+    :type minimum: int or float, optional
+    :param mode: mode, defaults to 1
+    :type mode: int or float, optional
+    :param maximum: maximum value, defaults to 2
+    :type maximum: int or float, optional
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when mode is not between minimum and maximum or
+    minimum is not less than maximum
     """
-    return mu + (exponential(1 / b, prng=prng) - exponential(1 / b, prng=prng))
 
+    __slots__ = ("minimum", "mode", "maximum", "_u_midpoint", "_left", "_right")
+
+    def __init__(self, minimum=0, mode=1, maximum=2, prng=DEFAULT_PRNG):
+        if not minimum <= mode <= maximum or minimum == maximum:
+            raise ValueError(
+                "mode must be between minimum and maximum and minimum must be "
+                "less than maximum"
+            )
+        super().__init__(prng)
+        self.minimum = minimum
+        self.mode = mode
+        self.maximum = maximum
+        self._u_midpoint = (mode - minimum) / (maximum - minimum)
+        self._left = (maximum - minimum) * (mode - minimum)
+        self._right = (maximum - minimum) * (maximum - mode)
+
+    def sample(self, u=None):
+        """
+        Generate a random variate
+
+        :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+        :type u: float
+        :return: random variate
+        :rtype: float
+        """
+        u = prn_handler(u=u, prng=self.prng)
+        if u < self._u_midpoint:
+            return self.minimum + math.sqrt(u * self._left)
+        return self.maximum - math.sqrt((1 - u) * self._right)
 
-def triangular(minimum=0, mode=1, maximum=2, u=None, prng=DEFAULT_PRNG):
+    def sample_n(self, size, u=None, out=None):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :param u: psuedo random numbers, expected to come from the uniform(0,1)
+        distribution
+        :type u: sequence of floats
+        :param out: array to write the variates to, defaults to None, i.e. a
+        new array
+        :type out: numpy.ndarray or array.array, optional
+        :return: random variates
+        :rtype: array of floats
+        """
+        u = prn_block_handler(u=u, size=size, prng=self.prng)
+        if np is None:
+            return to_array((self.sample(u_i) for u_i in u), out=out)
+        x = np.subtract(1, u, out=out)
+        x *= self._right
+        np.sqrt(x, out=x)
+        np.subtract(self.maximum, x, out=x)
+        left = u < self._u_midpoint
+        x[left] = self.minimum + np.sqrt(u[left] * self._left)
+        return x
+
+
+def triangular(
+    minimum=0,
+    mode=1,
+    maximum=2,
+    u=None,
+    prng=DEFAULT_PRNG,
+    size=None,
+    out=None,
+):
     """
     Generate a random variate from the Triangular Distribution
 
@@ -107,25 +638,83 @@ def triangular(minimum=0, mode=1, maximum=2, u=None, prng=DEFAULT_PRNG):
     :type mode: int, optional
     :param maximum: maximum value, defaults to 2
     :type maximum: int, optional
-    :param u: psuedo random number, expected to come from the uniform(0,1) distribution
-    :type u: float
+    :param u: psuedo random number, expected to come from the uniform(0,1)
+    distribution. A sequence of size numbers when size is given
+    :type u: float or sequence of floats
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :param out: array to write the variates to when size is given, defaults
+    to None, i.e. a new array
+    :type out: numpy.ndarray or array.array, optional
     :return: random variate from the Triangular Distribution
-    :rtype: float
+    :rtype: float or array of floats
     """
-    u = prn_handler(u=u, prng=prng)
-    u_midpoint = (mode - minimum) / (maximum - minimum)
-    if u < u_midpoint:
-        x = minimum + math.sqrt(u * (maximum - minimum) * (mode - minimum))
-    else:
-        x = maximum - math.sqrt(
-            (1 - u) * (maximum - minimum) * (maximum - mode)
-        )
-    return x
+    dist = _frozen(Triangular, prng, minimum, mode, maximum)
+    if size is not None:
+        return dist.sample_n(size, u=u, out=out)
+    return dist.sample(u=u)
+
+
+class Bernoulli(Distribution):
+    """
+    Frozen Bernoulli Distribution, see bernoulli
+
+    :param p: proability of a success
+    :type p: float
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when p is not between 0 and 1
+    """
+
+    __slots__ = ("p",)
+    typecode = "q"
 
+    def __init__(self, p, prng=DEFAULT_PRNG):
+        if not 0 <= p <= 1:
+            raise ValueError("p must be between 0 and 1")
+        super().__init__(prng)
+        self.p = p
 
-def bernoulli(p, u=None, prng=DEFAULT_PRNG):
+    def sample(self, u=None):
+        """
+        Generate a random variate
+
+        :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+        :type u: float
+        :return: 1 or 0
+        :rtype: int
+        """
+        if prn_handler(u=u, prng=self.prng) <= self.p:
+            return 1
+        return 0
+
+    def sample_n(self, size, u=None, out=None):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :param u: psuedo random numbers, expected to come from the uniform(0,1)
+        distribution
+        :type u: sequence of floats
+        :param out: array to write the variates to, defaults to None, i.e. a
+        new array
+        :type out: numpy.ndarray or array.array, optional
+        :return: random variates
+        :rtype: array of ints
+        """
+        u = prn_block_handler(u=u, size=size, prng=self.prng)
+        if np is None:
+            return to_array((self.sample(u_i) for u_i in u), "q", out)
+        if out is None:
+            out = np.empty(size, dtype=np.int64)
+        return np.less_equal(u, self.p, out=out)
+
+
+def bernoulli(p, u=None, prng=DEFAULT_PRNG, size=None, out=None):
     """
     Generate a random variate from the Bernoulli Distribution
 
@@ -134,22 +723,85 @@ def bernoulli(p, u=None, prng=DEFAULT_PRNG):
 
     :param p: proability of a success
     :type p: float
-    :param u: psuedo random number, expected to come from the uniform(0,1) distribution
-    :type u: float
+    :param u: psuedo random number, expected to come from the uniform(0,1)
+    distribution. A sequence of size numbers when size is given
+    :type u: float or sequence of floats
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :param out: array to write the variates to when size is given, defaults
+    to None, i.e. a new array
+    :type out: numpy.ndarray or array.array, optional
     :return: 1 or 0
-    :rtype: int
+    :rtype: int or array of ints
     """
-    u = prn_handler(u=u, prng=prng)
-    if u <= p:
-        x = 1
-    else:
-        x = 0
-    return x
+    dist = _frozen(Bernoulli, prng, p)
+    if size is not None:
+        return dist.sample_n(size, u=u, out=out)
+    return dist.sample(u=u)
+
+
+class Geometric(Distribution):
+    """
+    Frozen Geometric Distribution, see geometric
+
+    :param p: probability of a success
+    :type p: float
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when p is not strictly between 0 and 1
+    """
+
+    __slots__ = ("p", "_log_q")
+    typecode = "q"
+
+    def __init__(self, p, prng=DEFAULT_PRNG):
+        if not 0 < p < 1:
+            raise ValueError("p must be between 0 and 1")
+        super().__init__(prng)
+        self.p = p
+        self._log_q = math.log(1 - p)
+
+    def sample(self, u=None):
+        """
+        Generate a random variate
+
+        :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+        :type u: float
+        :return: random variate
+        :rtype: int
+        """
+        u = prn_handler(u=u, prng=self.prng)
+        return math.ceil(math.log(1 - u) / self._log_q)
+
+    def sample_n(self, size, u=None, out=None):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :param u: psuedo random numbers, expected to come from the uniform(0,1)
+        distribution
+        :type u: sequence of floats
+        :param out: array to write the variates to, defaults to None, i.e. a
+        new array
+        :type out: numpy.ndarray or array.array, optional
+        :return: random variates
+        :rtype: array of ints
+        """
+        u = prn_block_handler(u=u, size=size, prng=self.prng)
+        if np is None:
+            return to_array((self.sample(u_i) for u_i in u), "q", out)
+        x = np.log(1 - u)
+        x /= self._log_q
+        if out is None:
+            out = np.empty(size, dtype=np.int64)
+        return np.ceil(x, out=out, casting="unsafe")
 
 
-def geometric(p, u=None, prng=DEFAULT_PRNG):
+def geometric(p, u=None, prng=DEFAULT_PRNG, size=None, out=None):
     """
     Generate a random variate from the Geometric Distribution
 
@@ -158,308 +810,2475 @@ def geometric(p, u=None, prng=DEFAULT_PRNG):
 
     :param p: probability of a success
     :type p: float
-    :param u: psuedo random number, expected to come from the uniform(0,1) distribution
-    :type u: float
+    :param u: psuedo random number, expected to come from the uniform(0,1)
+    distribution. A sequence of size numbers when size is given
+    :type u: float or sequence of floats
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :param out: array to write the variates to when size is given, defaults
+    to None, i.e. a new array
+    :type out: numpy.ndarray or array.array, optional
     :return: random variate from the Geometric Distribution
-    :rtype: float
+    :rtype: float or array of ints
     """
-    u = prn_handler(u=u, prng=prng)
-    return math.ceil(math.log(1 - u) / math.log(1 - p))
+    dist = _frozen(Geometric, prng, p)
+    if size is not None:
+        return dist.sample_n(size, u=u, out=out)
+    return dist.sample(u=u)
 
 
-def poisson(lam, prng=DEFAULT_PRNG):
+def _poisson_inversion(lam, p0, u):
     """
-    Generate a random variate from the Poisson Distribution
+    Generate a poisson random variate by sequential search of the CDF
 
-    A poisson process relates to the number of events that occur in a given
-    time interval.
-
-    This implementation uses the acceptance rejection method to generate the
-    random variate.
+    The expected number of steps is lam, so this is only used for small lam.
 
     :param lam: lambda parameter
-    :type lam: int greater than 0
-    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
-    :type prng: builtin_function_or_method
+    :type lam: int or float
+    :param p0: probability of 0 events, exp(-lam)
+    :type p0: float
+    :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+    :type u: float
     :return: random variate from the Poisson Distribution
     :rtype: int
     """
-    if lam <= 20:
-        a = math.exp(-lam)
-        p = 1
-        x = -1
-        while p < a:
-            u = prn_handler(u=None, prng=prng)
-            p *= u
-            x += 1
-    else:
-        x = max(0, math.floor(lam + (math.sqrt(lam) * standard_normal()) + 0.5))
+    x = 0
+    p = p0
+    s = p
+    while u > s and p > 0:
+        x += 1
+        p *= lam / x
+        s += p
     return x
 
 
-def binomial(n, p, prng=DEFAULT_PRNG):
+def _poisson_ptrs_constants(lam):
     """
-    Generate a random variate from the Binomial Distribution
+    Get the constants of the transformed rejection method for a given lam
 
-    The binomial distribution is the number of successes in n iid bernoulli
-    trials.
+    :param lam: lambda parameter
+    :type lam: float or numpy.ndarray
+    :return: log(lam), b, a, log(1 / alpha) and v_r
+    :rtype: tuple
+    """
+    log = math.log if isinstance(lam, numbers.Real) else np.log
+    b = 0.931 + 2.53 * lam**0.5
+    a = -0.059 + 0.02483 * b
+    log_inv_alpha = log(1.1239 + 1.1328 / (b - 3.4))
+    v_r = 0.9277 - 3.6224 / (b - 2)
+    return log(lam), b, a, log_inv_alpha, v_r
 
-    This implementation uses the convolutional method to sum n iid bernoulli
-    random variates.
 
-    :param n: number of bernoulli trials
-    :type n: int
-    :param p: probability of a success
-    :type p: float
+def _poisson_ptrs(lam, constants, prng):
+    """
+    Generate a poisson random variate with transformed rejection (PTRS)
+
+    Hörmann's transformed rejection with squeeze. Exact, uses two prn's per
+    attempt and accepts in about 90% of attempts whatever the size of lam.
+
+    :param lam: lambda parameter, at least 10
+    :type lam: int or float
+    :param constants: result of _poisson_ptrs_constants(lam)
+    :type constants: tuple
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
-    :return: random variate from the Binomial Distribution
+    :return: random variate from the Poisson Distribution
     :rtype: int
     """
+    log_lam, b, a, log_inv_alpha, v_r = constants
+    while True:
+        u = prn_handler(u=None, prng=prng) - 0.5
+        v = prn_handler(u=None, prng=prng)
+        us = 0.5 - abs(u)
+        if us == 0:
+            continue
+        k = math.floor((2 * a / us + b) * u + lam + 0.43)
+        if us >= 0.07 and v <= v_r:
+            return k
+        if k >= 0 and (us >= 0.013 or v <= us):
+            if v == 0 or math.log(v) + log_inv_alpha - math.log(
+                a / (us * us) + b
+            ) <= -lam + k * log_lam - math.lgamma(k + 1):
+                return k
+        if _rejection_hook is not None:
+            _rejection_hook(1)
+
+
+def _poisson_block(lam, prng):
+    """
+    Generate one poisson random variate per lambda
 
-    def trial():
-        return bernoulli(p=p, u=prng())
-
-    return sum(repeatfunc(trial, times=n))
-
+    Lambdas below POISSON_PTRS_MIN_LAM use inversion, the rest use
+    transformed rejection. With numpy, both methods run over the whole array,
+    redrawing only the variates that are still pending.
 
-def erlang(lam, n, prng=DEFAULT_PRNG):
+    :param lam: one lambda parameter per variate
+    :type lam: sequence of ints or floats
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when any lambda is less than 0 or not finite
+    :return: random variates from the Poisson Distribution
+    :rtype: array of ints
     """
-    Generate a random variate from the Erlang Distribution
+    if np is None:
+        return to_array(
+            (Poisson(lam_i, prng=prng).sample() for lam_i in lam), "q"
+        )
+
+    lam = np.asarray(lam, dtype=float)
+    # nan fails both comparisons
+    if not np.all((lam >= 0) & (lam < np.inf)):
+        raise ValueError("lam must be at least 0 and finite")
+    x = np.zeros(len(lam), dtype=np.int64)
+
+    small = np.flatnonzero(lam < POISSON_PTRS_MIN_LAM)
+    small_lam = lam[small]
+    u = prn_block_handler(u=None, size=len(small), prng=prng)
+    p = np.exp(-small_lam)
+    s = p.copy()
+    x_small = np.zeros(len(small), dtype=np.int64)
+    active = (u > s) & (p > 0)
+    while active.any():
+        x_small[active] += 1
+        p[active] *= small_lam[active] / x_small[active]
+        s[active] += p[active]
+        active &= (u > s) & (p > 0)
+    x[small] = x_small
+
+    pending = np.flatnonzero(lam >= POISSON_PTRS_MIN_LAM)
+    while len(pending):
+        large_lam = lam[pending]
+        log_lam, b, a, log_inv_alpha, v_r = _poisson_ptrs_constants(large_lam)
+        u = prn_block_handler(u=None, size=len(pending), prng=prng) - 0.5
+        v = prn_block_handler(u=None, size=len(pending), prng=prng)
+        us = 0.5 - np.abs(u)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            k = np.floor((2 * a / us + b) * u + large_lam + 0.43)
+        accept = (us >= 0.07) & (v <= v_r)
+        squeezed = (us < 0.013) & (v > us)
+        check = np.flatnonzero(~accept & (k >= 0) & ~squeezed)
+        if len(check):
+            us_c = us[check]
+            k_c = k[check]
+            log_gamma = np.array([math.lgamma(k_i + 1) for k_i in k_c])
+            with np.errstate(divide="ignore"):
+                accept[check] = (
+                    np.log(v[check])
+                    + log_inv_alpha[check]
+                    - np.log(a[check] / (us_c * us_c) + b[check])
+                    <= -large_lam[check] + k_c * log_lam[check] - log_gamma
+                )
+        x[pending[accept]] = k[accept]
+        pending = pending[~accept]
+        if _rejection_hook is not None:
+            _rejection_hook(len(pending))
+    return x
 
-    The erlang distribution is the time until the nth event in a poisson process.
 
-    This implementation uses the inverse transform method to generate the
-    random variate. Another implementation could also use the convolutional
-    method to take the sum of n iid exponential random variates. The inverse
-    transform method is used here because it is more efficient. This efficiency
-    is because only one log operation is performed instead of n log operations.
+class Poisson(Distribution):
+    """
+    Frozen Poisson Distribution, see poisson
 
     :param lam: lambda parameter
-    :type lam: int or float
-    :param n: number of iid RVs to use to calculate. If modelling poisson
-    process, n is the number of events to wait for.
-    :type n: int
+    :type lam: int or float, at least 0
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
-    :return: random variate from the Erlang Distribution
-    :rtype: float
+    :raises ValueError: occurs when lam is less than 0 or not finite
     """
-    return (-1 / lam) * math.prod(repeatfunc(prng, times=n))
-
 
-def negative_binomial(n, p, prng=DEFAULT_PRNG):
-    """
-    Generate a random variate from the Negative Binomial Distribution
+    __slots__ = ("lam", "_constants")
+    typecode = "q"
 
-    The negative binomial distribution is the number of failures before the nth
-    success in a sequence of iid Bernoulli trials. Put another way (and
-    representative of the implementation of this function), the sum of n iid
-    geometric random variates.
+    def __init__(self, lam, prng=DEFAULT_PRNG):
+        if not 0 <= lam < math.inf:
+            raise ValueError("lam must be at least 0 and finite")
+        super().__init__(prng)
+        self.lam = lam
+        if lam < POISSON_PTRS_MIN_LAM:
+            self._constants = math.exp(-lam)
+        else:
+            self._constants = _poisson_ptrs_constants(lam)
 
-    This implementation uses the convolutional method to sum n geometric random
-    variates.
+    def sample(self):
+        """
+        Generate a random variate
 
-    :param n: number of success, number of geometric random variates to sum
-    :type n: int
-    :param p: probability of a success
-    :type p: float
-    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
-    :type prng: builtin_function_or_method
-    :return: _description_
-    :rtype: float
-    """
+        :return: random variate
+        :rtype: int
+        """
+        if self.lam < POISSON_PTRS_MIN_LAM:
+            u = prn_handler(u=None, prng=self.prng)
+            return _poisson_inversion(self.lam, self._constants, u)
+        return _poisson_ptrs(self.lam, self._constants, self.prng)
 
-    def trial():
-        return geometric(p=p, u=prng())
+    def sample_n(self, size):
+        """
+        Generate an array of random variates
 
-    return sum(repeatfunc(trial, times=n))
+        :param size: number of variates to generate
+        :type size: int
+        :return: random variates
+        :rtype: array of ints
+        """
+        if np is None:
+            return super().sample_n(size)
+        return _poisson_block(np.full(size, float(self.lam)), self.prng)
 
 
-def chi_square(n, prng=DEFAULT_PRNG):
+def poisson(lam, prng=DEFAULT_PRNG, size=None):
     """
-    Generate a random variate from the Chi-Square Distribution
+    Generate a random variate from the Poisson Distribution
 
-    The sum of some number of iid squared standard normal random variates.
+    A poisson process relates to the number of events that occur in a given
+    time interval.
 
-    This implementation uses the convolutional method to sum n standard normal
-    random variates.
+    This implementation is exact for every lambda. Lambdas below 10 use
+    inversion of the CDF. Larger lambdas use Hörmann's transformed rejection
+    (PTRS), which has a constant expected cost however large lambda is.
 
-    :param n: the number of standard normal distributions to square and sum
-    :type n: int
+    :param lam: lambda parameter. A sequence of lambdas generates one variate
+    per lambda
+    :type lam: int or float greater than 0 or sequence of ints or floats
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
-    :return: random variate from the Chi-Square Distribution
-    :rtype: float
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :raises ValueError: occurs when a lambda is less than 0 or not finite, or
+    the number of lambdas does not match size
+    :return: random variate from the Poisson Distribution
+    :rtype: int or array of ints
     """
+    if not isinstance(lam, numbers.Real):
+        if size is not None and len(lam) != size:
+            raise ValueError("Number of lambdas must match size")
+        return _poisson_block(lam, prng)
+    dist = _frozen(Poisson, prng, lam)
+    if size is not None:
+        return dist.sample_n(size)
+    return dist.sample()
 
-    def trial():
-        return standard_normal(prng=prng) ** 2
-
-    return sum(repeatfunc(trial, times=n))
 
+def _binomial_inversion_constants(n, p):
+    """
+    Get the constants of the inversion method for a given n and p
 
-def t(n, prng=DEFAULT_PRNG):
+    :param n: number of bernoulli trials
+    :type n: int
+    :param p: probability of a success, at most 0.5
+    :type p: float
+    :return: p / q, (n + 1) * p / q and P(X = 0)
+    :rtype: tuple
     """
-    Generate a random variate from the t Distribution
+    q = 1 - p
+    s = p / q
+    return s, (n + 1) * s, q**n
 
-    The ratio of a standard normal random variate to the square root of the ratio
-    of a chi-square random variate to its degrees of freedom (i.e. the number of
-    normal distributions that were squared to generate the chi-square random
-    variate, n parameter for the chi-square random variate).
+
+def _binomial_inversion(n, constants, u):
+    """
+    Generate a binomial random variate by sequential search of the CDF
+
+    The expected number of steps is n * p, so this is only used when n * p is
+    small.
+
+    :param n: number of bernoulli trials
+    :type n: int
+    :param constants: result of _binomial_inversion_constants(n, p)
+    :type constants: tuple
+    :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+    :type u: float
+    :return: random variate from the Binomial Distribution
+    :rtype: int
+    """
+    s, a, r = constants
+    x = 0
+    while u > r and x < n:
+        u -= r
+        x += 1
+        r *= a / x - s
+    return x
+
+
+def _binomial_inversion_block(n, constants, u):
+    """
+    Generate an array of binomial random variates by sequential search of the CDF
+
+    :param n: number of bernoulli trials
+    :type n: int
+    :param constants: result of _binomial_inversion_constants(n, p)
+    :type constants: tuple
+    :param u: psuedo random numbers, expected to come from the uniform(0,1)
+    distribution
+    :type u: numpy.ndarray
+    :return: random variates from the Binomial Distribution
+    :rtype: numpy.ndarray
+    """
+    s, a, r_0 = constants
+    # the leftover probability gets its own array, the block may be read-only
+    u = u.copy()
+    x = np.zeros(len(u), dtype=np.int64)
+    r = np.full(len(u), r_0)
+    active = u > r
+    while active.any():
+        u[active] -= r[active]
+        x[active] += 1
+        r[active] *= a / x[active] - s
+        active &= (u > r) & (x < n)
+    return x
+
+
+def _binomial_btrs_constants(n, p):
+    """
+    Get the constants of the transformed rejection method for a given n and p
+
+    :param n: number of bernoulli trials
+    :type n: int
+    :param p: probability of a success, at most 0.5
+    :type p: float
+    :return: a, b, c, v_r, alpha, log(p / q), the mode and the log of the
+    mode's binomial coefficient denominator
+    :rtype: tuple
+    """
+    q = 1 - p
+    spq = math.sqrt(n * p * q)
+    b = 1.15 + 2.53 * spq
+    a = -0.0873 + 0.0248 * b + 0.01 * p
+    c = n * p + 0.5
+    v_r = 0.92 - 4.2 / b
+    alpha = (2.83 + 5.1 / b) * spq
+    m = math.floor((n + 1) * p)
+    h = math.lgamma(m + 1) + math.lgamma(n - m + 1)
+    return a, b, c, v_r, alpha, math.log(p / q), m, h
+
+
+def _binomial_btrs(n, constants, prng):
+    """
+    Generate a binomial random variate with transformed rejection (BTRS)
+
+    Hörmann's transformed rejection with squeeze. Exact, uses two prn's per
+    attempt and has a constant expected cost however large n is.
+
+    :param n: number of bernoulli trials
+    :type n: int
+    :param constants: result of _binomial_btrs_constants(n, p)
+    :type constants: tuple
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :return: random variate from the Binomial Distribution
+    :rtype: int
+    """
+    a, b, c, v_r, alpha, log_pq, m, h = constants
+    while True:
+        u = prn_handler(u=None, prng=prng) - 0.5
+        v = prn_handler(u=None, prng=prng)
+        us = 0.5 - abs(u)
+        if us == 0:
+            continue
+        k = math.floor((2 * a / us + b) * u + c)
+        if 0 <= k <= n:
+            if us >= 0.07 and v <= v_r:
+                return k
+            if v == 0 or math.log(v * alpha / (a / (us * us) + b)) <= (
+                h
+                - math.lgamma(k + 1)
+                - math.lgamma(n - k + 1)
+                + (k - m) * log_pq
+            ):
+                return k
+        if _rejection_hook is not None:
+            _rejection_hook(1)
+
+
+def _binomial_btrs_block(n, constants, size, prng):
+    """
+    Generate an array of binomial random variates with transformed rejection
+
+    The method runs over the whole array, redrawing only the variates that
+    are still pending.
+
+    :param n: number of bernoulli trials
+    :type n: int
+    :param constants: result of _binomial_btrs_constants(n, p)
+    :type constants: tuple
+    :param size: number of variates to generate
+    :type size: int
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :return: random variates from the Binomial Distribution
+    :rtype: numpy.ndarray
+    """
+    a, b, c, v_r, alpha, log_pq, m, h = constants
+    x = np.zeros(size, dtype=np.int64)
+    pending = np.arange(size)
+    while len(pending):
+        u = prn_block_handler(u=None, size=len(pending), prng=prng) - 0.5
+        v = prn_block_handler(u=None, size=len(pending), prng=prng)
+        us = 0.5 - np.abs(u)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            k = np.floor((2 * a / us + b) * u + c)
+        in_range = (k >= 0) & (k <= n)
+        accept = in_range & (us >= 0.07) & (v <= v_r)
+        check = np.flatnonzero(in_range & ~accept)
+        if len(check):
+            us_c = us[check]
+            k_c = k[check]
+            log_gamma = np.array(
+                [math.lgamma(k_i + 1) + math.lgamma(n - k_i + 1) for k_i in k_c]
+            )
+            with np.errstate(divide="ignore"):
+                accept[check] = np.log(
+                    v[check] * alpha / (a / (us_c * us_c) + b)
+                ) <= (h - log_gamma + (k_c - m) * log_pq)
+        x[pending[accept]] = k[accept]
+        pending = pending[~accept]
+        if _rejection_hook is not None:
+            _rejection_hook(len(pending))
+    return x
+
+
+class Binomial(Distribution):
+    """
+    Frozen Binomial Distribution, see binomial
+
+    :param n: number of bernoulli trials
+    :type n: int
+    :param p: probability of a success
+    :type p: float
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises TypeError: occurs when n is not an integer
+    :raises ValueError: occurs when n is less than 0 or p is not between 0
+    and 1
+    """
+
+    __slots__ = ("n", "p", "_flip", "_method", "_constants")
+    typecode = "q"
+
+    def __init__(self, n, p, prng=DEFAULT_PRNG):
+        if not isinstance(n, numbers.Integral):
+            raise TypeError("n may only be an integer")
+        if n < 0 or not 0 <= p <= 1:
+            raise ValueError("n must be at least 0 and p between 0 and 1")
+        super().__init__(prng)
+        self.n = n
+        self.p = p
+        # count the failures instead when p > 0.5, the methods need p <= 0.5
+        self._flip = p > 0.5
+        p = min(p, 1 - p)
+        if n == 0 or p == 0:
+            self._method = None
+            self._constants = None
+        elif n * p < BINOMIAL_BTRS_MIN_MEAN:
+            self._method = "inversion"
+            self._constants = _binomial_inversion_constants(n, p)
+        else:
+            self._method = "btrs"
+            self._constants = _binomial_btrs_constants(n, p)
+
+    def sample(self):
+        """
+        Generate a random variate
+
+        :return: random variate
+        :rtype: int
+        """
+        if self._method is None:
+            x = 0
+        elif self._method == "inversion":
+            u = prn_handler(u=None, prng=self.prng)
+            x = _binomial_inversion(self.n, self._constants, u)
+        else:
+            x = _binomial_btrs(self.n, self._constants, self.prng)
+        if self._flip:
+            return self.n - x
+        return x
+
+    def sample_n(self, size):
+        """
+        Generate an array of random variates
+
+        The method's constants are shared by the whole array. With numpy, the
+        method runs over the whole array.
+
+        :param size: number of variates to generate
+        :type size: int
+        :return: random variates
+        :rtype: array of ints
+        """
+        if np is None:
+            return super().sample_n(size)
+        if self._method is None:
+            x = np.zeros(size, dtype=np.int64)
+        elif self._method == "inversion":
+            u = prn_block_handler(u=None, size=size, prng=self.prng)
+            x = _binomial_inversion_block(self.n, self._constants, u)
+        else:
+            x = _binomial_btrs_block(self.n, self._constants, size, self.prng)
+        if self._flip:
+            return self.n - x
+        return x
+
+
+def binomial(n, p, prng=DEFAULT_PRNG, size=None):
+    """
+    Generate a random variate from the Binomial Distribution
+
+    The binomial distribution is the number of successes in n iid bernoulli
+    trials.
+
+    This implementation is exact and its cost does not grow with n. When
+    n * min(p, 1 - p) is below 10 the CDF is inverted with a single prn,
+    otherwise Hörmann's transformed rejection (BTRS) is used.
+
+    :param n: number of bernoulli trials
+    :type n: int
+    :param p: probability of a success
+    :type p: float
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :raises TypeError: occurs when n is not an integer
+    :raises ValueError: occurs when n is less than 0 or p is not between 0
+    and 1
+    :return: random variate from the Binomial Distribution
+    :rtype: int or array of ints
+    """
+    dist = _frozen(Binomial, prng, n, p)
+    if size is not None:
+        return dist.sample_n(size)
+    return dist.sample()
+
+
+class Gamma(Distribution):
+    """
+    Frozen Gamma Distribution, see gamma
+
+    :param shape: shape parameter, greater than 0
+    :type shape: int or float
+    :param scale: scale parameter, defaults to 1
+    :type scale: int or float, optional
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when shape or scale is not greater than 0
+    """
+
+    __slots__ = ("shape", "scale", "_d", "_c", "_inv_shape")
+
+    def __init__(self, shape, scale=1, prng=DEFAULT_PRNG):
+        if shape <= 0 or scale <= 0:
+            raise ValueError("shape and scale must be greater than 0")
+        super().__init__(prng)
+        self.shape = shape
+        self.scale = scale
+        # shapes below 1 are boosted by 1 and scaled back down by u ** (1 / shape)
+        if shape < 1:
+            self._inv_shape = 1 / shape
+            shape += 1
+        else:
+            self._inv_shape = None
+        self._d = shape - 1 / 3
+        self._c = 1 / math.sqrt(9 * self._d)
+
+    def sample(self):
+        """
+        Generate a random variate
+
+        :return: random variate
+        :rtype: float
+        """
+        prng = self.prng
+        d = self._d
+        c = self._c
+        while True:
+            z = _standard_normal_ziggurat(prng)
+            v = (1 + c * z) ** 3
+            if v > 0:
+                u = prn_handler(u=None, prng=prng)
+                if u < 1 - 0.0331 * z**4 or math.log(u) < 0.5 * z**2 + d * (
+                    1 - v + math.log(v)
+                ):
+                    break
+            if _rejection_hook is not None:
+                _rejection_hook(1)
+        x = d * v * self.scale
+        if self._inv_shape is not None:
+            return x * prn_handler(u=None, prng=prng) ** self._inv_shape
+        return x
+
+    def sample_n(self, size):
+        """
+        Generate an array of random variates
+
+        With numpy, the method runs over the whole array, redrawing only the
+        variates that are still pending.
+
+        :param size: number of variates to generate
+        :type size: int
+        :return: random variates
+        :rtype: array of floats
+        """
+        if np is None:
+            return super().sample_n(size)
+        d = self._d
+        c = self._c
+        x = np.empty(size)
+        pending = np.arange(size)
+        while len(pending):
+            z = _standard_normal_ziggurat_block(len(pending), self.prng)
+            v = (1 + c * z) ** 3
+            u = prn_block_handler(u=None, size=len(pending), prng=self.prng)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                accept = (v > 0) & (
+                    (u < 1 - 0.0331 * z**4)
+                    | (np.log(u) < 0.5 * z**2 + d * (1 - v + np.log(v)))
+                )
+            x[pending[accept]] = d * v[accept] * self.scale
+            pending = pending[~accept]
+            if _rejection_hook is not None:
+                _rejection_hook(len(pending))
+        if self._inv_shape is not None:
+            u = prn_block_handler(u=None, size=size, prng=self.prng)
+            return x * u**self._inv_shape
+        return x
+
+
+def gamma(shape, scale=1, prng=DEFAULT_PRNG, size=None):
+    """
+    Generate a random variate from the Gamma Distribution
+
+    The gamma distribution generalizes the erlang and chi-square distributions
+    to a shape parameter that does not have to be a whole number.
+
+    This implementation uses the Marsaglia-Tsang method, which transforms a
+    standard normal random variate and accepts it with a squeeze test. About 2%
+    to 5% of attempts are rejected whatever the shape, so the cost of a
+    variate does not grow with the shape. Shapes below 1 are generated as
+    gamma(shape + 1) * u ** (1 / shape).
+
+    :param shape: shape parameter, greater than 0
+    :type shape: int or float
+    :param scale: scale parameter, defaults to 1
+    :type scale: int or float, optional
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :return: random variate from the Gamma Distribution
+    :rtype: float or array of floats
+    """
+    dist = _frozen(Gamma, prng, shape, scale)
+    if size is not None:
+        return dist.sample_n(size)
+    return dist.sample()
+
+
+class Erlang(Gamma):
+    """
+    Frozen Erlang Distribution, see erlang
+
+    :param lam: lambda parameter
+    :type lam: int or float greater than 0
+    :param n: number of events to wait for
+    :type n: int greater than 0
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when lam or n is not greater than 0
+    """
+
+    __slots__ = ("lam", "n")
+
+    def __init__(self, lam, n, prng=DEFAULT_PRNG):
+        if lam <= 0:
+            raise ValueError("lam must be greater than 0")
+        super().__init__(n, 1 / lam, prng=prng)
+        self.lam = lam
+        self.n = n
+
+
+def erlang(lam, n, prng=DEFAULT_PRNG, size=None):
+    """
+    Generate a random variate from the Erlang Distribution
+
+    The erlang distribution is the time until the nth event in a poisson process.
+
+    This implementation generates the random variate as a gamma random variate
+    with shape n and scale 1 / lam, so the cost does not grow with n.
+
+    :param lam: lambda parameter
+    :type lam: int or float
+    :param n: number of iid RVs to use to calculate. If modelling poisson
+    process, n is the number of events to wait for.
+    :type n: int
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :return: random variate from the Erlang Distribution
+    :rtype: float or array of floats
+    """
+    dist = _frozen(Erlang, prng, lam, n)
+    if size is not None:
+        return dist.sample_n(size)
+    return dist.sample()
+
+
+class NegativeBinomial(Distribution):
+    """
+    Frozen Negative Binomial Distribution, see negative_binomial
+
+    :param n: number of success
+    :type n: int greater than 0
+    :param p: probability of a success
+    :type p: float
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when n is not greater than 0 or p is not
+    strictly between 0 and 1
+    """
+
+    __slots__ = ("n", "p", "_gamma")
+    typecode = "q"
+
+    def __init__(self, n, p, prng=DEFAULT_PRNG):
+        if not 0 < p < 1:
+            raise ValueError("p must be between 0 and 1")
+        super().__init__(prng)
+        self.n = n
+        self.p = p
+        self._gamma = Gamma(n, (1 - p) / p, prng=prng)
+
+    def sample(self):
+        """
+        Generate a random variate
+
+        :return: random variate
+        :rtype: int
+        """
+        return self.n + Poisson(self._gamma.sample(), prng=self.prng).sample()
+
+    def sample_n(self, size):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :return: random variates
+        :rtype: array of ints
+        """
+        failures = _poisson_block(self._gamma.sample_n(size), self.prng)
+        if np is None:
+            return to_array((self.n + x for x in failures), "q")
+        return self.n + failures
+
+
+def negative_binomial(n, p, prng=DEFAULT_PRNG, size=None):
+    """
+    Generate a random variate from the Negative Binomial Distribution
+
+    The negative binomial distribution is the number of trials needed to get
+    the nth success in a sequence of iid Bernoulli trials. Put another way, the
+    sum of n iid geometric random variates.
+
+    This implementation uses the gamma-poisson mixture: the number of failures
+    before the nth success is a poisson random variate whose lambda is a gamma
+    random variate with shape n and scale (1 - p) / p. Adding the n successes
+    gives the number of trials. The cost does not grow with n.
+
+    :param n: number of success, number of geometric random variates to sum
+    :type n: int
+    :param p: probability of a success
+    :type p: float
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :return: random variate from the Negative Binomial Distribution
+    :rtype: int or array of ints
+    """
+    dist = _frozen(NegativeBinomial, prng, n, p)
+    if size is not None:
+        return dist.sample_n(size)
+    return dist.sample()
+
+
+class ChiSquare(Gamma):
+    """
+    Frozen Chi-Square Distribution, see chi_square
+
+    :param n: degrees of freedom
+    :type n: int greater than 0
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when n is not greater than 0
+    """
+
+    __slots__ = ("n",)
+
+    def __init__(self, n, prng=DEFAULT_PRNG):
+        super().__init__(n / 2, 2, prng=prng)
+        self.n = n
+
+
+def chi_square(n, prng=DEFAULT_PRNG, size=None):
+    """
+    Generate a random variate from the Chi-Square Distribution
+
+    The sum of some number of iid squared standard normal random variates.
+
+    This implementation generates the random variate as a gamma random variate
+    with shape n / 2 and scale 2, so the cost does not grow with n.
+
+    :param n: the number of standard normal distributions to square and sum
+    :type n: int
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :return: random variate from the Chi-Square Distribution
+    :rtype: float or array of floats
+    """
+    dist = _frozen(ChiSquare, prng, n)
+    if size is not None:
+        return dist.sample_n(size)
+    return dist.sample()
+
+
+class StudentT(Distribution):
+    """
+    Frozen t Distribution, see t
+
+    :param n: degrees of freedom
+    :type n: int greater than 0
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when n is not greater than 0
+    """
+
+    __slots__ = ("n", "_chi_square")
+
+    def __init__(self, n, prng=DEFAULT_PRNG):
+        super().__init__(prng)
+        self.n = n
+        self._chi_square = ChiSquare(n, prng=prng)
+
+    def sample(self):
+        """
+        Generate a random variate
+
+        :return: random variate
+        :rtype: float
+        """
+        normal_rv = _standard_normal_ziggurat(self.prng)
+        return normal_rv / math.sqrt(self._chi_square.sample() / self.n)
+
+    def sample_n(self, size):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :return: random variates
+        :rtype: array of floats
+        """
+        if np is None:
+            return super().sample_n(size)
+        normal_rv = _standard_normal_ziggurat_block(size, self.prng)
+        return normal_rv / np.sqrt(self._chi_square.sample_n(size) / self.n)
+
+
+def t(n, prng=DEFAULT_PRNG, size=None):
+    """
+    Generate a random variate from the t Distribution
+
+    The ratio of a standard normal random variate to the square root of the ratio
+    of a chi-square random variate to its degrees of freedom (i.e. the number of
+    normal distributions that were squared to generate the chi-square random
+    variate, n parameter for the chi-square random variate).
 
     :param n: number of standard normal distributions to square and sum, degrees
     of freedom
     :type n: int
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
-    :return: random variate from the t Distribution
-    :rtype: float
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :return: random variate from the t Distribution
+    :rtype: float or array of floats
+    """
+    dist = _frozen(StudentT, prng, n)
+    if size is not None:
+        return dist.sample_n(size)
+    return dist.sample()
+
+
+class Cauchy(StudentT):
+    """
+    Frozen Cauchy Distribution, see cauchy
+
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    """
+
+    __slots__ = ()
+
+    def __init__(self, prng=DEFAULT_PRNG):
+        super().__init__(1, prng=prng)
+
+
+def cauchy(prng=DEFAULT_PRNG, size=None):
+    """
+    Generate a random variate from the Cauchy Distribution
+
+    The cauchy distribution is a generalization of the t distribution with 1
+    degree of freedom.
+
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :return: random variate from the Cauchy Distribution
+    :rtype: float or array of floats
+    """
+    dist = _frozen(Cauchy, prng)
+    if size is not None:
+        return dist.sample_n(size)
+    return dist.sample()
+
+
+class FisherF(Distribution):
+    """
+    Frozen F Distribution, see F
+
+    :param n: degrees of freedom of the numerator
+    :type n: int greater than 0
+    :param m: degrees of freedom of the denominator
+    :type m: int greater than 0
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when n or m is not greater than 0
+    """
+
+    __slots__ = ("n", "m", "_numerator", "_denominator")
+
+    def __init__(self, n, m, prng=DEFAULT_PRNG):
+        super().__init__(prng)
+        self.n = n
+        self.m = m
+        self._numerator = ChiSquare(n, prng=prng)
+        self._denominator = ChiSquare(m, prng=prng)
+
+    def sample(self):
+        """
+        Generate a random variate
+
+        :return: random variate
+        :rtype: float
+        """
+        numerator = self._numerator.sample() / self.n
+        return numerator / (self._denominator.sample() / self.m)
+
+    def sample_n(self, size):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :return: random variates
+        :rtype: array of floats
+        """
+        if np is None:
+            return super().sample_n(size)
+        numerator = self._numerator.sample_n(size) / self.n
+        return numerator / (self._denominator.sample_n(size) / self.m)
+
+
+def F(n, m, prng=DEFAULT_PRNG, size=None):
+    """
+    Generate a random variate from the F Distribution
+
+    Generates the random variate by taking the ratio of the ratios of two
+    chi-square random variates to their degrees of freedom (i.e. the number of
+    normal distributions that were squared to generate the chi-square random
+    variates, n parameter for each chi-square random variate).
+
+    :param n: number of standard normal distributions to square and sum for the
+    first chi-square random variate
+    :type n: int
+    :param m: number of standard normal distributions to square and sum for the
+    second chi-square random variate
+    :type m: int
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :return: random variate from the F Distribution
+    :rtype: float or array of floats
+    """
+    dist = _frozen(FisherF, prng, n, m)
+    if size is not None:
+        return dist.sample_n(size)
+    return dist.sample()
+
+
+class StandardNormalCrude(Distribution):
+    """
+    Frozen Standard Normal Distribution using the A&S Method, see
+    standard_normal_crude
+
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    """
+
+    __slots__ = ()
+
+    def sample(self, u=None):
+        """
+        Generate a random variate
+
+        :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+        :type u: float
+        :return: random variate
+        :rtype: float
+        """
+        u = prn_handler(u=u, prng=self.prng)
+        t = math.sqrt(-2 * math.log(min(u, 1 - u)))
+        numerator, denominator = CRUDE_NORMAL_QUANTILE
+        z = t - _polynomial(numerator, t) / _polynomial(denominator, t)
+        if u < 0.5:
+            return -z
+        return z if u > 0.5 else 0.0
+
+    def sample_n(self, size, u=None, out=None):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :param u: psuedo random numbers, expected to come from the uniform(0,1)
+        distribution
+        :type u: sequence of floats
+        :param out: array to write the variates to, defaults to None, i.e. a
+        new array
+        :type out: numpy.ndarray or array.array, optional
+        :return: random variates
+        :rtype: array of floats
+        """
+        u = prn_block_handler(u=u, size=size, prng=self.prng)
+        if np is None:
+            return to_array((self.sample(u_i) for u_i in u), out=out)
+        t = np.sqrt(-2 * np.log(np.minimum(u, 1 - u)))
+        numerator, denominator = CRUDE_NORMAL_QUANTILE
+        z = t - _polynomial(numerator, t) / _polynomial(denominator, t)
+        return np.multiply(np.sign(u - 0.5), z, out=out)
+
+
+def standard_normal_crude(u=None, prng=DEFAULT_PRNG, size=None, out=None):
+    """
+    Generate a random variate from the Standard Normal Distribution using the A&S Method
+
+    The A&S method is an approximate method for generating standard normal
+    random variates. This method approximates the inverse CDF of the normal
+    distribution. This method has an approximate  error of less than or equal
+    to .00045
+
+    :param u: psuedo random number, expected to come from the uniform(0,1)
+    distribution. A sequence of size numbers when size is given
+    :type u: float or sequence of floats
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :param out: array to write the variates to when size is given, defaults
+    to None, i.e. a new array
+    :type out: numpy.ndarray or array.array, optional
+    :return: Random Variate from the Standard Normal Distribution
+    :rtype: float or array of floats
+    """
+    dist = _frozen(StandardNormalCrude, prng)
+    if size is not None:
+        return dist.sample_n(size, u=u, out=out)
+    return dist.sample(u=u)
+
+
+def _ziggurat_tables(layers=ZIGGURAT_LAYERS, r=ZIGGURAT_R, v=ZIGGURAT_V):
+    """
+    Build the layer tables of the normal ziggurat
+
+    :param layers: number of layers, defaults to ZIGGURAT_LAYERS
+    :type layers: int, optional
+    :param r: x coordinate where the tail starts, defaults to ZIGGURAT_R
+    :type r: float, optional
+    :param v: area of each layer, defaults to ZIGGURAT_V
+    :type v: float, optional
+    :return: right edge of each layer (with a trailing 0) and the ratio of
+    each layer's right edge to the right edge of the layer below it
+    :rtype: tuple of lists of floats
+    """
+    f = math.exp(-0.5 * r * r)
+    x = [0.0] * (layers + 1)
+    # the bottom layer is the rectangle plus the tail, as a wider rectangle
+    x[0] = v / f
+    x[1] = r
+    for i in range(2, layers):
+        x[i] = math.sqrt(-2 * math.log(v / x[i - 1] + f))
+        f = math.exp(-0.5 * x[i] * x[i])
+    ratio = [x[i + 1] / x[i] for i in range(layers)]
+    return x, ratio
+
+
+_ZIGGURAT_X, _ZIGGURAT_RATIO = _ziggurat_tables()
+
+
+@lru_cache(maxsize=None)
+def _ziggurat_arrays():
+    """
+    Get the layer tables of the normal ziggurat as numpy arrays
+
+    :return: x coordinates and ratios of the layers
+    :rtype: tuple of numpy.ndarray
+    """
+    return np.array(_ZIGGURAT_X), np.array(_ZIGGURAT_RATIO)
+
+
+# unused polar method partner of the latest call that asked for caching
+_POLAR_SPARE = {}
+
+
+def _ziggurat_tail(negative, prng):
+    """
+    Generate a standard normal random variate from beyond the ziggurat's base
+
+    :param negative: Should the variate be from the negative tail
+    :type negative: bool
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :return: random variate with an absolute value greater than ZIGGURAT_R
+    :rtype: float
+    """
+    while True:
+        x = math.log(1 - prn_handler(u=None, prng=prng)) / ZIGGURAT_R
+        y = math.log(1 - prn_handler(u=None, prng=prng))
+        if -2 * y >= x * x:
+            break
+        if _rejection_hook is not None:
+            _rejection_hook(1)
+    if negative:
+        return x - ZIGGURAT_R
+    return ZIGGURAT_R - x
+
+
+def _standard_normal_ziggurat(prng):
+    """
+    Generate a standard normal random variate with the ziggurat method
+
+    One prn picks both the layer and the position in the layer. About 99% of
+    variates are accepted with one prn, a comparison and a multiplication.
+
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :return: random variate from the Standard Normal Distribution
+    :rtype: float
+    """
+    x_table = _ZIGGURAT_X
+    ratio = _ZIGGURAT_RATIO
+    while True:
+        v = prn_handler(u=None, prng=prng) * ZIGGURAT_LAYERS
+        i = int(v)
+        u = 2 * (v - i) - 1
+        if abs(u) < ratio[i]:
+            return u * x_table[i]
+        if i == 0:
+            return _ziggurat_tail(u < 0, prng)
+        x = u * x_table[i]
+        f0 = math.exp(-0.5 * (x_table[i] * x_table[i] - x * x))
+        f1 = math.exp(-0.5 * (x_table[i + 1] * x_table[i + 1] - x * x))
+        if f1 + prn_handler(u=None, prng=prng) * (f0 - f1) < 1:
+            return x
+        if _rejection_hook is not None:
+            _rejection_hook(1)
+
+
+def _standard_normal_ziggurat_block(size, prng):
+    """
+    Generate an array of standard normal random variates with the ziggurat method
+
+    :param size: number of variates to generate
+    :type size: int
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :return: random variates from the Standard Normal Distribution
+    :rtype: array of floats
+    """
+    if np is None:
+        return to_array(_standard_normal_ziggurat(prng) for _ in range(size))
+    x_table, ratio = _ziggurat_arrays()
+    z = np.empty(size)
+    pending = np.arange(size)
+    while len(pending):
+        # not in place, the block may be read-only, e.g. replayed from a file
+        v = prn_block_handler(u=None, size=len(pending), prng=prng)
+        v = v * ZIGGURAT_LAYERS
+        i = v.astype(np.intp)
+        u = 2 * (v - i) - 1
+        x = u * x_table[i]
+        accept = np.abs(u) < ratio[i]
+        wedge = np.flatnonzero(~accept & (i > 0))
+        if len(wedge):
+            x_w = x[wedge]
+            i_w = i[wedge]
+            f0 = np.exp(-0.5 * (x_table[i_w] ** 2 - x_w**2))
+            f1 = np.exp(-0.5 * (x_table[i_w + 1] ** 2 - x_w**2))
+            u_w = prn_block_handler(u=None, size=len(wedge), prng=prng)
+            accept[wedge] = f1 + u_w * (f0 - f1) < 1
+        for j in np.flatnonzero(~accept & (i == 0)):
+            x[j] = _ziggurat_tail(u[j] < 0, prng)
+            accept[j] = True
+        z[pending[accept]] = x[accept]
+        pending = pending[~accept]
+        if _rejection_hook is not None:
+            _rejection_hook(len(pending))
+    return z
+
+
+def _standard_normal_polar(prng):
+    """
+    Generate a pair of standard normal random variates with the polar method
+
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :return: two independent random variates from the Standard Normal
+    Distribution
+    :rtype: tuple of floats
+    """
+    while True:
+        # center the prn's around 0
+        v1 = 2 * prn_handler(u=None, prng=prng) - 1
+        v2 = 2 * prn_handler(u=None, prng=prng) - 1
+        w = v1 * v1 + v2 * v2
+        if 0 < w < 1:
+            break
+        if _rejection_hook is not None:
+            _rejection_hook(1)
+    y = math.sqrt((-2 * math.log(w)) / w)
+    return v1 * y, v2 * y
+
+
+class StandardNormal(Distribution):
+    """
+    Frozen Standard Normal Distribution, see standard_normal
+
+    :param method: "ziggurat" or "polar", defaults to "ziggurat"
+    :type method: str, optional
+    :param cache: Should the polar method keep the unused second normal and
+    return it on the next call with the same prng, defaults to False
+    :type cache: bool, optional
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when method is not "ziggurat" or "polar"
+    """
+
+    __slots__ = ("method", "cache")
+
+    def __init__(self, method="ziggurat", cache=False, prng=DEFAULT_PRNG):
+        if method not in ("ziggurat", "polar"):
+            raise ValueError('method must be "ziggurat" or "polar"')
+        super().__init__(prng)
+        self.method = method
+        self.cache = cache
+
+    def sample(self):
+        """
+        Generate a random variate
+
+        :return: random variate
+        :rtype: float
+        """
+        prng = self.prng
+        if self.method == "ziggurat":
+            return _standard_normal_ziggurat(prng)
+        if self.cache:
+            spare = _POLAR_SPARE.pop(prng, None)
+            if spare is not None:
+                return spare
+            z, spare = _standard_normal_polar(prng)
+            _POLAR_SPARE.clear()
+            _POLAR_SPARE[prng] = spare
+            return z
+        return _standard_normal_polar(prng)[0]
+
+    def sample_pair(self):
+        """
+        Generate two independent random variates
+
+        :return: two random variates
+        :rtype: list of floats
+        """
+        if self.method == "ziggurat":
+            return [
+                _standard_normal_ziggurat(self.prng),
+                _standard_normal_ziggurat(self.prng),
+            ]
+        return list(_standard_normal_polar(self.prng))
+
+    def sample_n(self, size):
+        """
+        Generate an array of random variates
+
+        The polar method uses both normals of every pair.
+
+        :param size: number of variates to generate
+        :type size: int
+        :return: random variates
+        :rtype: array of floats
+        """
+        if self.method == "ziggurat":
+            return _standard_normal_ziggurat_block(size, self.prng)
+        pairs = (
+            _standard_normal_polar(self.prng) for _ in range((size + 1) // 2)
+        )
+        z = to_array(z_i for z_pair in pairs for z_i in z_pair)
+        return z[:size]
+
+
+def standard_normal(
+    prng=DEFAULT_PRNG,
+    crude=False,
+    pair=False,
+    size=None,
+    method="ziggurat",
+    cache=False,
+):
+    """
+    Generate a random variate from the Standard Normal Distribution
+
+    By default the ziggurat method is used. It looks up one of 128 precomputed
+    layers and accepts about 99% of variates with a single prn. The polar
+    method is also available, it generates normals two at a time and rejects
+    about 21% of attempts.
+
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param crude: Should the crude standard normal generator be used, defaults to False
+    :type crude: bool, optional
+    :param pair: Should a pair of standard normals be returned or only one,
+    defaults to False, i.e. only one number is returned
+    :type pair: bool, optional
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate or pair
+    :type size: int, optional
+    :param method: "ziggurat" or "polar", defaults to "ziggurat"
+    :type method: str, optional
+    :param cache: Should the polar method keep the unused second normal and
+    return it on the next call with the same prng, defaults to False
+    :type cache: bool, optional
+    :raises ValueError: occurs when method is not "ziggurat" or "polar"
+    :return: one or two standard normal random variates
+    :rtype: float or list of floats or array of floats
     """
-    normal_rv = standard_normal(prng=prng)
-    chi_sq_rv = chi_square(n, prng=prng)
-    return normal_rv / math.sqrt(chi_sq_rv / n)
+    if crude:
+        return standard_normal_crude(prng=prng, size=size)
+    dist = _frozen(StandardNormal, prng, method, cache)
+    if size is not None:
+        return dist.sample_n(size)
+    if pair:
+        return dist.sample_pair()
+    return dist.sample()
 
 
-def cauchy(prng=DEFAULT_PRNG):
+class Normal(Distribution):
     """
-    Generate a random variate from the Cauchy Distribution
+    Frozen Normal Distribution, see normal
 
-    The cauchy distribution is a generalization of the t distribution with 1
-    degree of freedom.
+    :param mu: mu or mean parameter of the Normal Distribution
+    :type mu: int or float
+    :param sigma: sigma or standard deviation parameter of the Normal
+    Distribution
+    :type sigma: int or float
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    """
+
+    __slots__ = ("mu", "sigma")
+
+    def __init__(self, mu, sigma, prng=DEFAULT_PRNG):
+        super().__init__(prng)
+        self.mu = mu
+        self.sigma = sigma
+
+    def sample(self, z=None):
+        """
+        Generate a random variate
+
+        :param z: Location on the standard normal distribution , defaults to
+        None. If None, a random number will be generated
+        :type z: float, optional
+        :return: random variate
+        :rtype: float
+        """
+        if z is None:
+            z = _standard_normal_ziggurat(self.prng)
+        return self.mu + (self.sigma * z)
 
+    def sample_n(self, size, z=None):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :param z: Locations on the standard normal distribution , defaults to
+        None. If None, random numbers will be generated
+        :type z: sequence of floats, optional
+        :raises ValueError: occurs when the number of z's does not match size
+        :return: random variates
+        :rtype: array of floats
+        """
+        if z is None:
+            z = _standard_normal_ziggurat_block(size, self.prng)
+        elif len(z) != size:
+            raise ValueError("Number of z's must match size")
+        if np is None:
+            return to_array(self.sample(z_i) for z_i in z)
+        return self.mu + (self.sigma * np.asarray(z, dtype=float))
+
+
+def normal(mu, sigma, z=None, prng=DEFAULT_PRNG, size=None):
+    """
+    Generate a random variate from the Normal Distribution
+
+    :param mu: mu or mean parameter of the Normal Distribution
+    :type mu: int or float
+    :param sigma: sigma or standard deviation parameter of the Normal
+    Distribution
+    :type sigma: int or float
+    :param z: Location on the standard normal distribution , defaults to None.
+    If None, a random number will be generated. A sequence of size locations
+    when size is given
+    :type z: float or sequence of floats, optional
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
-    :return: random variate from the Cauchy Distribution
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :return: Random Variate from the Normal Distribution
+    :rtype: float or array of floats
+    """
+    dist = _frozen(Normal, prng, mu, sigma)
+    if size is not None:
+        return dist.sample_n(size, z=z)
+    return dist.sample(z=z)
+
+
+def _polynomial(coefficients, x):
+    """
+    Evaluate a polynomial by Horner's method
+
+    :param coefficients: coefficients, highest power first
+    :type coefficients: sequence of floats
+    :param x: value, or array of values
+    :type x: float or numpy.ndarray
+    :return: value of the polynomial
+    :rtype: float or numpy.ndarray
+    """
+    total = 0.0
+    for coefficient in coefficients:
+        total = total * x + coefficient
+    return total
+
+
+def _normal_cdf(z):
+    """
+    CDF of the standard normal distribution
+
+    :param z: value
+    :type z: float
+    :return: probability of a standard normal variate at most z
     :rtype: float
     """
-    return t(1, prng=prng)
+    return 0.5 * math.erfc(-z / math.sqrt(2))
 
 
-def F(n, m, prng=DEFAULT_PRNG):
+def _normal_quantile(p):
     """
-    Generate a random variate from the F Distribution
+    Quantile (inverse CDF) of the standard normal distribution
 
-    Generates the random variate by taking the product of the ratio of two
-    chi-square random variates to their degrees of freedom (i.e. the number of
-    normal distributions that were squared to generate the chi-square random
-    variates, n parameter for each chi-square random variate).
+    Uses Wichura's AS241 rational approximations, accurate to about 1e-16.
 
-    :param n: number of standard normal distributions to square and sum for the
-    first chi-square random variate
-    :type n: int
-    :param m: number of standard normal distributions to square and sum for the
-    second chi-square random variate
-    :type m: int
+    :param p: probability, between 0 and 1
+    :type p: float
+    :return: z with a probability p of a standard normal variate at most z
+    :rtype: float
+    """
+    q = p - 0.5
+    if abs(q) <= 0.425:
+        r = 0.180625 - q * q
+        numerator, denominator = NORMAL_QUANTILE_CENTRAL
+        return q * _polynomial(numerator, r) / _polynomial(denominator, r)
+    tail = p if q < 0 else 1 - p
+    if tail <= 0:
+        return math.copysign(math.inf, q)
+    r = math.sqrt(-math.log(tail))
+    if r <= 5:
+        numerator, denominator = NORMAL_QUANTILE_TAIL
+        r -= 1.6
+    else:
+        numerator, denominator = NORMAL_QUANTILE_FAR_TAIL
+        r -= 5
+    z = _polynomial(numerator, r) / _polynomial(denominator, r)
+    return -z if q < 0 else z
+
+
+def _normal_quantile_block(p):
+    """
+    Quantile (inverse CDF) of the standard normal distribution of an array of
+    probabilities, see _normal_quantile
+
+    :param p: probabilities, between 0 and 1
+    :type p: numpy.ndarray
+    :return: quantiles
+    :rtype: numpy.ndarray
+    """
+    q = p - 0.5
+    r = 0.180625 - q * q
+    numerator, denominator = NORMAL_QUANTILE_CENTRAL
+    central = q * _polynomial(numerator, r) / _polynomial(denominator, r)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.sqrt(-np.log(np.minimum(p, 1 - p)))
+        near = r <= 5
+        numerator, denominator = NORMAL_QUANTILE_TAIL
+        z = _polynomial(numerator, r - 1.6) / _polynomial(denominator, r - 1.6)
+        numerator, denominator = NORMAL_QUANTILE_FAR_TAIL
+        far = _polynomial(numerator, r - 5) / _polynomial(denominator, r - 5)
+    z = np.where(near, z, far)
+    # p of 0 or 1 gives an infinite r, and a nan ratio
+    z[np.isinf(r)] = np.inf
+    return np.where(np.abs(q) <= 0.425, central, np.copysign(z, q))
+
+
+def _truncated_prns(u, low, high):
+    """
+    Map prn's from (0,1) into (low, high)
+
+    The mapped prn's are kept strictly between 0 and 1, since rounding can
+    take them to 1 and a prn of 0 maps to an infinite normal quantile.
+
+    :param u: prn, or array of prn's
+    :type u: float or numpy.ndarray
+    :param low: start of the interval
+    :type low: float
+    :param high: end of the interval
+    :type high: float
+    :return: mapped prn's
+    :rtype: float or numpy.ndarray
+    """
+    mapped = low + u * (high - low)
+    if isinstance(mapped, numbers.Real):
+        return min(max(mapped, ABOVE_ZERO), BELOW_ONE)
+    return np.clip(mapped, ABOVE_ZERO, BELOW_ONE)
+
+
+class TruncatedWeibull(Distribution):
+    """
+    Frozen Weibull Distribution truncated to [lower, upper], see
+    truncated_weibull
+
+    :param lam: lambda parameter of the Weibull distribution
+    :type lam: int or float greater than 0
+    :param b: beta parameter of the Weibull distribution
+    :type b: int or float greater than 0
+    :param lower: smallest value, defaults to 0
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
-    :return: random variate from the F Distribution
-    :rtype: float
+    :raises ValueError: occurs when lam or b is not greater than 0, lower is
+    less than 0 or lower is not less than upper
     """
-    return (chi_square(n, prng=prng) / n) * (chi_square(m, prng=prng) / m)
 
+    __slots__ = ("lam", "b", "lower", "upper", "_a", "_w", "_inv_lam", "_inv_b")
+
+    def __init__(self, lam, b, lower=0, upper=math.inf, prng=DEFAULT_PRNG):
+        if lam <= 0 or b <= 0:
+            raise ValueError("lam and b must be greater than 0")
+        if not 0 <= lower < upper:
+            raise ValueError("lower must be at least 0 and less than upper")
+        super().__init__(prng)
+        self.lam = lam
+        self.b = b
+        self.lower = lower
+        self.upper = upper
+        # cumulative hazards (lam * x) ** b of the bounds, and the probability
+        # of the interval given a variate above lower, 1 - exp(a - b_hazard),
+        # which stay accurate however far in the tail the interval is
+        self._a = (lam * lower) ** b
+        self._w = -math.expm1(self._a - (lam * upper) ** b)
+        self._inv_lam = 1 / lam
+        self._inv_b = 1 / b
+
+    def sample(self, u=None):
+        """
+        Generate a random variate
+
+        :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+        :type u: float
+        :return: random variate
+        :rtype: float
+        """
+        u = prn_handler(u=u, prng=self.prng)
+        hazard = self._a - math.log1p(-u * self._w)
+        return min(hazard**self._inv_b * self._inv_lam, self.upper)
 
-def standard_normal_crude(u=None, prng=DEFAULT_PRNG):
+    def sample_n(self, size, u=None, out=None):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :param u: psuedo random numbers, expected to come from the uniform(0,1)
+        distribution
+        :type u: sequence of floats
+        :param out: array to write the variates to, defaults to None, i.e. a
+        new array
+        :type out: numpy.ndarray or array.array, optional
+        :return: random variates
+        :rtype: array of floats
+        """
+        u = prn_block_handler(u=u, size=size, prng=self.prng)
+        if np is None:
+            return to_array((self.sample(u_i) for u_i in u), out=out)
+        x = np.multiply(u, -self._w, out=out)
+        np.log1p(x, out=x)
+        # the cumulative hazard of the variates
+        np.subtract(self._a, x, out=x)
+        np.power(x, self._inv_b, out=x)
+        x *= self._inv_lam
+        return np.minimum(x, self.upper, out=x)
+
+
+def truncated_weibull(
+    lam,
+    b,
+    lower=0,
+    upper=math.inf,
+    u=None,
+    prng=DEFAULT_PRNG,
+    size=None,
+    out=None,
+):
     """
-    Generate a random variate from the Standard Normal Distribution using the A&S Method
+    Generate a random variate from the Weibull Distribution truncated to
+    [lower, upper]
 
-    The A&S method is an approximate method for generating standard normal
-    random variates. This method approximates the inverse CDF of the normal
-    distribution. This method has an approximate  error of less than or equal
-    to .00045
+    Rather than rejecting variates outside of [lower, upper], u is mapped
+    into the part of the CDF between lower and upper and inverted once, so
+    every variate costs the same however small the probability of the
+    interval is. The inversion works with the cumulative hazard, so it stays
+    accurate far in the tail, e.g. for service times above an SLA.
 
-    :param u: psuedo random number, expected to come from the uniform(0,1) distribution
-    :type u: float
+    :param lam: lambda parameter of the Weibull distribution
+    :type lam: int or float greater than 0
+    :param b: beta parameter of the Weibull distribution
+    :type b: int or float greater than 0
+    :param lower: smallest value, defaults to 0
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
+    :param u: psuedo random number, expected to come from the uniform(0,1)
+    distribution. A sequence of size numbers when size is given
+    :type u: float or sequence of floats
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
-    :return: Random Variate from the Standard Normal Distribution
-    :rtype: float
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :param out: array to write the variates to when size is given, defaults
+    to None, i.e. a new array
+    :type out: numpy.ndarray or array.array, optional
+    :raises ValueError: occurs when lam or b is not greater than 0, lower is
+    less than 0 or lower is not less than upper
+    :return: random variate from the truncated Weibull Distribution
+    :rtype: float or array of floats
+    """
+    dist = _frozen(TruncatedWeibull, prng, lam, b, lower, upper)
+    if size is not None:
+        return dist.sample_n(size, u=u, out=out)
+    return dist.sample(u=u)
+
+
+class TruncatedExponential(TruncatedWeibull):
+    """
+    Frozen Exponential Distribution truncated to [lower, upper], see
+    truncated_exponential
+
+    :param lam: lambda parameter of the exponential distribution
+    :type lam: int or float greater than 0
+    :param lower: smallest value, defaults to 0
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when lam is not greater than 0, lower is less
+    than 0 or lower is not less than upper
     """
-    u = prn_handler(u=u, prng=prng)
 
-    def sign(x):
+    __slots__ = ()
+
+    def __init__(self, lam, lower=0, upper=math.inf, prng=DEFAULT_PRNG):
+        super().__init__(lam, 1, lower, upper, prng=prng)
+
+    def sample(self, u=None):
         """
-        Get the sign of a number
+        Generate a random variate
 
-        :param x: number to get the sign of
-        :type x: int or float
-        :return: 1,0, or -1 depending on the sign of x
-        :rtype: signed int
+        :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+        :type u: float
+        :return: random variate
+        :rtype: float
         """
-        if x > 0:
-            return 1
-        if x == 0:
-            return 0
-        return -1
-
-    t = abs((-math.log(min(u, 1 - u)) ** 2) ** (0.5))
-
-    c0 = 2.515517
-    c1 = 0.802853
-    c2 = 0.010328
-    d1 = 1.432788
-    d2 = 0.189269
-    d3 = 0.001308
-
-    return sign(u - 0.5) * (
-        t
-        - (
-            (c0 + (c1 * t) + (c2 * (t**2)))
-            / (1 + (d1 * t) + (d2 * (t**2)) + d3 * (t**3))
-        )
+        u = prn_handler(u=u, prng=self.prng)
+        x = self.lower - math.log1p(-u * self._w) * self._inv_lam
+        return min(x, self.upper)
+
+    def sample_n(self, size, u=None, out=None):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :param u: psuedo random numbers, expected to come from the uniform(0,1)
+        distribution
+        :type u: sequence of floats
+        :param out: array to write the variates to, defaults to None, i.e. a
+        new array
+        :type out: numpy.ndarray or array.array, optional
+        :return: random variates
+        :rtype: array of floats
+        """
+        u = prn_block_handler(u=u, size=size, prng=self.prng)
+        if np is None:
+            return to_array((self.sample(u_i) for u_i in u), out=out)
+        x = np.multiply(u, -self._w, out=out)
+        np.log1p(x, out=x)
+        x *= self._inv_lam
+        np.subtract(self.lower, x, out=x)
+        return np.minimum(x, self.upper, out=x)
+
+
+def truncated_exponential(
+    lam,
+    lower=0,
+    upper=math.inf,
+    u=None,
+    prng=DEFAULT_PRNG,
+    size=None,
+    out=None,
+):
+    """
+    Generate a random variate from the Exponential Distribution truncated to
+    [lower, upper]
+
+    Inverts the CDF restricted to [lower, upper] once per variate, see
+    truncated_weibull. By memorylessness, a variate above lower is lower plus
+    an exponential variate, so raising lower doesn't lose accuracy.
+
+    :param lam: lambda parameter of the exponential distribution
+    :type lam: int or float greater than 0
+    :param lower: smallest value, defaults to 0
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
+    :param u: psuedo random number, expected to come from the uniform(0,1)
+    distribution. A sequence of size numbers when size is given
+    :type u: float or sequence of floats
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :param out: array to write the variates to when size is given, defaults
+    to None, i.e. a new array
+    :type out: numpy.ndarray or array.array, optional
+    :raises ValueError: occurs when lam is not greater than 0, lower is less
+    than 0 or lower is not less than upper
+    :return: random variate from the truncated Exponential Distribution
+    :rtype: float or array of floats
+    """
+    dist = _frozen(TruncatedExponential, prng, lam, lower, upper)
+    if size is not None:
+        return dist.sample_n(size, u=u, out=out)
+    return dist.sample(u=u)
+
+
+class TruncatedTriangular(Distribution):
+    """
+    Frozen Triangular Distribution truncated to [lower, upper], see
+    truncated_triangular
+
+    :param minimum: minimum value
+    :type minimum: int or float
+    :param mode: mode
+    :type mode: int or float
+    :param maximum: maximum value
+    :type maximum: int or float
+    :param lower: smallest value, at least minimum
+    :type lower: int or float
+    :param upper: largest value, at most maximum
+    :type upper: int or float
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when the triangle is not valid, see Triangular,
+    or [lower, upper] is not a non-empty part of [minimum, maximum]
+    """
+
+    __slots__ = ("lower", "upper", "_triangular", "_low", "_high")
+
+    def __init__(self, minimum, mode, maximum, lower, upper, prng=DEFAULT_PRNG):
+        if not minimum <= lower < upper <= maximum:
+            raise ValueError(
+                "lower and upper must be between minimum and maximum and "
+                "lower must be less than upper"
+            )
+        super().__init__(prng)
+        self.lower = lower
+        self.upper = upper
+        self._triangular = Triangular(minimum, mode, maximum, prng=prng)
+        self._low = self._cdf(lower)
+        self._high = self._cdf(upper)
+
+    def _cdf(self, x):
+        """
+        CDF of the untruncated distribution
+
+        :param x: value between minimum and maximum
+        :type x: float
+        :return: probability of a variate at most x
+        :rtype: float
+        """
+        triangular = self._triangular
+        if x >= triangular.maximum:
+            return 1.0
+        if x < triangular.mode:
+            return (x - triangular.minimum) ** 2 / triangular._left
+        return 1 - (triangular.maximum - x) ** 2 / triangular._right
+
+    def sample(self, u=None):
+        """
+        Generate a random variate
+
+        :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+        :type u: float
+        :return: random variate
+        :rtype: float
+        """
+        u = prn_handler(u=u, prng=self.prng)
+        x = self._triangular.sample(_truncated_prns(u, self._low, self._high))
+        return min(max(x, self.lower), self.upper)
+
+    def sample_n(self, size, u=None, out=None):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :param u: psuedo random numbers, expected to come from the uniform(0,1)
+        distribution
+        :type u: sequence of floats
+        :param out: array to write the variates to, defaults to None, i.e. a
+        new array
+        :type out: numpy.ndarray or array.array, optional
+        :return: random variates
+        :rtype: array of floats
+        """
+        u = prn_block_handler(u=u, size=size, prng=self.prng)
+        if np is None:
+            return to_array((self.sample(u_i) for u_i in u), out=out)
+        u = _truncated_prns(u, self._low, self._high)
+        x = self._triangular.sample_n(size, u=u, out=out)
+        return np.clip(x, self.lower, self.upper, out=x)
+
+
+def truncated_triangular(
+    minimum,
+    mode,
+    maximum,
+    lower,
+    upper,
+    u=None,
+    prng=DEFAULT_PRNG,
+    size=None,
+    out=None,
+):
+    """
+    Generate a random variate from the Triangular Distribution truncated to
+    [lower, upper]
+
+    Inverts the CDF restricted to [lower, upper] once per variate, see
+    truncated_weibull.
+
+    :param minimum: minimum value
+    :type minimum: int or float
+    :param mode: mode
+    :type mode: int or float
+    :param maximum: maximum value
+    :type maximum: int or float
+    :param lower: smallest value, at least minimum
+    :type lower: int or float
+    :param upper: largest value, at most maximum
+    :type upper: int or float
+    :param u: psuedo random number, expected to come from the uniform(0,1)
+    distribution. A sequence of size numbers when size is given
+    :type u: float or sequence of floats
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :param out: array to write the variates to when size is given, defaults
+    to None, i.e. a new array
+    :type out: numpy.ndarray or array.array, optional
+    :raises ValueError: occurs when the triangle is not valid, see triangular,
+    or [lower, upper] is not a non-empty part of [minimum, maximum]
+    :return: random variate from the truncated Triangular Distribution
+    :rtype: float or array of floats
+    """
+    dist = _frozen(
+        TruncatedTriangular, prng, minimum, mode, maximum, lower, upper
     )
+    if size is not None:
+        return dist.sample_n(size, u=u, out=out)
+    return dist.sample(u=u)
 
 
-def standard_normal(prng=DEFAULT_PRNG, crude=False, pair=False):
+class TruncatedNormal(Distribution):
     """
-    Generate a random variate from the Standard Normal Distribution using the Polar Method
+    Frozen Normal Distribution truncated to [lower, upper], see
+    truncated_normal
 
+    :param mu: mu or mean parameter of the Normal Distribution
+    :type mu: int or float
+    :param sigma: sigma or standard deviation parameter of the Normal
+    Distribution
+    :type sigma: int or float greater than 0
+    :param lower: smallest value, defaults to -math.inf, i.e. no lower bound
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
-    :param crude: Should the crude standard normal generator be used, defaults to False
-    :type crude: bool, optional
-    :param pair: Should a pair of standard normals be returned or only one,
-    defaults to False, i.e. only one number is returned
-    :type pair: bool, optional
-    :return: one or two standard normal random variates
-    :rtype: float or list of floats
+    :raises ValueError: occurs when sigma is not greater than 0, lower is not
+    less than upper or the interval is too far in the tail to have a
+    probability greater than 0 in floating point
     """
-    if crude:
-        return standard_normal_crude(prng=prng)
-    w = 1
-    while w >= 1:
-        u = [prn_handler(u=None, prng=prng) for i in range(2)]
-        # center ui around 0:
-        v = []
-        for ui in u:
-            v.append((2 * ui) - 1)
-        w = sum([i**2 for i in v])
-    y = math.sqrt((-2 * math.log(w)) / w)
-    z = [i * y for i in v]
-    if pair:
-        return z
-    return z[0]
 
+    __slots__ = ("mu", "sigma", "lower", "upper", "_scale", "_low", "_high")
+
+    def __init__(
+        self, mu, sigma, lower=-math.inf, upper=math.inf, prng=DEFAULT_PRNG
+    ):
+        if sigma <= 0:
+            raise ValueError("sigma must be greater than 0")
+        if not lower < upper:
+            raise ValueError("lower must be less than upper")
+        super().__init__(prng)
+        self.mu = mu
+        self.sigma = sigma
+        self.lower = lower
+        self.upper = upper
+        alpha = (lower - mu) / sigma
+        beta = (upper - mu) / sigma
+        # the CDF is only accurate in the lower tail, so an interval above the
+        # mean is sampled as the mirror image of the one below it
+        self._scale = sigma
+        if alpha + beta > 0:
+            alpha, beta = -beta, -alpha
+            self._scale = -sigma
+        self._low = _normal_cdf(alpha)
+        self._high = _normal_cdf(beta)
+        if self._high <= self._low:
+            raise ValueError("the interval is too far in the tail to sample")
+
+    def sample(self, u=None):
+        """
+        Generate a random variate
+
+        :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+        :type u: float
+        :return: random variate
+        :rtype: float
+        """
+        u = prn_handler(u=u, prng=self.prng)
+        z = _normal_quantile(_truncated_prns(u, self._low, self._high))
+        return min(max(self.mu + self._scale * z, self.lower), self.upper)
 
-def normal(mu, sigma, z=None, prng=DEFAULT_PRNG):
+    def sample_n(self, size, u=None, out=None):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :param u: psuedo random numbers, expected to come from the uniform(0,1)
+        distribution
+        :type u: sequence of floats
+        :param out: array to write the variates to, defaults to None, i.e. a
+        new array
+        :type out: numpy.ndarray or array.array, optional
+        :return: random variates
+        :rtype: array of floats
+        """
+        u = prn_block_handler(u=u, size=size, prng=self.prng)
+        if np is None:
+            return to_array((self.sample(u_i) for u_i in u), out=out)
+        z = _normal_quantile_block(_truncated_prns(u, self._low, self._high))
+        x = np.multiply(z, self._scale, out=out)
+        x += self.mu
+        return np.clip(x, self.lower, self.upper, out=x)
+
+
+def truncated_normal(
+    mu,
+    sigma,
+    lower=-math.inf,
+    upper=math.inf,
+    u=None,
+    prng=DEFAULT_PRNG,
+    size=None,
+    out=None,
+):
     """
-    Generate a random variate from the Normal Distribution
+    Generate a random variate from the Normal Distribution truncated to
+    [lower, upper]
+
+    Inverts the CDF restricted to [lower, upper] once per variate, see
+    truncated_weibull, with math.erfc for the CDF and Wichura's AS241
+    approximation for its inverse. Intervals above the mean are sampled as the
+    mirror image of the interval below it, where the CDF is accurate, so
+    intervals up to about 37 standard deviations from the mean can be sampled.
 
     :param mu: mu or mean parameter of the Normal Distribution
     :type mu: int or float
     :param sigma: sigma or standard deviation parameter of the Normal
     Distribution
-    :type sigma: int or float
-    :param z: Location on the standard normal distribution , defaults to None.
-    If None, a random number will be generated
-    :type z: float, optional
+    :type sigma: int or float greater than 0
+    :param lower: smallest value, defaults to -math.inf, i.e. no lower bound
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
+    :param u: psuedo random number, expected to come from the uniform(0,1)
+    distribution. A sequence of size numbers when size is given
+    :type u: float or sequence of floats
     :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
     :type prng: builtin_function_or_method
-    :return: Random Variate from the Normal Distribution
-    :rtype: float
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :param out: array to write the variates to when size is given, defaults
+    to None, i.e. a new array
+    :type out: numpy.ndarray or array.array, optional
+    :raises ValueError: occurs when sigma is not greater than 0, lower is not
+    less than upper or the interval is too far in the tail to sample
+    :return: random variate from the truncated Normal Distribution
+    :rtype: float or array of floats
+    """
+    dist = _frozen(TruncatedNormal, prng, mu, sigma, lower, upper)
+    if size is not None:
+        return dist.sample_n(size, u=u, out=out)
+    return dist.sample(u=u)
+
+
+def _cholesky(cov):
+    """
+    Factor a positive definite matrix without numpy
+
+    :param cov: covariance matrix
+    :type cov: list of lists of floats
+    :raises ValueError: occurs when cov is not positive definite
+    :return: lower triangular L with L L^T = cov
+    :rtype: list of lists of floats
+    """
+    k = len(cov)
+    factor = [[0.0] * k for _ in range(k)]
+    for i in range(k):
+        for j in range(i + 1):
+            s = cov[i][j] - sum(factor[i][m] * factor[j][m] for m in range(j))
+            if i == j:
+                if s <= 0:
+                    raise ValueError(
+                        "cov must be positive definite without numpy"
+                    )
+                factor[i][i] = math.sqrt(s)
+            else:
+                factor[i][j] = s / factor[j][j]
+    return factor
+
+
+def _covariance_factor(cov):
+    """
+    Factor a covariance matrix
+
+    Positive definite matrices get their Cholesky factor. Semi-definite
+    matrices, which have no Cholesky factor, get V sqrt(W) from their
+    eigendecomposition V W V^T.
+
+    :param cov: covariance matrix
+    :type cov: numpy.ndarray or list of lists of floats
+    :raises ValueError: occurs when cov is not positive semi-definite
+    :return: matrix A with A A^T = cov
+    :rtype: numpy.ndarray or list of lists of floats
+    """
+    if np is None:
+        return _cholesky(cov)
+    try:
+        return np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(cov)
+    tolerance = max(eigenvalues.max(), 0) * len(cov) * np.finfo(float).eps
+    if eigenvalues.min() < -tolerance:
+        raise ValueError("cov must be positive semi-definite")
+    return eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+
+
+_COVARIANCE_FACTORS = OrderedDict()
+
+
+def covariance_factor(cov):
+    """
+    Get the factor of a covariance matrix, computing it only if needed
+
+    Factors are cached by the contents of the matrix, keeping the
+    COVARIANCE_FACTOR_CACHE_SIZE most recently used ones.
+
+    :param cov: covariance matrix
+    :type cov: numpy.ndarray or list of lists of floats
+    :raises ValueError: occurs when cov is not a symmetric positive
+    semi-definite matrix
+    :return: matrix A with A A^T = cov
+    :rtype: numpy.ndarray or list of lists of floats
+    """
+    if np is not None:
+        cov = np.asarray(cov, dtype=float)
+        if cov.ndim != 2 or cov.shape[0] != cov.shape[1]:
+            raise ValueError("cov must be a square matrix")
+        key = (cov.shape[0], cov.tobytes())
+    else:
+        cov = [[float(c) for c in row] for row in cov]
+        if any(len(row) != len(cov) for row in cov):
+            raise ValueError("cov must be a square matrix")
+        key = tuple(map(tuple, cov))
+    factor = _COVARIANCE_FACTORS.get(key)
+    if factor is not None:
+        _COVARIANCE_FACTORS.move_to_end(key)
+        return factor
+    symmetric = (
+        np.allclose(cov, cov.T)
+        if np is not None
+        else all(
+            math.isclose(row[j], cov[j][i], abs_tol=1e-12)
+            for i, row in enumerate(cov)
+            for j in range(i)
+        )
+    )
+    if not symmetric:
+        raise ValueError("cov must be symmetric")
+    factor = _covariance_factor(cov)
+    _COVARIANCE_FACTORS[key] = factor
+    if len(_COVARIANCE_FACTORS) > COVARIANCE_FACTOR_CACHE_SIZE:
+        _COVARIANCE_FACTORS.popitem(last=False)
+    return factor
+
+
+class MultivariateNormal(Distribution):
+    """
+    Frozen Multivariate Normal Distribution, see multivariate_normal
+
+    :param mean: mean vector
+    :type mean: sequence of floats
+    :param cov: covariance matrix
+    :type cov: sequence of sequences of floats
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when cov is not a symmetric positive
+    semi-definite matrix, or mean and cov have different sizes
+    """
+
+    __slots__ = ("mean", "factor")
+
+    def __init__(self, mean, cov, prng=DEFAULT_PRNG):
+        super().__init__(prng)
+        self.factor = covariance_factor(cov)
+        self.mean = (
+            np.asarray(mean, dtype=float)
+            if np is not None
+            else [float(m) for m in mean]
+        )
+        if len(self.mean) != len(self.factor):
+            raise ValueError("mean and cov must have the same size")
+
+    def sample(self):
+        """
+        Generate a random vector
+
+        :return: random vector
+        :rtype: numpy.ndarray or list of floats
+        """
+        return self.sample_n(1)[0]
+
+    def sample_n(self, size):
+        """
+        Generate random vectors
+
+        The vectors are one matrix multiply over a block of standard normals
+        from the ziggurat.
+
+        :param size: number of vectors to generate
+        :type size: int
+        :return: random vectors, one per row
+        :rtype: numpy.ndarray or list of lists of floats
+        """
+        k = len(self.mean)
+        z = _standard_normal_ziggurat_block(size * k, self.prng)
+        if np is not None:
+            return self.mean + z.reshape(size, k) @ self.factor.T
+        return [
+            [
+                mean_i + sum(a * z_j for a, z_j in zip(row, z[n : n + k]))
+                for mean_i, row in zip(self.mean, self.factor)
+            ]
+            for n in range(0, size * k, k)
+        ]
+
+
+def multivariate_normal(mean, cov, prng=DEFAULT_PRNG, size=None):
+    """
+    Generate a random vector from the Multivariate Normal Distribution
+
+    The covariance matrix is factored once, with Cholesky or, for
+    semi-definite matrices, an eigendecomposition, and the factor is cached
+    (see covariance_factor). Each vector is then the mean plus the factor
+    times a vector of standard normals.
+
+    :param mean: mean vector
+    :type mean: sequence of floats
+    :param cov: covariance matrix
+    :type cov: sequence of sequences of floats
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of vectors to generate, defaults to None. If given,
+    a matrix with one vector per row is returned instead of a single vector
+    :type size: int, optional
+    :raises ValueError: occurs when cov is not a symmetric positive
+    semi-definite matrix, or mean and cov have different sizes
+    :return: random vector or vectors from the Multivariate Normal
+    Distribution
+    :rtype: numpy.ndarray or list
+    """
+    dist = MultivariateNormal(mean, cov, prng=prng)
+    if size is not None:
+        return dist.sample_n(size)
+    return dist.sample()
+
+
+class AliasTable:
+    """
+    Walker/Vose alias table for sampling from a discrete distribution
+
+    Building the table takes O(k) time for k outcomes, after that each
+    variate takes O(1) time and a single prn, however many outcomes there are.
+
+    :param weights: relative probability of each outcome, the outcomes are
+    the indices 0 to k - 1
+    :type weights: sequence of ints or floats
+    :raises ValueError: occurs when weights is empty, a weight is negative or
+    all weights are 0
+    """
+
+    __slots__ = ("weights", "probability", "alias", "_probability", "_alias")
+
+    def __init__(self, weights):
+        k = len(weights)
+        total = math.fsum(weights)
+        if k == 0 or total <= 0 or min(weights) < 0:
+            raise ValueError(
+                "weights must be non-negative with at least one positive weight"
+            )
+        self.weights = weights
+        scaled = [w * k / total for w in weights]
+        small = [i for i, w in enumerate(scaled) if w < 1]
+        large = [i for i, w in enumerate(scaled) if w >= 1]
+        probability = [1.0] * k
+        alias = list(range(k))
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            probability[s] = scaled[s]
+            alias[s] = g
+            scaled[g] = (scaled[g] + scaled[s]) - 1
+            if scaled[g] < 1:
+                small.append(g)
+            else:
+                large.append(g)
+        # whatever is left over is 1 up to rounding error
+        self.probability = probability
+        self.alias = alias
+        if np is not None:
+            self._probability = np.array(probability)
+            self._alias = np.array(alias, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.alias)
+
+    def sample(self, u):
+        """
+        Get the outcome for a prn
+
+        :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+        :type u: float
+        :return: index of the outcome
+        :rtype: int
+        """
+        k = len(self.alias)
+        v = u * k
+        # u * k can round up to k when u is just below 1
+        i = min(int(v), k - 1)
+        if v - i < self.probability[i]:
+            return i
+        return self.alias[i]
+
+    def sample_block(self, u):
+        """
+        Get the outcomes for a block of prn's
+
+        :param u: psuedo random numbers, expected to come from the uniform(0,1)
+        distribution
+        :type u: numpy.ndarray or array.array
+        :return: index of the outcome for each prn
+        :rtype: array of ints
+        """
+        if np is None:
+            return to_array((self.sample(u_i) for u_i in u), "q")
+        k = len(self.alias)
+        v = u * k
+        i = np.minimum(v.astype(np.int64), k - 1)
+        return np.where(v - i < self._probability[i], i, self._alias[i])
+
+
+_ALIAS_TABLES = OrderedDict()
+
+
+def alias_table(weights):
+    """
+    Get the alias table for a weight vector, building it only if needed
+
+    Tables are cached by the identity of the weight vector, keeping the
+    ALIAS_TABLE_CACHE_SIZE most recently used ones, so finding the table
+    doesn't depend on the number of outcomes. A weight vector changed in
+    place keeps its old table: pass a new list instead, or build an
+    AliasTable or Discrete up front when the weights change.
+
+    :param weights: relative probability of each outcome
+    :type weights: sequence of ints or floats or AliasTable
+    :return: alias table for the weights
+    :rtype: AliasTable
+    """
+    if isinstance(weights, AliasTable):
+        return weights
+    key = id(weights)
+    table = _ALIAS_TABLES.get(key)
+    if table is not None and table.weights is weights:
+        _ALIAS_TABLES.move_to_end(key)
+        return table
+    table = AliasTable(weights)
+    _ALIAS_TABLES[key] = table
+    if len(_ALIAS_TABLES) > ALIAS_TABLE_CACHE_SIZE:
+        _ALIAS_TABLES.popitem(last=False)
+    return table
+
+
+class Discrete(Distribution):
+    """
+    Frozen Discrete Distribution, see discrete
+
+    :param weights: relative probability of each outcome, or an AliasTable
+    :type weights: sequence of ints or floats or AliasTable
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    """
+
+    __slots__ = ("table",)
+    typecode = "q"
+
+    def __init__(self, weights, prng=DEFAULT_PRNG):
+        super().__init__(prng)
+        self.table = alias_table(weights)
+
+    def sample(self, u=None):
+        """
+        Generate a random variate
+
+        :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+        :type u: float
+        :return: index of the outcome
+        :rtype: int
+        """
+        return self.table.sample(prn_handler(u=u, prng=self.prng))
+
+    def sample_n(self, size, u=None):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :param u: psuedo random numbers, expected to come from the uniform(0,1)
+        distribution
+        :type u: sequence of floats
+        :return: index of the outcome for each variate
+        :rtype: array of ints
+        """
+        u = prn_block_handler(u=u, size=size, prng=self.prng)
+        return self.table.sample_block(u)
+
+
+def discrete(weights, u=None, prng=DEFAULT_PRNG, size=None):
+    """
+    Generate a random variate from an arbitrary Discrete Distribution
+
+    Also known as the categorical distribution. Outcome i occurs with
+    probability weights[i] / sum(weights).
+
+    This implementation uses the Walker/Vose alias method: after an O(k)
+    setup each variate takes O(1) time and one prn, however many outcomes
+    there are. The alias table of the most recently used weight vectors is
+    cached by their identity, so pass a new list rather than changing one in
+    place, see alias_table.
+
+    :param weights: relative probability of each outcome, or an AliasTable
+    :type weights: sequence of ints or floats or AliasTable
+    :param u: psuedo random number, expected to come from the uniform(0,1)
+    distribution. A sequence of size numbers when size is given
+    :type u: float or sequence of floats
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :return: index of the outcome
+    :rtype: int or array of ints
     """
-    if z is None:
-        z = standard_normal(prng)
-    return mu + (math.sqrt(sigma) * z)
+    dist = Discrete(weights, prng=prng)
+    if size is not None:
+        return dist.sample_n(size, u=u)
+    return dist.sample(u=u)
@@ -0,0 +1,224 @@
+"""
+Count the prn's, variates and rejections of sampling, and time it
+"""
+
+import functools
+import time
+from contextlib import contextmanager
+
+from pydistribution import distributions
+from pydistribution.distributions import Distribution, prn_block_handler
+
+# methods of the frozen distributions that are instrumented, with the number
+# of variates each call generates
+_METHODS = {
+    "sample": lambda args, kwargs: 1,
+    "sample_pair": lambda args, kwargs: 2,
+    "sample_n": lambda args, kwargs: args[0] if args else kwargs["size"],
+}
+# statistics per distribution, kept until reset
+_STATS = {}
+# original methods, by class and name, while sampling is instrumented
+_ORIGINALS = {}
+# counting prng of each prng, reused so the prng's identity stays stable
+_PROXIES = {}
+# statistics of the outermost sampling call in progress
+_current = [None]
+
+
+class _CountingPRNG:
+    """
+    prng that counts the prn's drawn from the prng it wraps
+
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    """
+
+    __slots__ = ("prng", "stats")
+
+    def __init__(self, prng):
+        self.prng = prng
+        self.stats = None
+
+    def __call__(self):
+        self.stats["uniforms"] += 1
+        return self.prng()
+
+    def block(self, size):
+        """
+        Get the next size prn's as an array
+
+        :param size: number of prn's
+        :type size: int
+        :return: block of uniform(0,1) prn's
+        :rtype: numpy.ndarray or array.array
+        """
+        self.stats["uniforms"] += size
+        return prn_block_handler(u=None, size=size, prng=self.prng)
+
+
+def _new_stats():
+    """
+    Create the statistics of a distribution that hasn't been sampled yet
+
+    :return: statistics
+    :rtype: dict
+    """
+    return {
+        "calls": 0,
+        "variates": 0,
+        "uniforms": 0,
+        "rejections": 0,
+        "seconds": 0.0,
+    }
+
+
+def _count_rejections(count):
+    """
+    Add rejected attempts to the sampling call in progress
+
+    :param count: number of rejected attempts
+    :type count: int
+    """
+    if _current[0] is not None:
+        _current[0]["rejections"] += count
+
+
+def _instrumented(method, variates):
+    """
+    Wrap a sampling method to record its statistics
+
+    The prng of the frozen distribution is swapped for a counting prng during
+    the call. Calls made by another sampling call, e.g. the gamma variates of
+    negative_binomial, are recorded under the outermost distribution only.
+
+    :param method: sampling method
+    :type method: function
+    :param variates: function of the call's arguments that returns the number
+    of variates the call generates
+    :type variates: function
+    :return: instrumented method
+    :rtype: function
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        outer = _current[0]
+        if outer is None:
+            stats = _STATS.setdefault(type(self).__name__, _new_stats())
+            _current[0] = stats
+        else:
+            stats = outer
+        prng = self.prng
+        if not isinstance(prng, _CountingPRNG):
+            proxy = _PROXIES.get(prng)
+            if proxy is None:
+                proxy = _PROXIES[prng] = _CountingPRNG(prng)
+            proxy.stats = stats
+            self.prng = proxy
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.prng = prng
+            if outer is None:
+                _current[0] = None
+                stats["seconds"] += time.perf_counter() - start
+                stats["calls"] += 1
+                stats["variates"] += variates(args, kwargs)
+
+    return wrapper
+
+
+def _subclasses(cls):
+    """
+    Get every subclass of a class
+
+    :param cls: class
+    :type cls: type
+    :return: subclasses, direct or not
+    :rtype: list of types
+    """
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses += [subclass] + _subclasses(subclass)
+    return subclasses
+
+
+def enable():
+    """
+    Start recording statistics of sampling
+
+    Every frozen distribution defined so far, and so every distribution
+    function, is instrumented, except poisson with a sequence of lambdas.
+    Disabled instrumentation leaves the sampling methods untouched, so it
+    costs nothing. Instrumentation is not thread-safe.
+    """
+    if _ORIGINALS:
+        return
+    for cls in _subclasses(Distribution):
+        for name, variates in _METHODS.items():
+            if name in vars(cls):
+                method = vars(cls)[name]
+                _ORIGINALS[cls, name] = method
+                setattr(cls, name, _instrumented(method, variates))
+    distributions._rejection_hook = _count_rejections
+
+
+def disable():
+    """
+    Stop recording statistics of sampling and restore the sampling methods
+
+    The statistics recorded so far are kept, see snapshot and reset.
+    """
+    for (cls, name), method in _ORIGINALS.items():
+        setattr(cls, name, method)
+    _ORIGINALS.clear()
+    _PROXIES.clear()
+    distributions._rejection_hook = None
+
+
+def reset():
+    """
+    Forget the statistics recorded so far
+    """
+    _STATS.clear()
+
+
+def snapshot():
+    """
+    Get the statistics recorded so far
+
+    :return: statistics per distribution: the number of sampling calls,
+    variates generated, uniform prn's drawn from the prng, rejected attempts
+    of the rejection methods and seconds spent sampling, plus the uniforms
+    drawn per variate
+    :rtype: dict
+    """
+    snapshot = {}
+    for name, stats in _STATS.items():
+        snapshot[name] = dict(stats)
+        snapshot[name]["uniforms_per_variate"] = (
+            stats["uniforms"] / stats["variates"] if stats["variates"] else 0.0
+        )
+    return snapshot
+
+
+@contextmanager
+def instrument(clear=True):
+    """
+    Record statistics of the sampling done inside a with block
+
+    :param clear: whether to forget the statistics recorded before, defaults
+    to True
+    :type clear: bool, optional
+    :yield: snapshot function, to get the statistics inside or after the block
+    :rtype: function
+    """
+    if clear:
+        reset()
+    enable()
+    try:
+        yield snapshot
+    finally:
+        disable()
@@ -0,0 +1,117 @@
+"""
+Generate random variates in parallel, reproducibly
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from pydistribution.distributions import Distribution, np, to_array
+
+# number of variates generated from each independent stream
+DEFAULT_CHUNK = 65536
+
+
+def spawn_prng(seed, index):
+    """
+    Create the prng of one independent stream derived from a root seed
+
+    With numpy, the stream is a PCG64 generator seeded by the SeedSequence
+    spawned from the root seed with spawn key (index,), so the streams are
+    statistically independent. Without numpy, the stream is a
+    ``random.Random`` seeded by a hash of the root seed and the index.
+
+    :param seed: root seed
+    :type seed: int
+    :param index: index of the stream
+    :type index: int
+    :return: pseudo-random number generator function that generates
+    uniform(0,1) prn's
+    :rtype: builtin_function_or_method
+    """
+    if np is not None:
+        seed_seq = np.random.SeedSequence(seed, spawn_key=(index,))
+        return np.random.default_rng(seed_seq).random
+    return random.Random(f"{seed}/{index}").random
+
+
+def _sample_chunk(dist, params, seed, index, size):
+    """
+    Generate the variates of one chunk from its own stream
+
+    :param dist: distribution class or function
+    :type dist: type or function
+    :param params: parameters of the distribution
+    :type params: dict
+    :param seed: root seed
+    :type seed: int
+    :param index: index of the chunk, and of its stream
+    :type index: int
+    :param size: number of variates in the chunk
+    :type size: int
+    :return: random variates
+    :rtype: array of floats or ints
+    """
+    prng = spawn_prng(seed, index)
+    if isinstance(dist, type) and issubclass(dist, Distribution):
+        return dist(**params, prng=prng).sample_n(size)
+    return dist(**params, prng=prng, size=size)
+
+
+def sample_parallel(
+    dist, size, params=None, workers=None, seed=None, chunk=DEFAULT_CHUNK
+):
+    """
+    Generate random variates across a pool of processes
+
+    The variates are split into chunks of ``chunk`` variates. Chunk i is
+    generated from its own stream, ``spawn_prng(seed, i)``, whichever process
+    generates it, and the chunks are put back together in order. The result
+    is therefore the same for a given seed and chunk size whatever the number
+    of workers.
+
+    :param dist: distribution class, e.g. Weibull, or distribution function,
+    e.g. weibull
+    :type dist: type or function
+    :param size: number of variates to generate
+    :type size: int
+    :param params: parameters of the distribution, e.g. {"lam": 1, "b": 2},
+    defaults to None, i.e. no parameters
+    :type params: dict, optional
+    :param workers: number of processes, defaults to None, i.e. one per CPU.
+    With 1 worker the chunks are generated in this process
+    :type workers: int, optional
+    :param seed: root seed, defaults to None, i.e. a random root seed
+    :type seed: int, optional
+    :param chunk: number of variates per chunk, defaults to DEFAULT_CHUNK
+    :type chunk: int, optional
+    :raises ValueError: occurs when chunk is less than 1
+    :return: random variates
+    :rtype: numpy.ndarray or array.array
+    """
+    if chunk < 1:
+        raise ValueError("chunk must be at least 1")
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(128)
+    if params is None:
+        params = {}
+    sizes = [min(chunk, size - start) for start in range(0, size, chunk)]
+    args = (
+        [dist] * len(sizes),
+        [params] * len(sizes),
+        [seed] * len(sizes),
+        range(len(sizes)),
+        sizes,
+    )
+    if workers == 1:
+        chunks = list(map(_sample_chunk, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(_sample_chunk, *args))
+    if not chunks:
+        return to_array(())
+    if np is not None:
+        return np.concatenate(chunks)
+    variates = chunks[0]
+    for variates_chunk in chunks[1:]:
+        variates += variates_chunk
+    return variates
@@ -0,0 +1,864 @@
+"""
+Pseudo-random number generators and adapters for the prng argument
+"""
+
+import mmap
+import queue
+import sys
+import threading
+import warnings
+from array import array
+from datetime import datetime
+from itertools import islice
+
+from pydistribution.bulk import RAW_HEADER, RAW_MAGIC
+from pydistribution.distributions import np, prn_block_handler, to_array
+
+MASK_64 = (1 << 64) - 1
+
+
+class BufferedPRNG:
+    """
+    Hand out uniform(0,1) prn's one at a time from blocks drawn in bulk
+
+    Calling a numpy generator for a single number goes through all of numpy's
+    per-call overhead. This adapter draws ``block_size`` prn's at a time from
+    the source, checks that the whole block is between 0 and 1 once, and then
+    returns the prn's one per call. The prn's come out in the same order the
+    source would produce them, so a seeded source gives the same stream with
+    or without the buffer.
+
+    Instances can be passed as the ``prng`` argument of every function in
+    :mod:`pydistribution.distributions`.
+
+    :param source: pseudo-random number generator function that generates
+    uniform(0,1) prn's. Numpy generators (e.g. ``default_rng(42).random``) and
+    objects with a ``block(size)`` method are asked for whole blocks, any
+    other function is called once per prn
+    :type source: builtin_function_or_method
+    :param block_size: number of prn's to draw from the source at a time,
+    defaults to 65536
+    :type block_size: int, optional
+    :raises ValueError: occurs when block_size is less than 1
+    """
+
+    def __init__(self, source, block_size=65536):
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        self.source = source
+        self.block_size = block_size
+        self._buffer = iter(())
+        self._next = self._buffer.__next__
+
+    def _refill(self):
+        """
+        Replace the buffer with a new block of prn's from the source
+        """
+        u = prn_block_handler(u=None, size=self.block_size, prng=self.source)
+        self._buffer = iter(u.tolist())
+        self._next = self._buffer.__next__
+
+    def __call__(self):
+        """
+        Get the next prn
+
+        :return: uniform(0,1) prn
+        :rtype: float
+        """
+        try:
+            return self._next()
+        except StopIteration:
+            self._refill()
+            return self._next()
+
+    def block(self, size):
+        """
+        Get the next size prn's as an array
+
+        Buffered prn's are used first, the rest are drawn straight from the
+        source.
+
+        :param size: number of prn's to get
+        :type size: int
+        :return: block of uniform(0,1) prn's
+        :rtype: numpy.ndarray or array.array
+        """
+        buffered = list(islice(self._buffer, size))
+        if len(buffered) == size:
+            return to_array(buffered)
+        fresh = prn_block_handler(
+            u=None, size=size - len(buffered), prng=self.source
+        )
+        if np is not None:
+            return np.concatenate((buffered, fresh))
+        return to_array(buffered) + fresh
+
+
+class PrefetchingPRNG(BufferedPRNG):
+    """
+    Hand out uniform(0,1) prn's from blocks drawn ahead of time on a
+    background thread
+
+    A thread keeps up to ``blocks`` blocks of prn's from the source ready, so
+    drawing from a slow source (e.g. a cryptographic one or a file) overlaps
+    with the work done with the prn's. The overlap is largest for sources
+    that release the GIL, like numpy generators or file reads. Only the
+    thread draws from the source, so the prn's come out in the order the
+    source produces them, and the source must not be used elsewhere.
+
+    Several threads can share one instance: prn's are handed out without a
+    lock and only swapping in the next block takes one. Call close, or use the
+    instance as a context manager, to stop the thread.
+
+    :param source: pseudo-random number generator function that generates
+    uniform(0,1) prn's
+    :type source: builtin_function_or_method
+    :param block_size: number of prn's to draw from the source at a time,
+    defaults to 65536
+    :type block_size: int, optional
+    :param blocks: number of blocks to keep ready, defaults to 4
+    :type blocks: int, optional
+    :raises ValueError: occurs when block_size or blocks is less than 1
+    """
+
+    # put in the queue once the instance is closed, to wake waiting threads
+    _CLOSED = object()
+
+    def __init__(self, source, block_size=65536, blocks=4):
+        if blocks < 1:
+            raise ValueError("blocks must be at least 1")
+        super().__init__(source, block_size)
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=blocks)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _produce(self):
+        """
+        Draw blocks from the source until the instance is closed
+        """
+        while not self._stop.is_set():
+            try:
+                item = prn_block_handler(
+                    u=None, size=self.block_size, prng=self.source
+                ).tolist()
+            except Exception as error:  # pylint: disable=broad-except
+                # hand the error to the consumers, which raise it
+                item = error
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if isinstance(item, Exception):
+                return
+
+    def _refill(self):
+        """
+        Replace the buffer with the next block of prn's from the thread
+
+        :raises ValueError: occurs when the instance is closed
+        """
+        item = self._queue.get()
+        if item is self._CLOSED:
+            self._queue.put(item)
+            raise ValueError("PrefetchingPRNG is closed")
+        if isinstance(item, Exception):
+            self._queue.put(item)
+            raise item
+        self._buffer = iter(item)
+        self._next = self._buffer.__next__
+
+    def __call__(self):
+        """
+        Get the next prn
+
+        :return: uniform(0,1) prn
+        :rtype: float
+        """
+        next_prn = self._next
+        try:
+            return next_prn()
+        except StopIteration:
+            with self._lock:
+                # another thread may have swapped in a new block already
+                if self._next is next_prn:
+                    self._refill()
+            return self()
+
+    def block(self, size):
+        """
+        Get the next size prn's as an array
+
+        :param size: number of prn's to get
+        :type size: int
+        :return: block of uniform(0,1) prn's
+        :rtype: numpy.ndarray or array.array
+        """
+        with self._lock:
+            u = list(islice(self._buffer, size))
+            while len(u) < size:
+                self._refill()
+                u += islice(self._buffer, size - len(u))
+        return to_array(u)
+
+    def _drain(self):
+        """
+        Throw away the blocks in the queue
+        """
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def close(self):
+        """
+        Stop the thread and wait for it to finish
+
+        The prn's drawn ahead of time are thrown away, and getting prn's
+        afterwards raises a ValueError.
+        """
+        self._stop.set()
+        # empty the queue so the thread isn't stuck putting a block, then
+        # again for a block it put before it stopped
+        self._drain()
+        self._thread.join()
+        self._drain()
+        # wake a thread waiting for a block before taking the lock it holds
+        self._queue.put(self._CLOSED)
+        with self._lock:
+            self._buffer = iter(())
+            self._next = self._buffer.__next__
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RecordingPRNG:
+    """
+    Record every uniform(0,1) prn drawn from a prng to a file
+
+    The prn's are written in chunks as float64 after the same 32 byte header
+    as the raw files of pydistribution.bulk, and the header is updated with
+    every chunk, so the log is readable up to the last chunk even if the run
+    stops early. Replay the log with ReplayPRNG.
+
+    :param source: pseudo-random number generator function that generates
+    uniform(0,1) prn's
+    :type source: builtin_function_or_method
+    :param path: path of the log
+    :type path: str or os.PathLike
+    :param chunk: number of prn's written at a time, defaults to 65536
+    :type chunk: int, optional
+    :raises ValueError: occurs when chunk is less than 1
+    """
+
+    def __init__(self, source, path, chunk=65536):
+        if chunk < 1:
+            raise ValueError("chunk must be at least 1")
+        self.source = source
+        self.chunk = chunk
+        # number of prn's recorded, the position to seek to in the replay
+        self.position = 0
+        self._pending = array("d")
+        self._file = open(path, "wb")
+        self._write_header()
+
+    def _write_header(self):
+        """
+        Write the header with the number of prn's written so far
+        """
+        byteorder = "<" if sys.byteorder == "little" else ">"
+        written = self.position - len(self._pending)
+        self._file.seek(0)
+        self._file.write(
+            RAW_HEADER.pack(RAW_MAGIC, f"{byteorder}f8".encode(), written)
+        )
+        self._file.seek(0, 2)
+
+    def _write(self, u):
+        """
+        Write prn's to the log
+
+        :param u: prn's
+        :type u: array.array or numpy.ndarray
+        """
+        self._file.write(memoryview(u).cast("B"))
+        self._write_header()
+
+    def __call__(self):
+        """
+        Get the next prn
+
+        :return: uniform(0,1) prn
+        :rtype: float
+        """
+        u = self.source()
+        self._pending.append(u)
+        self.position += 1
+        if len(self._pending) >= self.chunk:
+            pending, self._pending = self._pending, array("d")
+            self._write(pending)
+        return u
+
+    def block(self, size):
+        """
+        Get the next size prn's as an array
+
+        :param size: number of prn's
+        :type size: int
+        :return: block of uniform(0,1) prn's
+        :rtype: numpy.ndarray or array.array
+        """
+        u = prn_block_handler(u=None, size=size, prng=self.source)
+        self.flush()
+        self.position += size
+        self._write(u)
+        return u
+
+    def flush(self):
+        """
+        Write the prn's that are waiting to be written
+        """
+        if self._pending:
+            pending, self._pending = self._pending, array("d")
+            self._write(pending)
+        self._file.flush()
+
+    def close(self):
+        """
+        Write the prn's that are waiting to be written and close the log
+        """
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ReplayPRNG:
+    """
+    Hand out the uniform(0,1) prn's recorded by RecordingPRNG, in order
+
+    The log is memory-mapped, so blocks are views of the file rather than
+    copies when numpy is installed, and replaying is much faster than
+    drawing from most prng's. Seek to a position recorded during the run,
+    e.g. RecordingPRNG.position at the start of a replication, to replay part
+    of it.
+
+    :param path: path of the log
+    :type path: str or os.PathLike
+    :param position: number of prn's to skip, defaults to 0
+    :type position: int, optional
+    :raises ValueError: occurs when the file is not a log of float64 prn's
+    with this machine's byte order
+    """
+
+    def __init__(self, path, position=0):
+        with open(path, "rb") as file:
+            magic, dtype, size = RAW_HEADER.unpack(file.read(RAW_HEADER.size))
+            byteorder = "<" if sys.byteorder == "little" else ">"
+            if magic != RAW_MAGIC or dtype.rstrip(b"\0") != (
+                f"{byteorder}f8".encode()
+            ):
+                raise ValueError(
+                    f"{path} is not a log of prn's from this machine"
+                )
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        end = RAW_HEADER.size + 8 * size
+        self._values = memoryview(self._mmap)[RAW_HEADER.size : end].cast("d")
+        self.size = size
+        self.seek(position)
+
+    def seek(self, position):
+        """
+        Go to a position in the log
+
+        :param position: number of prn's from the start of the log
+        :type position: int
+        :raises ValueError: occurs when position is not in the log
+        """
+        if not 0 <= position <= self.size:
+            raise ValueError(f"position must be between 0 and {self.size}")
+        self.position = position
+
+    def tell(self):
+        """
+        Get the position in the log
+
+        :return: number of prn's from the start of the log
+        :rtype: int
+        """
+        return self.position
+
+    getstate = tell
+    setstate = seek
+
+    def __len__(self):
+        return self.size
+
+    def __call__(self):
+        """
+        Get the next prn
+
+        :raises ValueError: occurs when every prn in the log has been used
+        :return: uniform(0,1) prn
+        :rtype: float
+        """
+        position = self.position
+        if position >= self.size:
+            raise ValueError("the log has no more prn's")
+        self.position = position + 1
+        return self._values[position]
+
+    def block(self, size):
+        """
+        Get the next size prn's as an array
+
+        :param size: number of prn's
+        :type size: int
+        :raises ValueError: occurs when the log has fewer than size prn's left
+        :return: block of uniform(0,1) prn's, read-only with numpy
+        :rtype: numpy.ndarray or array.array
+        """
+        position = self.position
+        if position + size > self.size:
+            raise ValueError("the log has no more prn's")
+        self.position = position + size
+        if np is not None:
+            return np.frombuffer(
+                self._mmap,
+                dtype=float,
+                count=size,
+                offset=RAW_HEADER.size + 8 * position,
+            )
+        u = array("d")
+        u.frombytes(self._values[position : position + size].cast("B"))
+        return u
+
+    def close(self):
+        """
+        Close the log
+
+        Arrays returned by block keep the log mapped until they are deleted.
+        """
+        self._values.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class LCG:
+    """
+    Linear Congruential Generator (LCG)
+
+    An LCG follows the form x_{n+1} = ((a * x_{n}) + c) mod m. Calling the
+    generator returns the next x / m, so it can be passed as the ``prng``
+    argument of every function in :mod:`pydistribution.distributions`.
+
+    The generator can skip ahead n values in O(log n) time and, with numpy,
+    generates blocks of values as arrays without a Python loop when m is at
+    most 2 ** 32 or exactly 2 ** 64.
+
+    :param seed: starting value, defaults to the current timestamp
+    :type seed: int, optional
+    :param a: multiplier
+    :type a: int
+    :param c: additive portion
+    :type c: int
+    :param mod: modulus, at most 2 ** 53 or a power of 2
+    :type mod: int
+    :raises TypeError: occurs when seed is not an integer
+    :raises ValueError: occurs when a, c or mod is not given, mod is less than
+    1, or mod is more than 2 ** 53 and not a power of 2
+    """
+
+    def __init__(self, seed=None, a=None, c=None, mod=None):
+        if seed is None:
+            seed = round(datetime.now().timestamp())
+        if not isinstance(seed, int):
+            raise TypeError("seed may only be an integer")
+        if a is None or c is None or mod is None:
+            raise ValueError("a, c and mod must be given")
+        if mod < 1:
+            raise ValueError("mod must be at least 1")
+        if mod > 2**53 and mod & (mod - 1):
+            raise ValueError("mod must be at most 2 ** 53 or a power of 2")
+        self.a = a % mod
+        self.c = c % mod
+        self.mod = mod
+        self.seed = seed
+        self.x = seed % mod
+        self._tables = {}
+
+    @property
+    def _vectorized(self):
+        """
+        Whether blocks are generated with numpy, checked on every block so it
+        follows the backend in use
+
+        :return: True when numpy is the backend and products fit in 64 bits
+        :rtype: bool
+        """
+        # numpy can only skip the Python loop when products fit in 64 bits
+        return np is not None and (self.mod <= 2**32 or self.mod == 2**64)
+
+    def getstate(self):
+        """
+        Get the state of the generator
+
+        :return: state that can be passed to setstate
+        :rtype: tuple
+        """
+        return (self.a, self.c, self.mod, self.x)
+
+    def setstate(self, state):
+        """
+        Restore a state returned by getstate
+
+        :param state: state of the generator
+        :type state: tuple
+        :raises ValueError: occurs when the state is from a generator with
+        different parameters
+        """
+        a, c, mod, x = state
+        if (a, c, mod) != (self.a, self.c, self.mod):
+            raise ValueError("state is from a generator with other parameters")
+        self.x = x
+
+    def next_int(self):
+        """
+        Advance the generator one step
+
+        :return: the new x
+        :rtype: int
+        """
+        self.x = (self.a * self.x + self.c) % self.mod
+        return self.x
+
+    def _to_uniform(self, x):
+        """
+        Turn an x into a uniform(0,1) prn
+
+        :param x: value of the generator
+        :type x: int
+        :return: uniform(0,1) prn
+        :rtype: float
+        """
+        if self.mod > 2**53:
+            # keep the top 53 bits so the prn can't round up to 1
+            return (x >> (self.mod.bit_length() - 54)) * 2.0**-53
+        return x / self.mod
+
+    def __call__(self):
+        """
+        Get the next prn
+
+        :return: uniform(0,1) prn
+        :rtype: float
+        """
+        return self._to_uniform(self.next_int())
+
+    def jump(self, n):
+        """
+        Skip ahead n steps in O(log n) time
+
+        Uses square-and-multiply on the affine map x -> a * x + c, so one
+        stream can be split into non-overlapping parts without generating the
+        values in between. A negative n steps back, through the inverse map
+        x -> a^-1 * (x - c), which needs a to be invertible mod m.
+
+        :param n: number of steps to skip, negative to step back
+        :type n: int
+        :raises ValueError: occurs when n is negative and a has no inverse
+        mod m
+        """
+        a, c, mod = self.a, self.c, self.mod
+        if n < 0:
+            try:
+                a = pow(a, -1, mod)
+            except ValueError:
+                raise ValueError(
+                    "can only step back when a is invertible mod m"
+                ) from None
+            c = (-a * c) % mod
+            n = -n
+        # (a_n, c_n) is the map for the steps taken so far
+        a_n, c_n = 1, 0
+        while n > 0:
+            if n & 1:
+                a_n, c_n = (a_n * a) % mod, (c_n * a + c) % mod
+            a, c = (a * a) % mod, (c * (a + 1)) % mod
+            n >>= 1
+        self.x = (a_n * self.x + c_n) % mod
+
+    def _block_tables(self, size):
+        """
+        Get the multipliers and increments that map x to each of the next
+        size values
+
+        :param size: number of values
+        :type size: int
+        :return: arrays A and C where the (j + 1)th next value is
+        (A[j] * x + C[j]) mod m
+        :rtype: tuple of numpy.ndarray
+        """
+        tables = self._tables.get(size)
+        if tables is not None:
+            return tables
+        multiplier = np.empty(size, dtype=np.uint64)
+        increment = np.empty(size, dtype=np.uint64)
+        multiplier[0] = self.a
+        increment[0] = self.c
+        k = 1
+        while k < size:
+            # doubling: the map k steps on from any value is the map of step k
+            n = min(k, size - k)
+            a_k = multiplier[k - 1 : k]
+            c_k = increment[k - 1 : k]
+            multiplier[k : k + n] = self._mod(multiplier[:n] * a_k)
+            increment[k : k + n] = self._mod(
+                self._mod(increment[:n] * a_k) + c_k
+            )
+            k += n
+        self._tables = {size: (multiplier, increment)}
+        return multiplier, increment
+
+    def _mod(self, x):
+        """
+        Reduce an array of uint64 values modulo m
+
+        :param x: values
+        :type x: numpy.ndarray
+        :return: x mod m
+        :rtype: numpy.ndarray
+        """
+        if self.mod == 2**64:
+            return x
+        return x % np.uint64(self.mod)
+
+    def block_ints(self, size):
+        """
+        Advance the generator size steps and get every x along the way
+
+        :param size: number of values
+        :type size: int
+        :return: the next size values of x
+        :rtype: numpy.ndarray or list of ints
+        """
+        if size == 0:
+            return np.empty(0, dtype=np.uint64) if self._vectorized else []
+        if not self._vectorized:
+            return [self.next_int() for _ in range(size)]
+        multiplier, increment = self._block_tables(size)
+        x = np.array([self.x], dtype=np.uint64)
+        x = self._mod(self._mod(multiplier * x) + increment)
+        self.x = int(x[-1])
+        return x
+
+    def block(self, size):
+        """
+        Get the next size prn's as an array
+
+        :param size: number of prn's
+        :type size: int
+        :return: block of uniform(0,1) prn's
+        :rtype: numpy.ndarray or array.array
+        """
+        x = self.block_ints(size)
+        if not self._vectorized:
+            return to_array(self._to_uniform(x_i) for x_i in x)
+        if self.mod > 2**53:
+            return (x >> np.uint64(self.mod.bit_length() - 54)) * 2.0**-53
+        return x / self.mod
+
+
+class MINSTD(LCG):
+    """
+    LCG that uses the MINSTD configuration of an LCG:
+    - a = 16807
+    - c = 0
+    - mod = (2 ^ 31) - 1
+
+    :param seed: starting value, defaults to the current timestamp
+    :type seed: int, optional
+    :raises ValueError: occurs when seed is not between 1 and (2 ^ 31) - 2
+    """
+
+    def __init__(self, seed=None):
+        m = (2**31) - 1
+        super().__init__(seed=seed, a=16807, c=0, mod=m)
+        if not 0 < self.x < m:
+            raise ValueError(f"seed must be between 1 and {m - 1}")
+
+
+class RANDU(LCG):
+    """
+    LCG that uses the RANDU configuration of an LCG:
+    - a = 65539
+    - c = 0
+    - mod = (2 ^ 31)
+
+    NOTE: RANDU is an example of a bad LCG. Do not use this in production.
+    This implementation of an LCG is for educational purposes only.
+
+    :param seed: starting value, must be odd, defaults to the current
+    timestamp made odd
+    :type seed: int, optional
+    :raises ValueError: occurs when seed is not odd
+    """
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = round(datetime.now().timestamp()) | 1
+        super().__init__(seed=seed, a=65539, c=0, mod=2**31)
+        if not self.x % 2:
+            raise ValueError("seed must be odd")
+        warnings.warn(
+            "RANDU is an example of an LCG with poor statistical properties. "
+            "Do not use this."
+        )
+
+
+class LCG64(LCG):
+    """
+    64 bit LCG with Knuth's MMIX multiplier and increment:
+    - a = 6364136223846793005
+    - c = 1442695040888963407
+    - mod = 2 ^ 64
+
+    The prn's are made from the top 53 bits of x.
+
+    :param seed: starting value, defaults to the current timestamp
+    :type seed: int, optional
+    """
+
+    def __init__(self, seed=None):
+        super().__init__(
+            seed=seed,
+            a=6364136223846793005,
+            c=1442695040888963407,
+            mod=2**64,
+        )
+
+
+class SplitMix64:
+    """
+    SplitMix64, a counter-based generator
+
+    The nth value is a bit-mixing function of seed + n * gamma (mod 2 ^ 64),
+    so skipping ahead takes O(1) time and blocks are generated as arrays
+    without a Python loop when numpy is installed. It passes BigCrush and is
+    much faster than the LCGs in pure Python.
+
+    :param seed: starting value, defaults to the current timestamp
+    :type seed: int, optional
+    :raises TypeError: occurs when seed is not an integer
+    """
+
+    GAMMA = 0x9E3779B97F4A7C15
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = round(datetime.now().timestamp())
+        if not isinstance(seed, int):
+            raise TypeError("seed may only be an integer")
+        self.seed = seed
+        self.counter = seed & MASK_64
+
+    def getstate(self):
+        """
+        Get the state of the generator
+
+        :return: state that can be passed to setstate
+        :rtype: int
+        """
+        return self.counter
+
+    def setstate(self, state):
+        """
+        Restore a state returned by getstate
+
+        :param state: state of the generator
+        :type state: int
+        """
+        self.counter = state
+
+    def next_int(self):
+        """
+        Advance the generator one step
+
+        :return: the next 64 bit value
+        :rtype: int
+        """
+        self.counter = z = (self.counter + self.GAMMA) & MASK_64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK_64
+        return z ^ (z >> 31)
+
+    def __call__(self):
+        """
+        Get the next prn
+
+        :return: uniform(0,1) prn
+        :rtype: float
+        """
+        return (self.next_int() >> 11) * 2.0**-53
+
+    def jump(self, n):
+        """
+        Skip ahead n steps in O(1) time
+
+        :param n: number of steps to skip
+        :type n: int
+        """
+        self.counter = (self.counter + n * self.GAMMA) & MASK_64
+
+    def block_ints(self, size):
+        """
+        Advance the generator size steps and get every value along the way
+
+        :param size: number of values
+        :type size: int
+        :return: the next size 64 bit values
+        :rtype: numpy.ndarray or list of ints
+        """
+        if np is None:
+            return [self.next_int() for _ in range(size)]
+        steps = np.arange(1, size + 1, dtype=np.uint64)
+        z = steps * np.uint64(self.GAMMA) + np.uint64(self.counter)
+        self.jump(size)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+    def block(self, size):
+        """
+        Get the next size prn's as an array
+
+        :param size: number of prn's
+        :type size: int
+        :return: block of uniform(0,1) prn's
+        :rtype: numpy.ndarray or array.array
+        """
+        z = self.block_ints(size)
+        if np is None:
+            return to_array((z_i >> 11) * 2.0**-53 for z_i in z)
+        return (z >> np.uint64(11)) * 2.0**-53
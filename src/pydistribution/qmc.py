@@ -0,0 +1,392 @@
+"""
+Quasi-random (low-discrepancy) sources of uniform(0,1) numbers
+
+Sobol and Halton sequences fill [0,1)^d more evenly than prn's, so averages
+over the variates they generate converge faster. Like the generators in
+pydistribution.prng, they can be passed as the ``prng`` argument of every
+function, and their blocks as the ``u`` argument of the inverse transform
+functions.
+"""
+
+import random
+from array import array
+
+from pydistribution.distributions import np
+
+# bits of the Sobol points, which limits a sequence to 2 ** SOBOL_BITS points
+SOBOL_BITS = 32
+# s, a and m_1, ..., m_s of dimensions 2, 3, ... of the Sobol sequence, from
+# S. Joe and F. Y. Kuo's new-joe-kuo-6.21201 direction numbers
+SOBOL_DIRECTIONS = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+    (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)),
+    (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)),
+)
+# points generated at a time for prn's asked for one at a time
+CACHE_POINTS = 1024
+
+
+def _primes(count):
+    """
+    Get the first primes
+
+    :param count: number of primes
+    :type count: int
+    :return: primes
+    :rtype: list of ints
+    """
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+class _QuasiRandom:
+    """
+    Base class for the low-discrepancy sequences
+
+    The sequence is used as a stream of numbers, point after point and
+    dimension after dimension within a point. A distribution that consumes
+    several prn's per variate, e.g. laplace, therefore gets one dimension per
+    prn when dimensions matches the number of prn's per variate.
+
+    :param dimensions: number of dimensions of the points
+    :type dimensions: int
+    :param skip: number of points skipped at the start
+    :type skip: int
+    :raises ValueError: occurs when dimensions is less than 1 or skip is less
+    than 0
+    """
+
+    # number of points in the sequence, None when it is unlimited
+    max_points = None
+
+    def __init__(self, dimensions, skip):
+        if dimensions < 1:
+            raise ValueError("dimensions must be at least 1")
+        if skip < 0:
+            raise ValueError("skip must be at least 0")
+        self.dimensions = dimensions
+        # position in the stream of numbers, point * dimensions + dimension
+        self.position = skip * dimensions
+        self._cache = None
+        self._cache_start = 0
+
+    def _points(self, start, count):
+        """
+        Generate consecutive points of the sequence
+
+        :param start: index of the first point
+        :type start: int
+        :param count: number of points
+        :type count: int
+        :return: the points' coordinates, point after point
+        :rtype: numpy.ndarray or list of floats
+        """
+        raise NotImplementedError
+
+    def getstate(self):
+        """
+        Get the state of the sequence
+
+        :return: state that can be passed to setstate
+        :rtype: int
+        """
+        return self.position
+
+    def setstate(self, state):
+        """
+        Restore a state returned by getstate
+
+        :param state: state of the sequence
+        :type state: int
+        """
+        self.position = state
+
+    def jump(self, n):
+        """
+        Skip ahead n points, i.e. n * dimensions numbers, in O(1) time
+
+        :param n: number of points to skip
+        :type n: int
+        """
+        self.position += n * self.dimensions
+
+    def __call__(self):
+        """
+        Get the next number
+
+        :return: uniform(0,1) number
+        :rtype: float
+        """
+        offset = self.position - self._cache_start
+        if self._cache is None or not 0 <= offset < len(self._cache):
+            point = self.position // self.dimensions
+            count = CACHE_POINTS
+            if self.max_points is not None:
+                # at least one point, so going past the end still raises
+                count = max(min(count, self.max_points - point), 1)
+            self._cache = self._points(point, count)
+            self._cache_start = point * self.dimensions
+            offset = self.position - self._cache_start
+        self.position += 1
+        return float(self._cache[offset])
+
+    def block(self, size):
+        """
+        Get the next size numbers as an array
+
+        :param size: number of numbers
+        :type size: int
+        :return: block of uniform(0,1) numbers
+        :rtype: numpy.ndarray or array.array
+        """
+        first = self.position // self.dimensions
+        last = -(-(self.position + size) // self.dimensions)
+        offset = self.position - first * self.dimensions
+        values = self._points(first, last - first)[offset : offset + size]
+        self.position += size
+        if np is None:
+            return array("d", values)
+        return values
+
+    def points(self, n):
+        """
+        Get the next n points
+
+        :param n: number of points
+        :type n: int
+        :raises ValueError: occurs when the sequence is part way through a
+        point
+        :return: points, one row per point, as a numpy array or a list of
+        lists
+        :rtype: numpy.ndarray or list
+        """
+        if self.position % self.dimensions:
+            raise ValueError("the sequence is part way through a point")
+        values = self.block(n * self.dimensions)
+        if np is not None:
+            return values.reshape(n, self.dimensions)
+        d = self.dimensions
+        return [list(values[i : i + d]) for i in range(0, len(values), d)]
+
+
+class Sobol(_QuasiRandom):
+    """
+    Sobol sequence
+
+    Uses Joe and Kuo's direction numbers and gray code order. Scrambling
+    applies a random linear matrix scramble and a random digital shift, which
+    keeps the sequence's balance and makes its points random.
+
+    :param dimensions: number of dimensions of the points, up to
+    len(SOBOL_DIRECTIONS) + 1, defaults to 1
+    :type dimensions: int, optional
+    :param scramble: whether to scramble the sequence, defaults to False
+    :type scramble: bool, optional
+    :param seed: seed of the scrambling, defaults to None, i.e. a random seed
+    :type seed: int, optional
+    :param skip: number of points skipped at the start, defaults to None, i.e.
+    1 when the sequence isn't scrambled, to skip the point at the origin,
+    which the inverse transform maps to infinity, and 0 when it is
+    :type skip: int, optional
+    :raises ValueError: occurs when dimensions is not between 1 and
+    len(SOBOL_DIRECTIONS) + 1
+    """
+
+    max_points = 2**SOBOL_BITS
+
+    def __init__(self, dimensions=1, scramble=False, seed=None, skip=None):
+        if dimensions > len(SOBOL_DIRECTIONS) + 1:
+            raise ValueError(
+                f"dimensions must be at most {len(SOBOL_DIRECTIONS) + 1}"
+            )
+        if skip is None:
+            skip = 0 if scramble else 1
+        super().__init__(dimensions, skip)
+        directions = [self._directions(j) for j in range(dimensions)]
+        shift = [0] * dimensions
+        if scramble:
+            rng = random.Random(seed)
+            directions = [self._scramble(v, rng) for v in directions]
+            shift = [rng.getrandbits(SOBOL_BITS) for _ in range(dimensions)]
+        # direction numbers by bit, then dimension
+        self._v = [list(v) for v in zip(*directions)]
+        self._shift = shift
+        if np is not None:
+            self._v = np.array(self._v, dtype=np.uint64)
+            self._shift = np.array(shift, dtype=np.uint64)
+
+    @staticmethod
+    def _directions(dimension):
+        """
+        Get the direction numbers of a dimension
+
+        :param dimension: index of the dimension, from 0
+        :type dimension: int
+        :return: direction numbers, one per bit of the point index
+        :rtype: list of ints
+        """
+        if dimension == 0:
+            return [1 << (SOBOL_BITS - 1 - k) for k in range(SOBOL_BITS)]
+        s, a, m = SOBOL_DIRECTIONS[dimension - 1]
+        v = [m[k] << (SOBOL_BITS - 1 - k) for k in range(s)]
+        for k in range(s, SOBOL_BITS):
+            v_k = v[k - s] ^ (v[k - s] >> s)
+            for j in range(1, s):
+                if (a >> (s - 1 - j)) & 1:
+                    v_k ^= v[k - j]
+            v.append(v_k)
+        return v
+
+    @staticmethod
+    def _scramble(directions, rng):
+        """
+        Apply a random linear matrix scramble to direction numbers
+
+        :param directions: direction numbers of a dimension
+        :type directions: list of ints
+        :param rng: random number generator of the scrambling
+        :type rng: random.Random
+        :return: scrambled direction numbers
+        :rtype: list of ints
+        """
+        # row r of a random lower triangular matrix with a unit diagonal,
+        # with the most significant bit as row 0
+        rows = [
+            (rng.getrandbits(r) << (SOBOL_BITS - r))
+            | (1 << (SOBOL_BITS - 1 - r))
+            for r in range(SOBOL_BITS)
+        ]
+        scrambled = []
+        for v in directions:
+            v_scrambled = 0
+            for r, row in enumerate(rows):
+                if bin(v & row).count("1") & 1:
+                    v_scrambled |= 1 << (SOBOL_BITS - 1 - r)
+            scrambled.append(v_scrambled)
+        return scrambled
+
+    def _points(self, start, count):
+        """
+        Generate consecutive points of the sequence
+
+        :param start: index of the first point
+        :type start: int
+        :param count: number of points
+        :type count: int
+        :raises ValueError: occurs when the points go past 2 ** SOBOL_BITS
+        :return: the points' coordinates, point after point
+        :rtype: numpy.ndarray or list of floats
+        """
+        if start + count > self.max_points:
+            raise ValueError(f"a Sobol sequence has 2 ** {SOBOL_BITS} points")
+        scale = 2.0**-SOBOL_BITS
+        if np is None:
+            values = []
+            for i in range(start, start + count):
+                gray = i ^ (i >> 1)
+                x = list(self._shift)
+                bit = 0
+                while gray:
+                    if gray & 1:
+                        x = [x_j ^ v_j for x_j, v_j in zip(x, self._v[bit])]
+                    gray >>= 1
+                    bit += 1
+                values += [x_j * scale for x_j in x]
+            return values
+        index = np.arange(start, start + count, dtype=np.uint64)
+        gray = index ^ (index >> np.uint64(1))
+        x = np.broadcast_to(self._shift, (count, self.dimensions)).copy()
+        # the gray codes have no more bits than the last index
+        for bit in range(int(start + count - 1).bit_length()):
+            has_bit = (gray >> np.uint64(bit)) & np.uint64(1)
+            x ^= has_bit[:, None] * self._v[bit]
+        return x.ravel() * scale
+
+
+class Halton(_QuasiRandom):
+    """
+    Halton sequence
+
+    Dimension j is the radical inverse of the point index in the jth prime
+    base. Scrambling permutes the non-zero digits of each base at random,
+    which breaks up the correlation between the dimensions of large bases.
+
+    :param dimensions: number of dimensions of the points, defaults to 1
+    :type dimensions: int, optional
+    :param scramble: whether to scramble the sequence, defaults to False
+    :type scramble: bool, optional
+    :param seed: seed of the scrambling, defaults to None, i.e. a random seed
+    :type seed: int, optional
+    :param skip: number of points skipped at the start, defaults to 1, to
+    skip the point at the origin
+    :type skip: int, optional
+    """
+
+    def __init__(self, dimensions=1, scramble=False, seed=None, skip=1):
+        super().__init__(dimensions, skip)
+        self.bases = _primes(dimensions)
+        self._permutations = [list(range(base)) for base in self.bases]
+        if scramble:
+            rng = random.Random(seed)
+            for permutation in self._permutations:
+                nonzero = permutation[1:]
+                rng.shuffle(nonzero)
+                permutation[1:] = nonzero
+        if np is not None:
+            self._permutations = [np.array(p) for p in self._permutations]
+
+    def _points(self, start, count):
+        """
+        Generate consecutive points of the sequence
+
+        :param start: index of the first point
+        :type start: int
+        :param count: number of points
+        :type count: int
+        :return: the points' coordinates, point after point
+        :rtype: numpy.ndarray or list of floats
+        """
+        if np is None:
+            values = []
+            for i in range(start, start + count):
+                for base, permutation in zip(self.bases, self._permutations):
+                    x, f, n = 0.0, 1 / base, i
+                    while n:
+                        n, digit = divmod(n, base)
+                        x += permutation[digit] * f
+                        f /= base
+                    values.append(x)
+            return values
+        x = np.zeros((count, self.dimensions))
+        for j, (base, permutation) in enumerate(
+            zip(self.bases, self._permutations)
+        ):
+            n = np.arange(start, start + count, dtype=np.int64)
+            f = 1 / base
+            while n.any():
+                n, digit = np.divmod(n, base)
+                x[:, j] += permutation[digit] * f
+                f /= base
+        return x.ravel()
@@ -0,0 +1,529 @@
+"""
+Sample by inverse transform from precomputed quantile tables
+
+For distributions without a closed-form inverse CDF, e.g. normal, chi_square
+and t, a QuantileTable inverts the reference CDF (see
+pydistribution.validation) once, at a dense grid of probabilities, and then
+samples by looking up u in the grid and interpolating. Each variate then
+costs a table lookup and a few multiplications, one prn, and works with
+supplied u's and quasi-random numbers like the other inverse transform
+functions.
+"""
+
+import math
+from array import array
+from collections import OrderedDict
+
+from pydistribution.distributions import (
+    DEFAULT_PRNG,
+    Distribution,
+    np,
+    prn_block_handler,
+    prn_handler,
+    to_array,
+)
+from pydistribution.validation import REFERENCES, SURVIVALS
+
+# intervals between the knots of the grid
+QUANTILE_KNOTS = 2048
+# log-odds, log(u / (1 - u)), at which the grid turns from uniform in u to
+# uniform in log(u); the knots are uniform in asinh(log-odds / spread), a
+# smooth function of u, so cubic interpolation stays accurate throughout
+QUANTILE_SPREAD = 4
+# deepest tail probability of the grid, as a power of 2, that of the smallest
+# prn of a 53 bit prng
+QUANTILE_TAIL_BITS = 53
+# transformed u of the last knot
+_GRID_LIMIT = math.asinh(math.log(2**QUANTILE_TAIL_BITS - 1) / QUANTILE_SPREAD)
+# number of quantile tables kept by tabulated for reuse
+QUANTILE_TABLE_CACHE_SIZE = 16
+# relative tolerance and iterations of the CDF inversion that builds a table
+INVERSION_TOLERANCE = 1e-14
+INVERSION_ITERATIONS = 200
+# ways to interpolate between the knots
+INTERPOLATIONS = ("linear", "cubic")
+
+
+def _invert(function, target, lo, hi):
+    """
+    Solve function(x) = target inside a bracket with the Illinois method,
+    bisecting whenever a step fails to halve the bracket
+
+    :param function: increasing function of x, e.g. a CDF
+    :type function: function
+    :param target: value to solve for
+    :type target: float
+    :param lo: value with function(lo) < target
+    :type lo: float
+    :param hi: value with function(hi) >= target
+    :type hi: float
+    :return: smallest x with function(x) >= target, to within a relative
+    INVERSION_TOLERANCE
+    :rtype: float
+    """
+    f_lo = function(lo) - target
+    f_hi = function(hi) - target
+    side = 0
+    slow = False
+    for _ in range(INVERSION_ITERATIONS):
+        width = hi - lo
+        if width <= INVERSION_TOLERANCE * max(abs(lo), abs(hi)):
+            break
+        if slow:
+            x = lo + width / 2
+        else:
+            x = (lo * f_hi - hi * f_lo) / (f_hi - f_lo)
+        if not lo < x < hi:
+            x = lo + width / 2
+            if not lo < x < hi:
+                break
+        f = function(x) - target
+        if f < 0:
+            lo, f_lo = x, f
+            if side == -1:
+                f_hi /= 2
+            side = -1
+        else:
+            hi, f_hi = x, f
+            if side == 1:
+                f_lo /= 2
+            side = 1
+        slow = hi - lo > width / 2
+    return hi
+
+
+class QuantileTable:
+    """
+    Table of the quantiles of a distribution, for sampling by lookup and
+    interpolation
+
+    The knots are uniform in asinh(log(u / (1 - u)) / QUANTILE_SPREAD) from
+    u = 2 ** -QUANTILE_TAIL_BITS to 1 - 2 ** -QUANTILE_TAIL_BITS: close to
+    uniform in u in the body, and in log(u) in the tails, where the quantiles
+    change fastest. u's beyond the last knots get the quantile of the last
+    knot. The upper half is inverted through the survival function (see
+    pydistribution.validation.SURVIVALS), so the upper tail is as accurate as
+    the lower. When the first knot is above 0, i.e. the support
+    is positive, log(x) is interpolated instead of x, so quantiles far below
+    1, e.g. about 1e-54 for gamma with shape 0.3, keep their relative
+    accuracy.
+
+    Building the table also inverts the CDF halfway between every pair of
+    knots, where interpolation is least accurate, and max_error is the
+    largest error found there, for each interpolation, relative to |x|. It
+    is an estimate of the error against the reference CDF, not a bound, and
+    includes none of the reference CDF's own error.
+
+    :param dist: distribution function with a continuous reference CDF,
+    e.g. normal, or its name
+    :type dist: function or str
+    :param params: parameters of the distribution, e.g. {"n": 5}, defaults to
+    None, i.e. no parameters
+    :type params: dict, optional
+    :raises ValueError: occurs when there is no continuous reference CDF and
+    survival function for dist
+    """
+
+    def __init__(self, dist, params=None):
+        name = getattr(dist, "__name__", dist)
+        reference = REFERENCES.get(name)
+        if (
+            reference is None
+            or reference["discrete"]
+            or "statistic" in reference
+            or name not in SURVIVALS
+        ):
+            raise ValueError(
+                f"no continuous reference CDF and survival function for {name}"
+            )
+        self.name = name
+        self.params = params or {}
+        reference_cdf = reference["cdf"]
+        reference_survival = SURVIVALS[name]
+        params = self.params
+
+        def cdf(x):
+            return reference_cdf(x, **params)
+
+        def negative_survival(x):
+            return -reference_survival(x, **params)
+
+        self._cdf = cdf
+        self._negative_survival = negative_survival
+        self.x = array("d", self._quantiles(range(QUANTILE_KNOTS + 1)))
+        # deep in the lower tail of a positive support x is close to a power
+        # of u, which log(x) follows closely between the knots and x doesn't
+        self._log = self.x[0] > 0
+        knots = array("d", map(math.log, self.x)) if self._log else self.x
+        secants = [b - a for a, b in zip(knots, knots[1:])]
+        slopes, square, cube = self._cubic(secants)
+        # the knots are the constant coefficients of both interpolations
+        self._coefficients = {
+            "linear": (knots, array("d", secants)),
+            "cubic": (knots, array("d", slopes), square, cube),
+        }
+        self._arrays = {}
+        midpoints = [j + 0.5 for j in range(QUANTILE_KNOTS)]
+        exact = self._quantiles(midpoints, self.x)
+        self.max_error = {}
+        for interpolation in INTERPOLATIONS:
+            self.max_error[interpolation] = max(
+                abs(self._interpolate(g, interpolation) - x) / (abs(x) or 1.0)
+                for g, x in zip(midpoints, exact)
+            )
+
+    def _equation(self, g):
+        """
+        Get the equation whose root is the quantile at a position of the grid
+
+        Below the median it is cdf(x) = u, and above it -survival(x) = u - 1,
+        with the tail probability 1 - u computed directly rather than
+        rounded from u.
+
+        :param g: position, from 0 to the index of the last knot
+        :type g: float
+        :return: increasing function of x and the value to solve for
+        :rtype: tuple
+        """
+        log_odds = QUANTILE_SPREAD * math.sinh(
+            (2 * g / QUANTILE_KNOTS - 1) * _GRID_LIMIT
+        )
+        if log_odds <= 0:
+            return self._cdf, 1 / (1 + math.exp(-log_odds))
+        return self._negative_survival, -1 / (1 + math.exp(log_odds))
+
+    def _quantiles(self, positions, knots=None):
+        """
+        Invert the CDF at increasing positions of the grid
+
+        Each inversion starts from the quantile before it, so the brackets
+        stay tight.
+
+        :param positions: increasing positions, from 0 to the index of the
+        last knot
+        :type positions: sequence of floats
+        :param knots: quantiles of the knots on either side of each position,
+        defaults to None, i.e. found by bracketing
+        :type knots: list of floats, optional
+        :return: quantiles
+        :rtype: list of floats
+        """
+        quantiles = []
+        for i, g in enumerate(positions):
+            function, target = self._equation(g)
+            if knots is not None:
+                lo, hi = knots[i], knots[i + 1]
+            elif not quantiles:
+                lo, hi = self._first_bracket(function, target)
+            else:
+                lo = quantiles[-1]
+                step = lo - quantiles[-2] if len(quantiles) > 1 else 1.0
+                step = max(step, abs(lo) * 1e-12, 1e-300)
+                hi = lo + step
+                while function(hi) < target:
+                    step *= 2
+                    hi = lo + step
+            if function(lo) >= target:
+                quantiles.append(lo)
+            else:
+                quantiles.append(_invert(function, target, lo, hi))
+        return quantiles
+
+    @staticmethod
+    def _first_bracket(function, target):
+        """
+        Bracket the quantile of the first knot
+
+        A quantile above 0 is bracketed geometrically, between x / 2 and x,
+        so one of a positive support, e.g. about 1e-54 for gamma with shape
+        0.3, is found to the same relative accuracy as the rest.
+
+        :param function: increasing function of x
+        :type function: function
+        :param target: value to solve for
+        :type target: float
+        :return: lo and hi with function(lo) < target <= function(hi)
+        :rtype: tuple
+        """
+        if function(0.0) >= target:
+            lo = -1.0
+            while function(lo) >= target:
+                lo *= 2
+            return lo, 0.0
+        hi = 1.0
+        while function(hi) < target:
+            hi *= 2
+        while hi / 2 > 0 and function(hi / 2) >= target:
+            hi /= 2
+        return hi / 2, hi
+
+    def _position(self, u):
+        """
+        Get the position of a probability in the grid
+
+        :param u: probability
+        :type u: float
+        :return: position, from 0 to the index of the last knot
+        :rtype: float
+        """
+        if u <= 0:
+            return 0.0
+        if u >= 1:
+            return float(QUANTILE_KNOTS)
+        log_odds = math.log(u) - math.log1p(-u)
+        g = (math.asinh(log_odds / QUANTILE_SPREAD) / _GRID_LIMIT + 1) * (
+            QUANTILE_KNOTS / 2
+        )
+        return min(max(g, 0.0), QUANTILE_KNOTS)
+
+    def _cubic(self, secants):
+        """
+        Get the coefficients of the monotone cubic Hermite interpolation
+        between the knots
+
+        The slopes at the knots are the harmonic means of the secants on
+        either side (Fritsch-Butland), so the interpolation is monotone like
+        the quantiles. The slopes at the first and last knots extrapolate
+        the secants next to them.
+
+        :param secants: differences between consecutive knots
+        :type secants: list of floats
+        :return: coefficients of f, f ** 2 and f ** 3 of each interval, where
+        f is the position within the interval
+        :rtype: tuple
+        """
+        slopes = [self._end_slope(secants[0], secants[1])]
+        for before, after in zip(secants, secants[1:]):
+            if before > 0 and after > 0:
+                slopes.append(2 * before * after / (before + after))
+            else:
+                slopes.append(0.0)
+        slopes.append(self._end_slope(secants[-1], secants[-2]))
+        square = []
+        cube = []
+        for i, secant in enumerate(secants):
+            square.append(3 * secant - 2 * slopes[i] - slopes[i + 1])
+            cube.append(slopes[i] + slopes[i + 1] - 2 * secant)
+        return slopes[:-1], array("d", square), array("d", cube)
+
+    @staticmethod
+    def _end_slope(secant, next_secant):
+        """
+        Get the slope at an end knot of the monotone cubic interpolation
+
+        :param secant: secant of the interval at the end
+        :type secant: float
+        :param next_secant: secant of the interval next to it
+        :type next_secant: float
+        :return: slope, between 0 and 3 * secant so the interpolation stays
+        monotone
+        :rtype: float
+        """
+        slope = (3 * secant - next_secant) / 2
+        return min(max(slope, 0.0), 3 * secant)
+
+    def quantile(self, u, interpolation="cubic"):
+        """
+        Get the quantile of a probability
+
+        :param u: probability, between 0 and 1
+        :type u: float
+        :param interpolation: "linear" or "cubic", defaults to "cubic"
+        :type interpolation: str, optional
+        :return: interpolated quantile
+        :rtype: float
+        """
+        return self._interpolate(self._position(u), interpolation)
+
+    def _interpolate(self, g, interpolation):
+        """
+        Interpolate the quantile at a position of the grid
+
+        :param g: position, from 0 to the index of the last knot
+        :type g: float
+        :param interpolation: "linear" or "cubic"
+        :type interpolation: str
+        :return: interpolated quantile
+        :rtype: float
+        """
+        i = min(int(g), QUANTILE_KNOTS - 1)
+        f = g - i
+        coefficients = self._coefficients[interpolation]
+        if len(coefficients) == 2:
+            knots, secants = coefficients
+            x = knots[i] + f * secants[i]
+        else:
+            knots, slopes, square, cube = coefficients
+            x = knots[i] + f * (slopes[i] + f * (square[i] + f * cube[i]))
+        return math.exp(x) if self._log else x
+
+    def quantile_n(self, u, interpolation="cubic"):
+        """
+        Get the quantiles of an array of probabilities
+
+        :param u: probabilities, between 0 and 1
+        :type u: numpy.ndarray or array.array
+        :param interpolation: "linear" or "cubic", defaults to "cubic"
+        :type interpolation: str, optional
+        :return: interpolated quantiles
+        :rtype: numpy.ndarray or array.array
+        """
+        if np is None:
+            return to_array(self.quantile(u_i, interpolation) for u_i in u)
+        u = np.asarray(u, dtype=float)
+        with np.errstate(divide="ignore"):
+            log_odds = np.log(u) - np.log1p(-u)
+        g = (np.arcsinh(log_odds / QUANTILE_SPREAD) / _GRID_LIMIT + 1) * (
+            QUANTILE_KNOTS / 2
+        )
+        g = np.clip(g, 0, QUANTILE_KNOTS)
+        i = np.minimum(g.astype(np.int64), QUANTILE_KNOTS - 1)
+        f = g - i
+        if interpolation not in self._arrays:
+            self._arrays[interpolation] = [
+                np.array(c) for c in self._coefficients[interpolation]
+            ]
+        coefficients = [c[i] for c in self._arrays[interpolation]]
+        if len(coefficients) == 2:
+            knots, secants = coefficients
+            x = knots + f * secants
+        else:
+            knots, slopes, square, cube = coefficients
+            x = knots + f * (slopes + f * (square + f * cube))
+        return np.exp(x) if self._log else x
+
+
+_QUANTILE_TABLES = OrderedDict()
+
+
+def quantile_table(dist, params=None):
+    """
+    Get the quantile table of a distribution, building it only if needed
+
+    Tables are cached by distribution and parameters, keeping the
+    QUANTILE_TABLE_CACHE_SIZE most recently used ones, so memory stays
+    bounded at about 80 KB per table, twice that once it has been sampled in
+    batches with numpy.
+
+    :param dist: distribution function with a continuous reference CDF,
+    e.g. normal, or its name
+    :type dist: function or str
+    :param params: parameters of the distribution, e.g. {"n": 5}, defaults to
+    None, i.e. no parameters
+    :type params: dict, optional
+    :raises ValueError: occurs when there is no continuous reference CDF and
+    survival function for dist
+    :return: quantile table
+    :rtype: QuantileTable
+    """
+    name = getattr(dist, "__name__", dist)
+    key = (name, tuple(sorted((params or {}).items())))
+    table = _QUANTILE_TABLES.get(key)
+    if table is not None:
+        _QUANTILE_TABLES.move_to_end(key)
+        return table
+    table = QuantileTable(name, params)
+    _QUANTILE_TABLES[key] = table
+    if len(_QUANTILE_TABLES) > QUANTILE_TABLE_CACHE_SIZE:
+        _QUANTILE_TABLES.popitem(last=False)
+    return table
+
+
+class Tabulated(Distribution):
+    """
+    Frozen distribution sampled from its quantile table, see tabulated
+
+    :param dist: distribution function with a continuous reference CDF,
+    e.g. normal, or its name
+    :type dist: function or str
+    :param params: parameters of the distribution, e.g. {"n": 5}, defaults to
+    None, i.e. no parameters
+    :type params: dict, optional
+    :param interpolation: "linear" or "cubic", defaults to "cubic"
+    :type interpolation: str, optional
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :raises ValueError: occurs when there is no continuous reference CDF and
+    survival function for dist or interpolation is not "linear" or "cubic"
+    """
+
+    __slots__ = ("table", "interpolation")
+
+    def __init__(
+        self, dist, params=None, interpolation="cubic", prng=DEFAULT_PRNG
+    ):
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError('interpolation must be "linear" or "cubic"')
+        super().__init__(prng)
+        self.table = quantile_table(dist, params)
+        self.interpolation = interpolation
+
+    def sample(self, u=None):
+        """
+        Generate a random variate
+
+        :param u: psuedo random number, expected to come from the uniform(0,1) distribution
+        :type u: float
+        :return: random variate
+        :rtype: float
+        """
+        u = prn_handler(u=u, prng=self.prng)
+        return self.table.quantile(u, self.interpolation)
+
+    def sample_n(self, size, u=None):
+        """
+        Generate an array of random variates
+
+        :param size: number of variates to generate
+        :type size: int
+        :param u: psuedo random numbers, expected to come from the uniform(0,1)
+        distribution
+        :type u: sequence of floats
+        :return: random variates
+        :rtype: array of floats
+        """
+        u = prn_block_handler(u=u, size=size, prng=self.prng)
+        return self.table.quantile_n(u, self.interpolation)
+
+
+def tabulated(
+    dist,
+    params=None,
+    interpolation="cubic",
+    u=None,
+    prng=DEFAULT_PRNG,
+    size=None,
+):
+    """
+    Generate a random variate by inverse transform from a quantile table
+
+    The table of the distribution and parameters is built the first time
+    they are sampled, see quantile_table. Its max_error gives the largest
+    error found while building it, e.g. about 1e-10 with cubic interpolation
+    and 7e-7 with linear interpolation for the normal distribution.
+
+    :param dist: distribution function with a continuous reference CDF,
+    e.g. normal, chi_square or t, or its name
+    :type dist: function or str
+    :param params: parameters of the distribution, e.g. {"n": 5}, defaults to
+    None, i.e. no parameters
+    :type params: dict, optional
+    :param interpolation: "linear" or "cubic", defaults to "cubic"
+    :type interpolation: str, optional
+    :param u: psuedo random number, expected to come from the uniform(0,1)
+    distribution. A sequence of size numbers when size is given
+    :type u: float or sequence of floats
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of variates to generate, defaults to None. If given,
+    an array of variates is returned instead of a single variate
+    :type size: int, optional
+    :raises ValueError: occurs when there is no continuous reference CDF and
+    survival function for dist or interpolation is not "linear" or "cubic"
+    :return: random variate
+    :rtype: float or array of floats
+    """
+    dist = Tabulated(dist, params, interpolation, prng=prng)
+    if size is not None:
+        return dist.sample_n(size, u=u)
+    return dist.sample(u=u)
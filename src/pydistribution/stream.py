@@ -0,0 +1,96 @@
+"""
+Generate random variates in chunks, for as long as they are asked for
+"""
+
+import inspect
+
+from pydistribution.distributions import DEFAULT_PRNG, Distribution, np
+from pydistribution.parallel import DEFAULT_CHUNK
+
+
+def _chunk_sampler(dist, params, prng):
+    """
+    Get a function that generates one chunk of variates
+
+    :param dist: distribution class or function
+    :type dist: type or function
+    :param params: parameters of the distribution
+    :type params: dict
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :return: function that takes a number of variates, and an array to write
+    them to when the distribution can, and returns an array of them
+    :rtype: function
+    """
+    if isinstance(dist, Distribution):
+        return dist.sample_n
+    if isinstance(dist, type) and issubclass(dist, Distribution):
+        return dist(**params, prng=prng).sample_n
+    if _writes_out(dist):
+        return lambda size, out=None: dist(
+            **params, prng=prng, size=size, out=out
+        )
+    return lambda size: dist(**params, prng=prng, size=size)
+
+
+def _writes_out(function):
+    """
+    Check whether a sampling function can write its variates to an array
+
+    :param function: sample_n method or distribution function
+    :type function: function
+    :return: whether the function takes an out array
+    :rtype: bool
+    """
+    return "out" in inspect.signature(function).parameters
+
+
+def stream(
+    dist, params=None, chunk=DEFAULT_CHUNK, prng=DEFAULT_PRNG, size=None
+):
+    """
+    Generate chunks of random variates for as long as they are asked for
+
+    Chunks are generated one at a time, as they are asked for, so memory stays
+    bounded however many variates are generated. With numpy, distributions
+    that can write their variates to an array, like the inverse transform
+    ones, write every chunk into the array of the first one, so a chunk is
+    overwritten by the next one; copy it to keep it. Other distributions, and
+    the pure python backend, return a new array for each chunk.
+
+    :param dist: distribution class, e.g. Weibull, frozen distribution, e.g.
+    Weibull(1, 2), or distribution function, e.g. weibull
+    :type dist: type, Distribution or function
+    :param params: parameters of the distribution, e.g. {"lam": 1, "b": 2},
+    defaults to None, i.e. no parameters. Ignored for a frozen distribution
+    :type params: dict, optional
+    :param chunk: number of variates per chunk, defaults to DEFAULT_CHUNK
+    :type chunk: int, optional
+    :param prng: pseudo-random number generator function that generates
+    uniform(0,1) prn's, defaults to DEFAULT_PRNG. Ignored for a frozen
+    distribution, which uses its own
+    :type prng: builtin_function_or_method, optional
+    :param size: total number of variates, defaults to None, i.e. no limit.
+    The last chunk is shorter when size isn't a multiple of chunk
+    :type size: int, optional
+    :raises ValueError: occurs when chunk is less than 1
+    :yield: chunks of random variates
+    :rtype: iter
+    """
+    if chunk < 1:
+        raise ValueError("chunk must be at least 1")
+    sample_n = _chunk_sampler(dist, params or {}, prng)
+    reuse = np is not None and _writes_out(sample_n)
+    buffer = None
+    remaining = size
+    while remaining is None or remaining > 0:
+        n = chunk if remaining is None else min(chunk, remaining)
+        if buffer is None:
+            variates = sample_n(n)
+            if reuse:
+                buffer = variates
+        else:
+            variates = sample_n(n, out=buffer[:n])
+        yield variates
+        if remaining is not None:
+            remaining -= n
@@ -0,0 +1,1642 @@
+"""
+Check random variates against their distribution in one pass, in constant
+memory
+
+A Validator keeps running moments and the counts of a fixed set of bins as
+chunks of variates go by, so memory stays bounded however many variates are
+checked. The bins are equiprobable under the distribution's reference CDF,
+and from their counts come a chi-square test and a binned
+Kolmogorov-Smirnov test. Validators with the same distribution, parameters
+and bins merge exactly, so each worker of a parallel run can check its own
+variates and the results can be combined afterwards.
+"""
+
+import math
+import random
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+from pydistribution import distributions
+from pydistribution.distributions import DEFAULT_PRNG, np
+from pydistribution.parallel import DEFAULT_CHUNK, spawn_prng
+from pydistribution.stream import stream
+
+# default number of equiprobable bins
+DEFAULT_BINS = 100
+# iterations and relative tolerance of the series and continued fractions of
+# the incomplete gamma and beta functions
+SPECIAL_ITERATIONS = 1000
+SPECIAL_EPSILON = 1e-15
+# smallest number the continued fractions divide by
+_TINY = 1e-300
+
+
+def _incomplete_gamma(a, x):
+    """
+    Regularized incomplete gamma functions P(a, x) and Q(a, x) = 1 - P(a, x)
+
+    Uses the series for x < a + 1 and the continued fraction otherwise, so
+    the smaller of the two is accurate.
+
+    :param a: parameter, greater than 0
+    :type a: float
+    :param x: upper limit of the integral, at least 0
+    :type x: float
+    :return: P(a, x) and Q(a, x)
+    :rtype: tuple
+    """
+    if x <= 0:
+        return 0.0, 1.0
+    if math.isinf(x):
+        return 1.0, 0.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1 / a
+        for k in range(1, SPECIAL_ITERATIONS):
+            term *= x / (a + k)
+            total += term
+            if abs(term) < abs(total) * SPECIAL_EPSILON:
+                break
+        p = total * math.exp(log_prefix)
+        return p, 1 - p
+    # modified Lentz's method
+    b = x + 1 - a
+    c = 1 / _TINY
+    d = 1 / b
+    h = d
+    for k in range(1, SPECIAL_ITERATIONS):
+        an = -k * (k - a)
+        b += 2
+        d = an * d + b
+        d = _TINY if abs(d) < _TINY else d
+        c = b + an / c
+        c = _TINY if abs(c) < _TINY else c
+        d = 1 / d
+        h *= d * c
+        if abs(d * c - 1) < SPECIAL_EPSILON:
+            break
+    q = math.exp(log_prefix) * h
+    return 1 - q, q
+
+
+def _beta_fraction(a, b, x):
+    """
+    Continued fraction of the regularized incomplete beta function
+
+    :param a: first parameter
+    :type a: float
+    :param b: second parameter
+    :type b: float
+    :param x: upper limit of the integral
+    :type x: float
+    :return: value of the continued fraction
+    :rtype: float
+    """
+    c = 1.0
+    d = 1 - (a + b) * x / (a + 1)
+    d = 1 / (_TINY if abs(d) < _TINY else d)
+    h = d
+    for m in range(1, SPECIAL_ITERATIONS):
+        m2 = 2 * m
+        for an in (
+            m * (b - m) * x / ((a + m2 - 1) * (a + m2)),
+            -(a + m) * (a + b + m) * x / ((a + m2) * (a + m2 + 1)),
+        ):
+            d = 1 + an * d
+            d = 1 / (_TINY if abs(d) < _TINY else d)
+            c = 1 + an / c
+            c = _TINY if abs(c) < _TINY else c
+            h *= d * c
+        if abs(d * c - 1) < SPECIAL_EPSILON:
+            break
+    return h
+
+
+def _incomplete_beta(a, b, x):
+    """
+    Regularized incomplete beta function I_x(a, b)
+
+    :param a: first parameter, greater than 0
+    :type a: float
+    :param b: second parameter, greater than 0
+    :type b: float
+    :param x: upper limit of the integral, between 0 and 1
+    :type x: float
+    :return: I_x(a, b)
+    :rtype: float
+    """
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    log_prefix = (
+        math.lgamma(a + b)
+        - math.lgamma(a)
+        - math.lgamma(b)
+        + a * math.log(x)
+        + b * math.log1p(-x)
+    )
+    # the continued fraction converges quickly on the side of the mean
+    if x < (a + 1) / (a + b + 2):
+        return math.exp(log_prefix) * _beta_fraction(a, b, x) / a
+    return 1 - math.exp(log_prefix) * _beta_fraction(b, a, 1 - x) / b
+
+
+def _normal_cdf(x, mu=0, sigma=1):
+    """
+    CDF of the Normal Distribution
+
+    :param x: value
+    :type x: float
+    :param mu: mu or mean parameter, defaults to 0
+    :type mu: int or float, optional
+    :param sigma: sigma or standard deviation parameter, defaults to 1
+    :type sigma: int or float greater than 0, optional
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    return 0.5 * math.erfc((mu - x) / (sigma * math.sqrt(2)))
+
+
+def _weibull_cdf(x, lam, b):
+    """
+    CDF of the Weibull Distribution
+
+    :param x: value
+    :type x: float
+    :param lam: lambda parameter of the Weibull distribution
+    :type lam: int or float greater than 0
+    :param b: beta parameter of the Weibull distribution
+    :type b: int or float greater than 0
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    return -math.expm1(-((lam * x) ** b)) if x > 0 else 0.0
+
+
+def _exponential_cdf(x, lam):
+    """
+    CDF of the Exponential Distribution
+
+    :param x: value
+    :type x: float
+    :param lam: lambda parameter of the exponential distribution
+    :type lam: int or float greater than 0
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    return _weibull_cdf(x, lam, 1)
+
+
+def _laplace_cdf(x, mu, b):
+    """
+    CDF of the Laplace Distribution
+
+    :param x: value
+    :type x: float
+    :param mu: central location of the distribution
+    :type mu: int or float
+    :param b: denominator of the lambda parameter for the exponentials
+    :type b: int or float greater than 0
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    if x < mu:
+        return 0.5 * math.exp((x - mu) / b)
+    return 1 - 0.5 * math.exp((mu - x) / b)
+
+
+def _triangular_cdf(x, minimum, mode, maximum):
+    """
+    CDF of the Triangular Distribution
+
+    :param x: value
+    :type x: float
+    :param minimum: minimum value
+    :type minimum: int or float
+    :param mode: mode
+    :type mode: int or float
+    :param maximum: maximum value
+    :type maximum: int or float
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    if x <= minimum:
+        return 0.0
+    if x >= maximum:
+        return 1.0
+    width = maximum - minimum
+    if x <= mode:
+        return (x - minimum) ** 2 / (width * (mode - minimum))
+    return 1 - (maximum - x) ** 2 / (width * (maximum - mode))
+
+
+def _bernoulli_cdf(x, p):
+    """
+    CDF of the Bernoulli Distribution
+
+    :param x: value
+    :type x: float
+    :param p: probability of a success
+    :type p: float
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    if x < 0:
+        return 0.0
+    return 1 - p if x < 1 else 1.0
+
+
+def _geometric_cdf(x, p):
+    """
+    CDF of the Geometric Distribution
+
+    :param x: value
+    :type x: float
+    :param p: probability of a success
+    :type p: float
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    k = math.floor(x)
+    return -math.expm1(k * math.log1p(-p)) if k >= 1 else 0.0
+
+
+def _poisson_cdf(x, lam):
+    """
+    CDF of the Poisson Distribution
+
+    :param x: value
+    :type x: float
+    :param lam: lambda parameter
+    :type lam: int or float, at least 0
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    k = math.floor(x)
+    return _incomplete_gamma(k + 1, lam)[1] if k >= 0 else 0.0
+
+
+def _binomial_cdf(x, n, p):
+    """
+    CDF of the Binomial Distribution
+
+    :param x: value
+    :type x: float
+    :param n: number of bernoulli trials
+    :type n: int
+    :param p: probability of a success
+    :type p: float
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    k = math.floor(x)
+    if k < 0:
+        return 0.0
+    if k >= n:
+        return 1.0
+    return _incomplete_beta(n - k, k + 1, 1 - p)
+
+
+def _gamma_cdf(x, shape, scale=1):
+    """
+    CDF of the Gamma Distribution
+
+    :param x: value
+    :type x: float
+    :param shape: shape parameter, greater than 0
+    :type shape: int or float
+    :param scale: scale parameter, defaults to 1
+    :type scale: int or float, optional
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    return _incomplete_gamma(shape, x / scale)[0] if x > 0 else 0.0
+
+
+def _erlang_cdf(x, lam, n):
+    """
+    CDF of the Erlang Distribution
+
+    :param x: value
+    :type x: float
+    :param lam: lambda parameter
+    :type lam: int or float
+    :param n: number of exponential variates summed
+    :type n: int
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    return _gamma_cdf(x, n, 1 / lam)
+
+
+def _negative_binomial_cdf(x, n, p):
+    """
+    CDF of the Negative Binomial Distribution
+
+    :param x: value
+    :type x: float
+    :param n: number of successes
+    :type n: int
+    :param p: probability of a success
+    :type p: float
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    # the variates count the trials, so x - n of them are failures
+    failures = math.floor(x) - n
+    return _incomplete_beta(n, failures + 1, p) if failures >= 0 else 0.0
+
+
+def _chi_square_cdf(x, n):
+    """
+    CDF of the Chi-Square Distribution
+
+    :param x: value
+    :type x: float
+    :param n: degrees of freedom
+    :type n: int
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    return _gamma_cdf(x, n / 2, 2)
+
+
+def _t_cdf(x, n):
+    """
+    CDF of the Student's t Distribution
+
+    :param x: value
+    :type x: float
+    :param n: degrees of freedom
+    :type n: int
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    tail = 0.5 * _incomplete_beta(n / 2, 0.5, n / (n + x * x))
+    return 1 - tail if x > 0 else tail
+
+
+def _cauchy_cdf(x):
+    """
+    CDF of the Cauchy Distribution
+
+    :param x: value
+    :type x: float
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    # the angle of (-x, 1) keeps the lower tail accurate
+    return math.atan2(1, -x) / math.pi
+
+
+def _f_cdf(x, n, m):
+    """
+    CDF of the F Distribution
+
+    :param x: value
+    :type x: float
+    :param n: degrees of freedom of the numerator
+    :type n: int
+    :param m: degrees of freedom of the denominator
+    :type m: int
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    return _incomplete_beta(n / 2, m / 2, n * x / (n * x + m)) if x > 0 else 0.0
+
+
+def _standard_normal_cdf(x, method=None, cache=None, pair=None):
+    """
+    CDF of the Standard Normal Distribution
+
+    :param x: value
+    :type x: float
+    :param method: ignored, accepted so the parameters of standard_normal
+    can be passed
+    :type method: str, optional
+    :param cache: ignored, see method
+    :type cache: bool, optional
+    :param pair: ignored, see method
+    :type pair: bool, optional
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    return _normal_cdf(x)
+
+
+def _discrete_cdf(x, weights):
+    """
+    CDF of the Discrete Distribution
+
+    :param x: value
+    :type x: float
+    :param weights: relative probability of each outcome, or an AliasTable
+    :type weights: sequence of ints or floats or AliasTable
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    weights = getattr(weights, "weights", weights)
+    k = math.floor(x)
+    if k < 0:
+        return 0.0
+    return math.fsum(weights[: k + 1]) / math.fsum(weights)
+
+
+def _normal_survival(x, mu=0, sigma=1):
+    """
+    Survival function of the Normal Distribution
+
+    :param x: value
+    :type x: float
+    :param mu: mu or mean parameter, defaults to 0
+    :type mu: int or float, optional
+    :param sigma: sigma or standard deviation parameter, defaults to 1
+    :type sigma: int or float greater than 0, optional
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    return 0.5 * math.erfc((x - mu) / (sigma * math.sqrt(2)))
+
+
+def _weibull_survival(x, lam, b):
+    """
+    Survival function of the Weibull Distribution
+
+    :param x: value
+    :type x: float
+    :param lam: lambda parameter of the Weibull distribution
+    :type lam: int or float greater than 0
+    :param b: beta parameter of the Weibull distribution
+    :type b: int or float greater than 0
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    return math.exp(-((lam * x) ** b)) if x > 0 else 1.0
+
+
+def _exponential_survival(x, lam):
+    """
+    Survival function of the Exponential Distribution
+
+    :param x: value
+    :type x: float
+    :param lam: lambda parameter of the exponential distribution
+    :type lam: int or float greater than 0
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    return _weibull_survival(x, lam, 1)
+
+
+def _laplace_survival(x, mu, b):
+    """
+    Survival function of the Laplace Distribution
+
+    :param x: value
+    :type x: float
+    :param mu: central location of the distribution
+    :type mu: int or float
+    :param b: denominator of the lambda parameter for the exponentials
+    :type b: int or float greater than 0
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    return _laplace_cdf(2 * mu - x, mu, b)
+
+
+def _triangular_survival(x, minimum, mode, maximum):
+    """
+    Survival function of the Triangular Distribution
+
+    :param x: value
+    :type x: float
+    :param minimum: minimum value
+    :type minimum: int or float
+    :param mode: mode
+    :type mode: int or float
+    :param maximum: maximum value
+    :type maximum: int or float
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    # the mirror image of the triangle has the upper tail as its lower tail
+    mirror = minimum + maximum
+    return _triangular_cdf(mirror - x, minimum, mirror - mode, maximum)
+
+
+def _gamma_survival(x, shape, scale=1):
+    """
+    Survival function of the Gamma Distribution
+
+    :param x: value
+    :type x: float
+    :param shape: shape parameter, greater than 0
+    :type shape: int or float
+    :param scale: scale parameter, defaults to 1
+    :type scale: int or float, optional
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    return _incomplete_gamma(shape, x / scale)[1] if x > 0 else 1.0
+
+
+def _erlang_survival(x, lam, n):
+    """
+    Survival function of the Erlang Distribution
+
+    :param x: value
+    :type x: float
+    :param lam: lambda parameter
+    :type lam: int or float
+    :param n: number of exponential variates summed
+    :type n: int
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    return _gamma_survival(x, n, 1 / lam)
+
+
+def _chi_square_survival(x, n):
+    """
+    Survival function of the Chi-Square Distribution
+
+    :param x: value
+    :type x: float
+    :param n: degrees of freedom
+    :type n: int
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    return _gamma_survival(x, n / 2, 2)
+
+
+def _t_survival(x, n):
+    """
+    Survival function of the Student's t Distribution
+
+    :param x: value
+    :type x: float
+    :param n: degrees of freedom
+    :type n: int
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    return _t_cdf(-x, n)
+
+
+def _cauchy_survival(x):
+    """
+    Survival function of the Cauchy Distribution
+
+    :param x: value
+    :type x: float
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    return _cauchy_cdf(-x)
+
+
+def _f_survival(x, n, m):
+    """
+    Survival function of the F Distribution
+
+    :param x: value
+    :type x: float
+    :param n: degrees of freedom of the numerator
+    :type n: int
+    :param m: degrees of freedom of the denominator
+    :type m: int
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    return _incomplete_beta(m / 2, n / 2, m / (n * x + m)) if x > 0 else 1.0
+
+
+def _standard_normal_survival(x, method=None, cache=None, pair=None):
+    """
+    Survival function of the Standard Normal Distribution
+
+    :param x: value
+    :type x: float
+    :param method: ignored, accepted so the parameters of standard_normal
+    can be passed
+    :type method: str, optional
+    :param cache: ignored, see method
+    :type cache: bool, optional
+    :param pair: ignored, see method
+    :type pair: bool, optional
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    return _normal_survival(x)
+
+
+def _weibull_moments(lam, b):
+    """
+    Mean and variance of the Weibull Distribution
+
+    :param lam: lambda parameter of the Weibull distribution
+    :type lam: int or float greater than 0
+    :param b: beta parameter of the Weibull distribution
+    :type b: int or float greater than 0
+    :return: mean and variance, None where they don't exist
+    :rtype: tuple
+    """
+    mean = math.gamma(1 + 1 / b) / lam
+    return mean, math.gamma(1 + 2 / b) / lam**2 - mean**2
+
+
+def _triangular_moments(minimum, mode, maximum):
+    """
+    Mean and variance of the Triangular Distribution
+
+    :param minimum: minimum value
+    :type minimum: int or float
+    :param mode: mode
+    :type mode: int or float
+    :param maximum: maximum value
+    :type maximum: int or float
+    :return: mean and variance, None where they don't exist
+    :rtype: tuple
+    """
+    a, c, b = minimum, mode, maximum
+    return (a + c + b) / 3, (a * a + b * b + c * c - a * b - a * c - b * c) / 18
+
+
+def _t_moments(n):
+    """
+    Mean and variance of the Student's t Distribution
+
+    :param n: degrees of freedom
+    :type n: int
+    :return: mean and variance, None where they don't exist
+    :rtype: tuple
+    """
+    mean = 0.0 if n > 1 else None
+    if n > 2:
+        return mean, n / (n - 2)
+    return mean, None
+
+
+def _f_moments(n, m):
+    """
+    Mean and variance of the F Distribution
+
+    :param n: degrees of freedom of the numerator
+    :type n: int
+    :param m: degrees of freedom of the denominator
+    :type m: int
+    :return: mean and variance, None where they don't exist
+    :rtype: tuple
+    """
+    mean = m / (m - 2) if m > 2 else None
+    if m > 4:
+        return mean, 2 * m * m * (n + m - 2) / (n * (m - 2) ** 2 * (m - 4))
+    return mean, None
+
+
+def _discrete_moments(weights):
+    """
+    Mean and variance of the Discrete Distribution
+
+    :param weights: relative probability of each outcome, or an AliasTable
+    :type weights: sequence of ints or floats or AliasTable
+    :return: mean and variance, None where they don't exist
+    :rtype: tuple
+    """
+    weights = getattr(weights, "weights", weights)
+    total = math.fsum(weights)
+    mean = math.fsum(k * w for k, w in enumerate(weights)) / total
+    square = math.fsum(k * k * w for k, w in enumerate(weights)) / total
+    return mean, square - mean * mean
+
+
+def _truncated_weibull_cdf(x, lam, b, lower=0, upper=math.inf):
+    """
+    CDF of the Truncated Weibull Distribution
+
+    :param x: value
+    :type x: float
+    :param lam: lambda parameter of the Weibull distribution
+    :type lam: int or float greater than 0
+    :param b: beta parameter of the Weibull distribution
+    :type b: int or float greater than 0
+    :param lower: smallest value, defaults to 0
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    x = min(max(x, lower), upper)
+    lower_hazard = (lam * lower) ** b
+    return math.expm1(lower_hazard - (lam * x) ** b) / math.expm1(
+        lower_hazard - (lam * upper) ** b
+    )
+
+
+def _truncated_exponential_cdf(x, lam, lower=0, upper=math.inf):
+    """
+    CDF of the Truncated Exponential Distribution
+
+    :param x: value
+    :type x: float
+    :param lam: lambda parameter of the exponential distribution
+    :type lam: int or float greater than 0
+    :param lower: smallest value, defaults to 0
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    return _truncated_weibull_cdf(x, lam, 1, lower, upper)
+
+
+def _truncated_triangular_cdf(x, minimum, mode, maximum, lower, upper):
+    """
+    CDF of the Truncated Triangular Distribution
+
+    :param x: value
+    :type x: float
+    :param minimum: minimum value
+    :type minimum: int or float
+    :param mode: mode
+    :type mode: int or float
+    :param maximum: maximum value
+    :type maximum: int or float
+    :param lower: smallest value
+    :type lower: int or float
+    :param upper: largest value
+    :type upper: int or float
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    x = min(max(x, lower), upper)
+    low = _triangular_cdf(lower, minimum, mode, maximum)
+    high = _triangular_cdf(upper, minimum, mode, maximum)
+    return (_triangular_cdf(x, minimum, mode, maximum) - low) / (high - low)
+
+
+def _truncated_normal_cdf(x, mu, sigma, lower=-math.inf, upper=math.inf):
+    """
+    CDF of the Truncated Normal Distribution
+
+    :param x: value
+    :type x: float
+    :param mu: mu or mean parameter
+    :type mu: int or float
+    :param sigma: sigma or standard deviation parameter
+    :type sigma: int or float greater than 0
+    :param lower: smallest value, defaults to -math.inf, i.e. no lower bound
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
+    :return: probability of a variate at most x
+    :rtype: float
+    """
+    x = min(max(x, lower), upper)
+    if lower + upper > 2 * mu:
+        # survival probabilities are accurate above the mean
+        low = _normal_cdf(mu - lower, 0, sigma)
+        return (low - _normal_cdf(mu - x, 0, sigma)) / (
+            low - _normal_cdf(mu - upper, 0, sigma)
+        )
+    low = _normal_cdf(lower, mu, sigma)
+    return (_normal_cdf(x, mu, sigma) - low) / (
+        _normal_cdf(upper, mu, sigma) - low
+    )
+
+
+def _truncated_weibull_survival(x, lam, b, lower=0, upper=math.inf):
+    """
+    Survival function of the Truncated Weibull Distribution
+
+    :param x: value
+    :type x: float
+    :param lam: lambda parameter of the Weibull distribution
+    :type lam: int or float greater than 0
+    :param b: beta parameter of the Weibull distribution
+    :type b: int or float greater than 0
+    :param lower: smallest value, defaults to 0
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    if x >= upper:
+        return 0.0
+    x = max(x, lower)
+    hazard = (lam * x) ** b
+    upper_hazard = (lam * upper) ** b
+    # (exp(-H(x)) - exp(-H(upper))) / (exp(-H(lower)) - exp(-H(upper))),
+    # without the cancellation in the upper tail
+    return (
+        math.exp((lam * lower) ** b - hazard)
+        * math.expm1(hazard - upper_hazard)
+        / math.expm1((lam * lower) ** b - upper_hazard)
+    )
+
+
+def _truncated_exponential_survival(x, lam, lower=0, upper=math.inf):
+    """
+    Survival function of the Truncated Exponential Distribution
+
+    :param x: value
+    :type x: float
+    :param lam: lambda parameter of the exponential distribution
+    :type lam: int or float greater than 0
+    :param lower: smallest value, defaults to 0
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    return _truncated_weibull_survival(x, lam, 1, lower, upper)
+
+
+def _truncated_triangular_survival(x, minimum, mode, maximum, lower, upper):
+    """
+    Survival function of the Truncated Triangular Distribution
+
+    :param x: value
+    :type x: float
+    :param minimum: minimum value
+    :type minimum: int or float
+    :param mode: mode
+    :type mode: int or float
+    :param maximum: maximum value
+    :type maximum: int or float
+    :param lower: smallest value
+    :type lower: int or float
+    :param upper: largest value
+    :type upper: int or float
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    # the mirror image of the distribution has the upper tail as its lower
+    # tail
+    mirror = minimum + maximum
+    return _truncated_triangular_cdf(
+        mirror - x,
+        minimum,
+        mirror - mode,
+        maximum,
+        mirror - upper,
+        mirror - lower,
+    )
+
+
+def _truncated_normal_survival(x, mu, sigma, lower=-math.inf, upper=math.inf):
+    """
+    Survival function of the Truncated Normal Distribution
+
+    :param x: value
+    :type x: float
+    :param mu: mu or mean parameter
+    :type mu: int or float
+    :param sigma: sigma or standard deviation parameter
+    :type sigma: int or float greater than 0
+    :param lower: smallest value, defaults to -math.inf, i.e. no lower bound
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
+    :return: probability of a variate more than x
+    :rtype: float
+    """
+    # the mirror image of the distribution about mu has the upper tail as its
+    # lower tail
+    return _truncated_normal_cdf(
+        2 * mu - x, mu, sigma, 2 * mu - upper, 2 * mu - lower
+    )
+
+
+def _truncated_exponential_moments(lam, lower=0, upper=math.inf):
+    """
+    Mean and variance of the Truncated Exponential Distribution
+
+    :param lam: lambda parameter of the exponential distribution
+    :type lam: int or float greater than 0
+    :param lower: smallest value, defaults to 0
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
+    :return: mean and variance, None where they don't exist
+    :rtype: tuple
+    """
+    if upper == math.inf:
+        return lower + 1 / lam, 1 / lam**2
+    width = lam * (upper - lower)
+    # the truncated variate is lower + an exponential truncated to width
+    tail = width / math.expm1(width)
+    mean = (1 - tail) / lam
+    variance = (1 - tail * tail * math.exp(width)) / lam**2
+    return lower + mean, variance
+
+
+def _truncated_normal_moments(mu, sigma, lower=-math.inf, upper=math.inf):
+    """
+    Mean and variance of the Truncated Normal Distribution
+
+    :param mu: mu or mean parameter
+    :type mu: int or float
+    :param sigma: sigma or standard deviation parameter
+    :type sigma: int or float greater than 0
+    :param lower: smallest value, defaults to -math.inf, i.e. no lower bound
+    :type lower: int or float, optional
+    :param upper: largest value, defaults to math.inf, i.e. no upper bound
+    :type upper: int or float, optional
+    :return: mean and variance, None where they don't exist
+    :rtype: tuple
+    """
+    alpha = (lower - mu) / sigma
+    beta = (upper - mu) / sigma
+    sign = 1
+    if alpha + beta > 0:
+        alpha, beta, sign = -beta, -alpha, -1
+    mass = _normal_cdf(beta) - _normal_cdf(alpha)
+    densities = [
+        math.exp(-z * z / 2) / math.sqrt(2 * math.pi) for z in (alpha, beta)
+    ]
+    shift = (densities[0] - densities[1]) / mass
+    spread = sum(
+        z * density * side
+        for z, density, side in zip((alpha, beta), densities, (1, -1))
+        if math.isfinite(z)
+    )
+    return (
+        mu + sign * sigma * shift,
+        sigma * sigma * (1 + spread / mass - shift * shift),
+    )
+
+
+def _multivariate_normal_rank(cov):
+    """
+    Rank of the covariance matrix of the Multivariate Normal Distribution,
+    the degrees of freedom of its squared Mahalanobis distance
+
+    :param cov: covariance matrix
+    :type cov: sequence of sequences of floats
+    :return: rank
+    :rtype: int
+    """
+    factor = distributions.covariance_factor(cov)
+    if np is None:
+        # only positive definite matrices can be factored without numpy
+        return len(factor)
+    return int(np.linalg.matrix_rank(factor))
+
+
+def _multivariate_normal_statistic(variates, mean, cov):
+    """
+    Squared Mahalanobis distance of each vector from the mean
+
+    For a Multivariate Normal Distribution it follows the Chi-Square
+    Distribution with as many degrees of freedom as the rank of cov, so the
+    vectors can be checked like univariate variates.
+
+    :param variates: random vectors, one per row
+    :type variates: numpy.ndarray or list of lists of floats
+    :param mean: mean vector
+    :type mean: sequence of floats
+    :param cov: covariance matrix
+    :type cov: sequence of sequences of floats
+    :return: squared distance of each vector
+    :rtype: numpy.ndarray or list of floats
+    """
+    factor = distributions.covariance_factor(cov)
+    if np is not None:
+        deviations = np.asarray(variates, dtype=float) - np.asarray(
+            mean, dtype=float
+        )
+        z = deviations @ np.linalg.pinv(factor).T
+        return (z * z).sum(axis=1)
+    distances = []
+    for vector in variates:
+        # forward substitution with the Cholesky factor
+        z = []
+        for row, x_i, mean_i in zip(factor, vector, mean):
+            partial = math.fsum(a * z_j for a, z_j in zip(row, z))
+            z.append((x_i - mean_i - partial) / row[len(z)])
+        distances.append(math.fsum(z_i * z_i for z_i in z))
+    return distances
+
+
+def _multivariate_normal_cdf(x, mean, cov):
+    """
+    CDF of the squared Mahalanobis distance of the Multivariate Normal
+    Distribution, see _multivariate_normal_statistic
+
+    :param x: value
+    :type x: float
+    :param mean: mean vector
+    :type mean: sequence of floats
+    :param cov: covariance matrix
+    :type cov: sequence of sequences of floats
+    :return: probability of a squared distance at most x
+    :rtype: float
+    """
+    return _chi_square_cdf(x, _multivariate_normal_rank(cov))
+
+
+def _multivariate_normal_moments(mean, cov):
+    """
+    Mean and variance of the squared Mahalanobis distance of the Multivariate
+    Normal Distribution, see _multivariate_normal_statistic
+
+    :param mean: mean vector
+    :type mean: sequence of floats
+    :param cov: covariance matrix
+    :type cov: sequence of sequences of floats
+    :return: mean and variance
+    :rtype: tuple
+    """
+    rank = _multivariate_normal_rank(cov)
+    return rank, 2 * rank
+
+
+# reference CDF, mean and variance (None where they don't exist or have no
+# closed form) and whether the variates are integers, of every distribution
+# function, by name, as functions of the distribution's parameters. Vector
+# variates also have a statistic that turns them into the univariate
+# variates the rest describe
+REFERENCES = {
+    "weibull": {
+        "cdf": _weibull_cdf,
+        "moments": _weibull_moments,
+        "discrete": False,
+    },
+    "exponential": {
+        "cdf": _exponential_cdf,
+        "moments": lambda lam: (1 / lam, 1 / lam**2),
+        "discrete": False,
+    },
+    "laplace": {
+        "cdf": _laplace_cdf,
+        "moments": lambda mu, b: (mu, 2 * b * b),
+        "discrete": False,
+    },
+    "triangular": {
+        "cdf": _triangular_cdf,
+        "moments": _triangular_moments,
+        "discrete": False,
+    },
+    "bernoulli": {
+        "cdf": _bernoulli_cdf,
+        "moments": lambda p: (p, p * (1 - p)),
+        "discrete": True,
+    },
+    "geometric": {
+        "cdf": _geometric_cdf,
+        "moments": lambda p: (1 / p, (1 - p) / p**2),
+        "discrete": True,
+    },
+    "poisson": {
+        "cdf": _poisson_cdf,
+        "moments": lambda lam: (lam, lam),
+        "discrete": True,
+    },
+    "binomial": {
+        "cdf": _binomial_cdf,
+        "moments": lambda n, p: (n * p, n * p * (1 - p)),
+        "discrete": True,
+    },
+    "gamma": {
+        "cdf": _gamma_cdf,
+        "moments": lambda shape, scale=1: (shape * scale, shape * scale**2),
+        "discrete": False,
+    },
+    "erlang": {
+        "cdf": _erlang_cdf,
+        "moments": lambda lam, n: (n / lam, n / lam**2),
+        "discrete": False,
+    },
+    "negative_binomial": {
+        "cdf": _negative_binomial_cdf,
+        "moments": lambda n, p: (n / p, n * (1 - p) / p**2),
+        "discrete": True,
+    },
+    "chi_square": {
+        "cdf": _chi_square_cdf,
+        "moments": lambda n: (n, 2 * n),
+        "discrete": False,
+    },
+    "t": {"cdf": _t_cdf, "moments": _t_moments, "discrete": False},
+    "cauchy": {
+        "cdf": _cauchy_cdf,
+        "moments": lambda: (None, None),
+        "discrete": False,
+    },
+    "F": {"cdf": _f_cdf, "moments": _f_moments, "discrete": False},
+    "standard_normal_crude": {
+        "cdf": _normal_cdf,
+        "moments": lambda: (0.0, 1.0),
+        "discrete": False,
+    },
+    "standard_normal": {
+        "cdf": _standard_normal_cdf,
+        "moments": lambda method=None, cache=None, pair=None: (0.0, 1.0),
+        "discrete": False,
+    },
+    "normal": {
+        "cdf": _normal_cdf,
+        "moments": lambda mu, sigma: (mu, sigma * sigma),
+        "discrete": False,
+    },
+    "discrete": {
+        "cdf": _discrete_cdf,
+        "moments": _discrete_moments,
+        "discrete": True,
+    },
+    "truncated_weibull": {
+        "cdf": _truncated_weibull_cdf,
+        "moments": lambda *params, **named: (None, None),
+        "discrete": False,
+    },
+    "truncated_exponential": {
+        "cdf": _truncated_exponential_cdf,
+        "moments": _truncated_exponential_moments,
+        "discrete": False,
+    },
+    "truncated_triangular": {
+        "cdf": _truncated_triangular_cdf,
+        "moments": lambda *params, **named: (None, None),
+        "discrete": False,
+    },
+    "truncated_normal": {
+        "cdf": _truncated_normal_cdf,
+        "moments": _truncated_normal_moments,
+        "discrete": False,
+    },
+    "multivariate_normal": {
+        "cdf": _multivariate_normal_cdf,
+        "moments": _multivariate_normal_moments,
+        "discrete": False,
+        "statistic": _multivariate_normal_statistic,
+    },
+}
+
+
+# survival functions, 1 - CDF, of the continuous distribution functions, by
+# name, which keep the upper tail that is lost to rounding in 1 - CDF
+SURVIVALS = {
+    "weibull": _weibull_survival,
+    "exponential": _exponential_survival,
+    "laplace": _laplace_survival,
+    "gamma": _gamma_survival,
+    "erlang": _erlang_survival,
+    "chi_square": _chi_square_survival,
+    "t": _t_survival,
+    "cauchy": _cauchy_survival,
+    "F": _f_survival,
+    "standard_normal_crude": _normal_survival,
+    "standard_normal": _standard_normal_survival,
+    "normal": _normal_survival,
+    "triangular": _triangular_survival,
+    "truncated_weibull": _truncated_weibull_survival,
+    "truncated_exponential": _truncated_exponential_survival,
+    "truncated_triangular": _truncated_triangular_survival,
+    "truncated_normal": _truncated_normal_survival,
+}
+
+
+def _quantile(cdf, p, discrete):
+    """
+    Invert a CDF by bracketing and bisection
+
+    :param cdf: CDF, a function of x
+    :type cdf: function
+    :param p: probability, strictly between 0 and 1
+    :type p: float
+    :param discrete: whether the distribution is on the integers
+    :type discrete: bool
+    :return: smallest x with cdf(x) >= p, to within float precision for a
+    continuous distribution
+    :rtype: float or int
+    """
+    lo, hi = -1, 1
+    while cdf(lo) >= p:
+        lo *= 2
+    while cdf(hi) < p:
+        hi *= 2
+    if discrete:
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if cdf(mid) >= p:
+                hi = mid
+            else:
+                lo = mid
+        return hi
+    lo, hi = float(lo), float(hi)
+    for _ in range(SPECIAL_ITERATIONS):
+        mid = (lo + hi) / 2
+        if mid in (lo, hi):
+            break
+        if cdf(mid) >= p:
+            hi = mid
+        else:
+            lo = mid
+    return hi
+
+
+def _kolmogorov_q(lam):
+    """
+    Survival function of the Kolmogorov distribution
+
+    :param lam: scaled KS statistic
+    :type lam: float
+    :return: probability that the scaled statistic is more than lam
+    :rtype: float
+    """
+    if lam < 0.2:
+        return 1.0
+    total = 0.0
+    for k in range(1, 101):
+        term = 2 * (-1) ** (k - 1) * math.exp(-2 * k * k * lam * lam)
+        total += term
+        if abs(term) < 1e-12:
+            break
+    return min(max(total, 0.0), 1.0)
+
+
+def _reference(name):
+    """
+    Get the reference of a distribution function
+
+    :param name: name of the distribution function
+    :type name: str
+    :raises ValueError: occurs when there is no reference for name
+    :return: reference CDF, moments and whether the variates are integers
+    :rtype: dict
+    """
+    if name not in REFERENCES:
+        raise ValueError(f"no reference for {name}")
+    return REFERENCES[name]
+
+
+class Validator:
+    """
+    One-pass check of random variates against their distribution
+
+    Call update with each chunk of variates, then report. Only the running
+    moments and the counts of the bins are kept, so memory doesn't grow with
+    the number of variates. Validators of the same distribution, parameters
+    and bins can be merged, e.g. one per worker of a parallel run.
+
+    The bins are equiprobable under the reference CDF: bins - 1 edges at its
+    i / bins quantiles, plus the two unbounded end bins. For a discrete
+    distribution the edges are halfway between integers, so bins that would
+    split an integer are merged and there may be fewer of them.
+
+    Random vectors are checked through a statistic of each vector, e.g. the
+    squared Mahalanobis distance for multivariate_normal, which has a
+    univariate reference distribution.
+
+    :param dist: distribution function, e.g. weibull, or its name
+    :type dist: function or str
+    :param params: parameters of the distribution, e.g. {"lam": 1, "b": 2},
+    defaults to None, i.e. no parameters
+    :type params: dict, optional
+    :param bins: number of equiprobable bins, defaults to DEFAULT_BINS
+    :type bins: int, optional
+    :raises ValueError: occurs when there is no reference for dist or bins is
+    less than 2
+    """
+
+    def __init__(self, dist, params=None, bins=DEFAULT_BINS):
+        if bins < 2:
+            raise ValueError("bins must be at least 2")
+        self.name = getattr(dist, "__name__", dist)
+        self.params = params or {}
+        reference = _reference(self.name)
+        cdf = self.cdf
+        edges = [
+            _quantile(cdf, i / bins, reference["discrete"])
+            for i in range(1, bins)
+        ]
+        if reference["discrete"]:
+            edges = [k + 0.5 for k in sorted(set(edges))]
+        self.edges = edges
+        self.count = 0
+        # running mean and sums of the 2nd, 3rd and 4th powers of the
+        # deviations from it
+        self.mean = 0.0
+        self._m2 = self._m3 = self._m4 = 0.0
+        if np is not None:
+            self.counts = np.zeros(len(edges) + 1, dtype=np.int64)
+        else:
+            self.counts = [0] * (len(edges) + 1)
+
+    def cdf(self, x):
+        """
+        Reference CDF of the distribution
+
+        :param x: value
+        :type x: float
+        :return: probability of a variate at most x
+        :rtype: float
+        """
+        return _reference(self.name)["cdf"](x, **self.params)
+
+    def _add_moments(self, count, mean, m2, m3, m4):
+        """
+        Combine moments of other variates with the running moments
+
+        :param count: number of other variates
+        :type count: int
+        :param mean: their mean
+        :type mean: float
+        :param m2: their sum of squared deviations from their mean
+        :type m2: float
+        :param m3: their sum of cubed deviations from their mean
+        :type m3: float
+        :param m4: their sum of 4th powers of deviations from their mean
+        :type m4: float
+        """
+        na, nb = self.count, count
+        n = na + nb
+        if nb == 0:
+            return
+        delta = mean - self.mean
+        ratio = delta / n
+        cross = na * nb * delta * ratio
+        self._m4 += (
+            m4
+            + cross * ratio * ratio * (na * na - na * nb + nb * nb)
+            + 6 * ratio * ratio * (na * na * m2 + nb * nb * self._m2)
+            + 4 * ratio * (na * m3 - nb * self._m3)
+        )
+        self._m3 += (
+            m3
+            + cross * ratio * (na - nb)
+            + 3 * ratio * (na * m2 - nb * self._m2)
+        )
+        self._m2 += m2 + cross
+        self.mean += nb * ratio
+        self.count = n
+
+    def update(self, variates):
+        """
+        Add a chunk of variates
+
+        :param variates: random variates
+        :type variates: sequence of floats or ints
+        """
+        if not len(variates):
+            return
+        statistic = _reference(self.name).get("statistic")
+        if statistic is not None:
+            variates = statistic(variates, **self.params)
+        if np is not None:
+            values = np.asarray(variates, dtype=float)
+            mean = values.mean()
+            deviations = values - mean
+            squares = deviations * deviations
+            self._add_moments(
+                len(values),
+                float(mean),
+                float(squares.sum()),
+                float((squares * deviations).sum()),
+                float((squares * squares).sum()),
+            )
+            bins = np.searchsorted(self.edges, values, side="right")
+            self.counts += np.bincount(bins, minlength=len(self.counts))
+            return
+        # Welford's update, one variate at a time
+        for x in variates:
+            self._add_moments(1, x, 0.0, 0.0, 0.0)
+            self.counts[bisect_right(self.edges, x)] += 1
+
+    def merge(self, other):
+        """
+        Add the variates seen by another validator
+
+        :param other: validator of the same distribution, parameters and bins
+        :type other: Validator
+        :raises ValueError: occurs when other checks a different distribution,
+        parameters or bins
+        :return: this validator
+        :rtype: Validator
+        """
+        if (
+            other.name != self.name
+            or other.params != self.params
+            or list(other.edges) != list(self.edges)
+        ):
+            raise ValueError(
+                "only validators of the same distribution, parameters and "
+                "bins can be merged"
+            )
+        self._add_moments(
+            other.count, other.mean, other._m2, other._m3, other._m4
+        )
+        if np is not None:
+            self.counts += other.counts
+        else:
+            self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        return self
+
+    def moments(self):
+        """
+        Get the moments of the variates seen so far
+
+        :return: count, mean, variance (with n - 1 degrees of freedom),
+        skewness and excess kurtosis, None when there are too few variates
+        :rtype: dict
+        """
+        n = self.count
+        variance = self._m2 / (n - 1) if n > 1 else None
+        skewness = kurtosis = None
+        if n > 1 and self._m2 > 0:
+            skewness = math.sqrt(n) * self._m3 / self._m2**1.5
+            kurtosis = n * self._m4 / (self._m2 * self._m2) - 3
+        return {
+            "count": n,
+            "mean": self.mean if n else None,
+            "variance": variance,
+            "skewness": skewness,
+            "kurtosis": kurtosis,
+        }
+
+    def report(self):
+        """
+        Compare the variates seen so far with the distribution
+
+        The chi-square test compares the counts of the bins with the counts
+        the reference CDF expects, with bins - 1 degrees of freedom. The KS
+        statistic is the largest distance between the empirical and
+        reference CDFs at the bin edges. It never overstates the exact KS
+        statistic, and understates it by at most the probability of one bin,
+        so its p-value is conservative; it is conservative for discrete
+        distributions too. The z score of the mean is the distance between
+        the sample and reference means in standard errors.
+
+        :raises ValueError: occurs when no variates have been seen
+        :return: moments (see moments), reference mean and variance, z score
+        of the mean, chi-square statistic, degrees of freedom and p-value,
+        and KS statistic and p-value
+        :rtype: dict
+        """
+        n = self.count
+        if not n:
+            raise ValueError("no variates have been seen")
+        reference = _reference(self.name)
+        mean, variance = reference["moments"](**self.params)
+        cumulative = [0.0] + [self.cdf(x) for x in self.edges] + [1.0]
+        expected = [b - a for a, b in zip(cumulative, cumulative[1:])]
+        counts = [int(c) for c in self.counts]
+        chi_square = 0.0
+        cells = 0
+        for observed, probability in zip(counts, expected):
+            if probability > 0:
+                cells += 1
+                chi_square += (observed - n * probability) ** 2 / (
+                    n * probability
+                )
+            elif observed:
+                chi_square = math.inf
+        ks = 0.0
+        seen = 0
+        for observed, probability in zip(counts, cumulative[1:-1]):
+            seen += observed
+            ks = max(ks, abs(seen / n - probability))
+        dof = max(cells - 1, 1)
+        root_n = math.sqrt(n)
+        z = None
+        if mean is not None and variance:
+            z = (self.mean - mean) / math.sqrt(variance / n)
+        return {
+            "distribution": self.name,
+            "params": self.params,
+            **self.moments(),
+            "reference_mean": mean,
+            "reference_variance": variance,
+            "mean_z": z,
+            "chi_square": chi_square,
+            "chi_square_dof": dof,
+            "chi_square_p": _incomplete_gamma(dof / 2, chi_square / 2)[1],
+            "ks": ks,
+            "ks_p": _kolmogorov_q((root_n + 0.12 + 0.11 / root_n) * ks),
+        }
+
+
+def validate(
+    dist,
+    params=None,
+    size=1000000,
+    chunk=DEFAULT_CHUNK,
+    prng=DEFAULT_PRNG,
+    bins=DEFAULT_BINS,
+):
+    """
+    Generate random variates in chunks and check them against their
+    distribution
+
+    :param dist: distribution function, e.g. weibull, or its name
+    :type dist: function or str
+    :param params: parameters of the distribution, e.g. {"lam": 1, "b": 2},
+    defaults to None, i.e. no parameters
+    :type params: dict, optional
+    :param size: number of variates to check, defaults to 1000000
+    :type size: int, optional
+    :param chunk: number of variates per chunk, defaults to DEFAULT_CHUNK
+    :type chunk: int, optional
+    :param prng: pseudo-random number generator function that generates
+    uniform(0,1) prn's, defaults to DEFAULT_PRNG
+    :type prng: builtin_function_or_method, optional
+    :param bins: number of equiprobable bins, defaults to DEFAULT_BINS
+    :type bins: int, optional
+    :raises ValueError: occurs when there is no reference for dist, bins is
+    less than 2 or chunk is less than 1
+    :return: report of the check, see Validator.report
+    :rtype: dict
+    """
+    validator = Validator(dist, params, bins)
+    function = getattr(distributions, validator.name)
+    for variates in stream(function, params, chunk, prng, size):
+        validator.update(variates)
+    return validator.report()
+
+
+def _validate_chunk(validator, seed, index, size):
+    """
+    Check the variates of one chunk, generated from its own stream
+
+    :param validator: validator that hasn't seen any variates
+    :type validator: Validator
+    :param seed: root seed
+    :type seed: int
+    :param index: index of the chunk, and of its stream
+    :type index: int
+    :param size: number of variates in the chunk
+    :type size: int
+    :return: the validator, updated with the chunk
+    :rtype: Validator
+    """
+    function = getattr(distributions, validator.name)
+    prng = spawn_prng(seed, index)
+    validator.update(function(**validator.params, prng=prng, size=size))
+    return validator
+
+
+def validate_parallel(
+    dist,
+    size,
+    params=None,
+    workers=None,
+    seed=None,
+    chunk=DEFAULT_CHUNK,
+    bins=DEFAULT_BINS,
+):
+    """
+    Check random variates generated across a pool of processes
+
+    The chunks are generated like sample_parallel's and each is checked by
+    its own validator in the worker, so only the validators' small states
+    come back to be merged, not the variates.
+
+    :param dist: distribution function, e.g. weibull, or its name
+    :type dist: function or str
+    :param size: number of variates to check
+    :type size: int
+    :param params: parameters of the distribution, e.g. {"lam": 1, "b": 2},
+    defaults to None, i.e. no parameters
+    :type params: dict, optional
+    :param workers: number of processes, defaults to None, i.e. one per CPU.
+    With 1 worker the chunks are checked in this process
+    :type workers: int, optional
+    :param seed: root seed, defaults to None, i.e. a random root seed
+    :type seed: int, optional
+    :param chunk: number of variates per chunk, defaults to DEFAULT_CHUNK
+    :type chunk: int, optional
+    :param bins: number of equiprobable bins, defaults to DEFAULT_BINS
+    :type bins: int, optional
+    :raises ValueError: occurs when there is no reference for dist, bins is
+    less than 2 or chunk is less than 1
+    :return: report of the check, see Validator.report
+    :rtype: dict
+    """
+    if chunk < 1:
+        raise ValueError("chunk must be at least 1")
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(128)
+    validator = Validator(dist, params, bins)
+    sizes = [min(chunk, size - start) for start in range(0, size, chunk)]
+    if workers == 1:
+        for index, chunk_size in enumerate(sizes):
+            _validate_chunk(validator, seed, index, chunk_size)
+        return validator.report()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = executor.map(
+            _validate_chunk,
+            [validator] * len(sizes),
+            [seed] * len(sizes),
+            range(len(sizes)),
+            sizes,
+        )
+        for partial in partials:
+            validator.merge(partial)
+    return validator.report()
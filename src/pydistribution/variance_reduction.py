@@ -0,0 +1,214 @@
+"""
+Sample with antithetic variates and common random numbers
+
+Both methods reuse the uniform(0,1) prn's drawn for one sample to generate
+another, so the two samples are correlated: negatively for antithetic
+variates, which cuts the variance of their average, and positively for
+common random numbers, which cuts the variance of the difference between two
+models.
+"""
+
+from array import array
+
+from pydistribution.distributions import (
+    DEFAULT_PRNG,
+    Distribution,
+    np,
+    prn_block_handler,
+)
+
+# largest float below 1, which 1 - u is clipped to so it stays a valid prn
+BELOW_ONE = 1 - 2**-53
+
+
+class _RecordingPRNG:
+    """
+    prng that keeps every prn it draws
+
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    """
+
+    def __init__(self, prng):
+        self.prng = prng
+        self.recorded = []
+
+    def __call__(self):
+        u = self.prng()
+        self.recorded.append([u])
+        return u
+
+    def block(self, size):
+        """
+        Get the next size prn's as an array
+
+        :param size: number of prn's
+        :type size: int
+        :return: block of uniform(0,1) prn's
+        :rtype: numpy.ndarray or array.array
+        """
+        u = prn_block_handler(u=None, size=size, prng=self.prng)
+        # samplers may change the block in place, so keep a copy
+        self.recorded.append(u[:] if np is None else u.copy())
+        return u
+
+    def prns(self):
+        """
+        Get the prn's drawn so far, in the order they were drawn
+
+        :return: prn's
+        :rtype: numpy.ndarray or array.array
+        """
+        if np is not None:
+            if not self.recorded:
+                return np.empty(0)
+            return np.concatenate([np.asarray(u) for u in self.recorded])
+        prns = array("d")
+        for u in self.recorded:
+            prns.extend(u)
+        return prns
+
+
+class _ReplayPRNG:
+    """
+    prng that hands out recorded prn's, or their antithetic 1 - u, then
+    draws new prn's once the recorded ones run out
+
+    :param prns: recorded prn's
+    :type prns: numpy.ndarray or array.array
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param antithetic: whether to hand out 1 - u instead of u
+    :type antithetic: bool
+    """
+
+    def __init__(self, prns, prng, antithetic):
+        if antithetic:
+            if np is not None:
+                prns = np.minimum(1 - prns, BELOW_ONE)
+            else:
+                prns = array("d", (min(1 - u, BELOW_ONE) for u in prns))
+        self.prns = prns
+        self.prng = prng
+        self.position = 0
+
+    def __call__(self):
+        if self.position < len(self.prns):
+            self.position += 1
+            return float(self.prns[self.position - 1])
+        return self.prng()
+
+    def block(self, size):
+        """
+        Get the next size prn's as an array
+
+        :param size: number of prn's
+        :type size: int
+        :return: block of uniform(0,1) prn's
+        :rtype: numpy.ndarray or array.array
+        """
+        u = self.prns[self.position : self.position + size]
+        self.position += len(u)
+        if np is not None:
+            # samplers may change the block in place, so hand out a copy
+            u = u.copy()
+        if len(u) == size:
+            return u
+        rest = prn_block_handler(u=None, size=size - len(u), prng=self.prng)
+        if np is not None:
+            return np.concatenate((u, rest))
+        return u + rest
+
+
+def _sample(dist, params, prng, size):
+    """
+    Generate a random variate, or an array of them
+
+    :param dist: distribution class or function
+    :type dist: type or function
+    :param params: parameters of the distribution
+    :type params: dict
+    :param prng: pseudo-random number generator function that generates uniform(0,1) prn's
+    :type prng: builtin_function_or_method
+    :param size: number of variates, None for a single variate
+    :type size: int or None
+    :return: random variate or random variates
+    :rtype: float, int or array
+    """
+    if isinstance(dist, type) and issubclass(dist, Distribution):
+        frozen = dist(**params, prng=prng)
+        return frozen.sample() if size is None else frozen.sample_n(size)
+    # the functions only reuse frozen distributions of the default prng, so
+    # the one-off recording and replay prngs are freed with their prn's
+    if size is None:
+        return dist(**params, prng=prng)
+    return dist(**params, prng=prng, size=size)
+
+
+def antithetic(dist, params=None, size=None, prng=DEFAULT_PRNG):
+    """
+    Generate a pair of antithetic samples
+
+    The second sample is generated from 1 - u for every prn u the first
+    sample drew, in the same order, so it works for distributions that use
+    several prn's per variate too. Each sample has the distribution's
+    distribution, and for monotone methods like the inverse transform they
+    are negatively correlated, so the average of the pair has less variance
+    than the average of two independent samples. Rejection methods may draw
+    more prn's for the second sample than the first; those are new prn's.
+
+    :param dist: distribution class, e.g. Weibull, or distribution function,
+    e.g. weibull
+    :type dist: type or function
+    :param params: parameters of the distribution, e.g. {"lam": 1, "b": 2},
+    defaults to None, i.e. no parameters
+    :type params: dict, optional
+    :param size: number of variates in each sample, defaults to None, i.e. a
+    single variate
+    :type size: int, optional
+    :param prng: pseudo-random number generator function that generates
+    uniform(0,1) prn's, defaults to DEFAULT_PRNG
+    :type prng: builtin_function_or_method, optional
+    :return: the sample and its antithetic sample
+    :rtype: tuple
+    """
+    params = params or {}
+    recorder = _RecordingPRNG(prng)
+    x = _sample(dist, params, recorder, size)
+    replay = _ReplayPRNG(recorder.prns(), prng, antithetic=True)
+    return x, _sample(dist, params, replay, size)
+
+
+def common_random_numbers(variants, size=None, prng=DEFAULT_PRNG):
+    """
+    Generate one sample per variant of a model from the same prn's
+
+    Every variant is generated from the prn's the first variant drew, in the
+    same order, so the difference between variants comes from the variants
+    rather than from the prn's, and its variance is much smaller than with
+    independent samples. A variant that draws more prn's than the first gets
+    new prn's for the rest.
+
+    :param variants: distribution and parameters of each variant, e.g.
+    [(weibull, {"lam": 1, "b": 2}), (weibull, {"lam": 1, "b": 3})]
+    :type variants: list of tuples
+    :param size: number of variates in each sample, defaults to None, i.e. a
+    single variate
+    :type size: int, optional
+    :param prng: pseudo-random number generator function that generates
+    uniform(0,1) prn's, defaults to DEFAULT_PRNG
+    :type prng: builtin_function_or_method, optional
+    :raises ValueError: occurs when there are no variants
+    :return: one sample per variant
+    :rtype: list
+    """
+    if not variants:
+        raise ValueError("there must be at least one variant")
+    (dist, params), others = variants[0], variants[1:]
+    recorder = _RecordingPRNG(prng)
+    samples = [_sample(dist, params or {}, recorder, size)]
+    prns = recorder.prns()
+    for dist, params in others:
+        replay = _ReplayPRNG(prns, prng, antithetic=False)
+        samples.append(_sample(dist, params or {}, replay, size))
+    return samples
@@ -0,0 +1,84 @@
+import math
+
+from pydistribution import backend
+from pydistribution.distributions import (
+    AliasTable,
+    bernoulli,
+    binomial,
+    discrete,
+    exponential,
+    geometric,
+    poisson,
+    standard_normal_crude,
+    triangular,
+    truncated_exponential,
+    truncated_normal,
+    truncated_triangular,
+    truncated_weibull,
+    weibull,
+)
+
+import pytest
+
+
+def test_truncated_prns_stay_below_one():
+    x = truncated_triangular(0, 1, 1, 0.9, 1, u=1 - 2**-53)
+    assert 0.9 <= x <= 1
+
+
+def test_truncated_normal_is_finite_at_zero():
+    assert math.isfinite(truncated_normal(0, 1, u=0.0))
+    assert math.isfinite(truncated_normal(0, 1, u=1 - 2**-53))
+
+
+@pytest.mark.parametrize(
+    "lam", [-1, math.nan, math.inf, [1, -1], [1, math.nan]]
+)
+def test_poisson_rejects_invalid_lambdas(lam):
+    with pytest.raises(ValueError):
+        poisson(lam)
+    with backend.use_backend("array"):
+        with pytest.raises(ValueError):
+            poisson(lam)
+
+
+def test_binomial_rejects_non_integer_n():
+    with pytest.raises(TypeError):
+        binomial(10.5, 0.5)
+
+
+def test_discrete_uses_new_weights_and_alias_tables():
+    weights = [1, 0, 0]
+    assert discrete(weights, u=0.9) == 0
+    assert discrete([0, 0, 1], u=0.9) == 2
+    table = AliasTable([0, 0, 1])
+    assert discrete(table, u=0.9) == 2
+
+
+@pytest.mark.parametrize(
+    "function, params",
+    [
+        (weibull, {"lam": 1, "b": 2}),
+        (exponential, {"lam": 2}),
+        (triangular, {"minimum": 0, "mode": 1, "maximum": 3}),
+        (bernoulli, {"p": 0.3}),
+        (geometric, {"p": 0.3}),
+        (standard_normal_crude, {}),
+        (truncated_weibull, {"lam": 1, "b": 2, "lower": 0.5, "upper": 2}),
+        (truncated_exponential, {"lam": 1, "lower": 0.5, "upper": 2}),
+        (
+            truncated_triangular,
+            {"minimum": 0, "mode": 1, "maximum": 3, "lower": 0.5, "upper": 2},
+        ),
+        (truncated_normal, {"mu": 0, "sigma": 1, "lower": -1, "upper": 2}),
+    ],
+)
+@pytest.mark.parametrize("name", ["numpy", "array"])
+def test_out_gets_the_same_variates(function, params, name):
+    u = [(i + 0.5) / 100 for i in range(100)]
+    with backend.use_backend(name):
+        expected = function(**params, u=u, size=100)
+        out = function(**params, u=[0.5] * 100, size=100)
+        x = function(**params, u=u, size=100, out=out)
+        assert x is out
+        assert list(x) == list(expected)
@@ -0,0 +1,98 @@
+import random
+import threading
+import time
+
+from pydistribution import backend, distributions
+from pydistribution.benchmark import CASES
+from pydistribution.prng import (
+    LCG,
+    LCG64,
+    PrefetchingPRNG,
+    RecordingPRNG,
+    ReplayPRNG,
+)
+from pydistribution.variance_reduction import antithetic
+
+import pytest
+
+
+def slow_source():
+    time.sleep(0.002)
+    return 0.5
+
+
+def test_prefetching_close_while_waiting():
+    prng = PrefetchingPRNG(slow_source, block_size=200, blocks=1)
+    errors = []
+
+    def consume():
+        try:
+            while True:
+                prng()
+        except ValueError as error:
+            errors.append(error)
+
+    consumer = threading.Thread(target=consume, daemon=True)
+    consumer.start()
+    time.sleep(0.05)
+    closer = threading.Thread(target=prng.close, daemon=True)
+    closer.start()
+    closer.join(timeout=5)
+    assert not closer.is_alive()
+    consumer.join(timeout=5)
+    assert not consumer.is_alive()
+    assert len(errors) == 1
+    with pytest.raises(ValueError):
+        prng()
+
+
+def test_lcg_follows_backend_switch():
+    generator = LCG64(1)
+    with backend.use_backend("array"):
+        assert len(generator.block(3)) == 3
+
+
+def test_lcg_requires_parameters():
+    with pytest.raises(ValueError):
+        LCG(1)
+
+
+def test_lcg_jumps_back():
+    generator = LCG64(1)
+    state = generator.getstate()
+    values = [generator.next_int() for _ in range(5)]
+    generator.jump(-5)
+    assert generator.getstate() == state
+    generator.jump(2)
+    generator.jump(-1)
+    assert generator.next_int() == values[1]
+
+
+def test_lcg_refuses_to_jump_back_without_an_inverse():
+    generator = LCG(1, a=2, c=1, mod=16)
+    with pytest.raises(ValueError):
+        generator.jump(-1)
+
+
+@pytest.fixture(scope="module")
+def log(tmp_path_factory):
+    path = tmp_path_factory.mktemp("replay") / "prns.log"
+    with RecordingPRNG(random.Random(1).random, path) as recorder:
+        recorder.block(10**6)
+    return path
+
+
+@pytest.mark.parametrize(
+    "name, params",
+    [
+        (name, params)
+        for name, regimes in CASES.items()
+        for params in regimes.values()
+    ],
+)
+def test_replay_works_with_every_distribution(log, name, params):
+    function = getattr(distributions, name)
+    with ReplayPRNG(log) as replay:
+        assert len(function(**params, prng=replay, size=100)) == 100
+        x, y = antithetic(function, params, size=100, prng=replay)
+    assert len(x) == len(y) == 100
@@ -0,0 +1,29 @@
+from pydistribution.qmc import SOBOL_BITS, Halton, Sobol
+
+import pytest
+
+
+def test_sobol_block_reaches_the_last_point():
+    sobol = Sobol(1, skip=2**SOBOL_BITS - 5)
+    assert len(sobol.block(5)) == 5
+    with pytest.raises(ValueError):
+        sobol.block(1)
+
+
+def test_sobol_scalar_draws_reach_the_last_point():
+    sobol = Sobol(2, skip=2**SOBOL_BITS - 3)
+    values = [sobol() for _ in range(6)]
+    assert all(0 <= u < 1 for u in values)
+    with pytest.raises(ValueError):
+        sobol()
+
+
+@pytest.mark.parametrize("sequence", [Sobol, Halton])
+def test_jump_matches_stepping(sequence):
+    jumped = sequence(2)
+    stepped = sequence(2)
+    jumped.jump(7)
+    for _ in range(14):
+        stepped()
+    assert jumped() == stepped()
+    assert list(jumped.block(10)) == list(stepped.block(10))
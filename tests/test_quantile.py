@@ -0,0 +1,20 @@
+import math
+
+from pydistribution.quantile import quantile_table
+
+
+def test_positive_support_tail_is_refined():
+    table = quantile_table("gamma", {"shape": 0.3})
+    # the CDF is about x ** 0.3 / gamma(1.3) deep in the lower tail
+    for u in (2**-53, 1e-15, 1e-12):
+        expected = (u * math.gamma(1.3)) ** (1 / 0.3)
+        assert math.isclose(table.quantile(u), expected, rel_tol=1e-3)
+    assert table.max_error["cubic"] < 1e-6
+
+
+def test_truncated_upper_tail_is_refined():
+    table = quantile_table("truncated_exponential", {"lam": 1, "lower": 2})
+    assert len(set(table.x[-4:])) == 4
+    # memoryless: the quantile of 1 - 2 ** -53 is lower + 53 log(2)
+    assert math.isclose(table.x[-1], 2 + 53 * math.log(2), rel_tol=1e-12)
+    assert table.max_error["cubic"] < 1e-8
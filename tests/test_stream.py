@@ -0,0 +1,26 @@
+from pydistribution.distributions import Laplace, Weibull, weibull
+from pydistribution.prng import SplitMix64
+from pydistribution.stream import stream
+
+
+def test_stream_writes_every_chunk_into_one_array():
+    chunks = stream(weibull, {"lam": 1, "b": 2}, chunk=64, prng=SplitMix64(1))
+    first = next(chunks)
+    second = next(chunks)
+    assert second is not first
+    assert second.base is first
+    expected = Weibull(1, 2, prng=SplitMix64(1)).sample_n(128)
+    assert list(second) == list(expected[64:])
+
+
+def test_stream_shortens_the_last_chunk():
+    chunks = list(stream(Weibull(1, 2, prng=SplitMix64(1)), chunk=64, size=100))
+    assert [len(chunk) for chunk in chunks] == [64, 36]
+    assert chunks[1].base is chunks[0]
+
+
+def test_stream_allocates_chunks_without_out():
+    dist = Laplace(0, 1, prng=SplitMix64(1))
+    first, second = stream(dist, chunk=64, size=128)
+    assert second is not first
+    assert second.base is not first
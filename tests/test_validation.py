@@ -0,0 +1,31 @@
+import inspect
+
+from pydistribution import distributions
+from pydistribution.validation import REFERENCES, validate
+
+import pytest
+
+
+def test_every_distribution_function_has_a_reference():
+    functions = {
+        name
+        for name, value in vars(distributions).items()
+        if inspect.isfunction(value)
+        and value.__module__ == distributions.__name__
+        and not name.startswith("_")
+        and "prng" in inspect.signature(value).parameters
+        and not name.startswith("prn_")
+    }
+    assert "multivariate_normal" in functions
+    assert functions <= set(REFERENCES)
+
+
+def test_multivariate_normal_is_validated():
+    report = validate(
+        "multivariate_normal",
+        {"mean": [1, 2], "cov": [[2, 0.5], [0.5, 1]]},
+        size=20000,
+    )
+    assert report["reference_mean"] == 2
+    assert report["chi_square_p"] > 1e-4
+    assert report["mean_z"] == pytest.approx(0, abs=5)
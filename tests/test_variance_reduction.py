@@ -0,0 +1,22 @@
+import gc
+import weakref
+
+from pydistribution import variance_reduction
+from pydistribution.distributions import weibull
+from pydistribution.variance_reduction import antithetic
+
+
+def test_antithetic_does_not_keep_recorders_alive(monkeypatch):
+    recorders = []
+
+    class Recorder(variance_reduction._RecordingPRNG):
+        def __init__(self, prng):
+            super().__init__(prng)
+            recorders.append(weakref.ref(self))
+
+    monkeypatch.setattr(variance_reduction, "_RecordingPRNG", Recorder)
+    for _ in range(3):
+        antithetic(weibull, {"lam": 1, "b": 2}, size=10)
+    gc.collect()
+    assert len(recorders) == 3
+    assert all(recorder() is None for recorder in recorders)